@@ -0,0 +1,1472 @@
+"""
+Copy the model instances deeply.
+
+:py:func:`copy.deepcopy` works on the model instances as well, but it goes
+through the generic machinery of :py:mod:`copy`: it looks up how to reduce
+every object, and keeps a memo of all the copied objects, including the
+strings. :py:func:`deep_copy` calls the constructor of each class directly
+instead. The immutable values, such as strings, enumeration literals and bytes,
+are shared between the original and the copy, while the instances and
+the lists are copied.
+
+The model instances are expected to form a tree. If an instance is referenced
+more than once, *e.g.*, after the references have been shared with
+:py:class:`aas_core3.interning.Interner`, each occurrence is copied separately.
+Use :py:func:`copy.deepcopy` if you need to preserve the sharing.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.copying as aas_copying
+    import aas_core3.types as aas_types
+
+    submodel = aas_types.Submodel(
+        id="urn:some-submodel",
+        # ... some constructor arguments ...
+    )
+
+    another_submodel = aas_copying.deep_copy(submodel)
+    another_submodel.id = "urn:another-submodel"
+
+This module is generated by ``dev_scripts/generate_copying.py`` from
+the constructors in :py:mod:`aas_core3.types`. Re-run the script whenever
+:py:mod:`aas_core3.types` changes.
+"""
+
+
+# This code has been automatically generated by dev_scripts/generate_copying.py.
+# Do NOT edit or append.
+
+
+from typing import TypeVar, cast
+
+import aas_core3.types as aas_types
+
+
+class _DeepCopier(aas_types.AbstractTransformer[aas_types.Class]):
+    """Copy the instances deeply by calling their constructors."""
+
+    def transform_extension(self, that: aas_types.Extension) -> aas_types.Extension:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Extension(
+            that.name,
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            that.value_type,
+            that.value,
+            (
+                [self.transform_reference(item) for item in that.refers_to]
+                if that.refers_to is not None
+                else None
+            ),
+        )
+
+    def transform_administrative_information(
+        self, that: aas_types.AdministrativeInformation
+    ) -> aas_types.AdministrativeInformation:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.AdministrativeInformation(
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            that.version,
+            that.revision,
+            (
+                self.transform_reference(that.creator)
+                if that.creator is not None
+                else None
+            ),
+            that.template_id,
+        )
+
+    def transform_qualifier(self, that: aas_types.Qualifier) -> aas_types.Qualifier:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Qualifier(
+            that.type,
+            that.value_type,
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            that.kind,
+            that.value,
+            (
+                self.transform_reference(that.value_id)
+                if that.value_id is not None
+                else None
+            ),
+        )
+
+    def transform_asset_administration_shell(
+        self, that: aas_types.AssetAdministrationShell
+    ) -> aas_types.AssetAdministrationShell:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.AssetAdministrationShell(
+            that.id,
+            self.transform_asset_information(that.asset_information),
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_administrative_information(that.administration)
+                if that.administration is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.derived_from)
+                if that.derived_from is not None
+                else None
+            ),
+            (
+                [self.transform_reference(item) for item in that.submodels]
+                if that.submodels is not None
+                else None
+            ),
+        )
+
+    def transform_asset_information(
+        self, that: aas_types.AssetInformation
+    ) -> aas_types.AssetInformation:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.AssetInformation(
+            that.asset_kind,
+            that.global_asset_id,
+            (
+                [
+                    self.transform_specific_asset_id(item)
+                    for item in that.specific_asset_ids
+                ]
+                if that.specific_asset_ids is not None
+                else None
+            ),
+            that.asset_type,
+            (
+                self.transform_resource(that.default_thumbnail)
+                if that.default_thumbnail is not None
+                else None
+            ),
+        )
+
+    def transform_resource(self, that: aas_types.Resource) -> aas_types.Resource:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Resource(
+            that.path,
+            that.content_type,
+        )
+
+    def transform_specific_asset_id(
+        self, that: aas_types.SpecificAssetID
+    ) -> aas_types.SpecificAssetID:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.SpecificAssetID(
+            that.name,
+            that.value,
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.external_subject_id)
+                if that.external_subject_id is not None
+                else None
+            ),
+        )
+
+    def transform_submodel(self, that: aas_types.Submodel) -> aas_types.Submodel:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Submodel(
+            that.id,
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_administrative_information(that.administration)
+                if that.administration is not None
+                else None
+            ),
+            that.kind,
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            (
+                [
+                    cast(aas_types.SubmodelElement, self.transform(item))
+                    for item in that.submodel_elements
+                ]
+                if that.submodel_elements is not None
+                else None
+            ),
+        )
+
+    def transform_relationship_element(
+        self, that: aas_types.RelationshipElement
+    ) -> aas_types.RelationshipElement:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.RelationshipElement(
+            self.transform_reference(that.first),
+            self.transform_reference(that.second),
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+        )
+
+    def transform_submodel_element_list(
+        self, that: aas_types.SubmodelElementList
+    ) -> aas_types.SubmodelElementList:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.SubmodelElementList(
+            that.type_value_list_element,
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            that.order_relevant,
+            (
+                self.transform_reference(that.semantic_id_list_element)
+                if that.semantic_id_list_element is not None
+                else None
+            ),
+            that.value_type_list_element,
+            (
+                [
+                    cast(aas_types.SubmodelElement, self.transform(item))
+                    for item in that.value
+                ]
+                if that.value is not None
+                else None
+            ),
+        )
+
+    def transform_submodel_element_collection(
+        self, that: aas_types.SubmodelElementCollection
+    ) -> aas_types.SubmodelElementCollection:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.SubmodelElementCollection(
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            (
+                [
+                    cast(aas_types.SubmodelElement, self.transform(item))
+                    for item in that.value
+                ]
+                if that.value is not None
+                else None
+            ),
+        )
+
+    def transform_property(self, that: aas_types.Property) -> aas_types.Property:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Property(
+            that.value_type,
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            that.value,
+            (
+                self.transform_reference(that.value_id)
+                if that.value_id is not None
+                else None
+            ),
+        )
+
+    def transform_multi_language_property(
+        self, that: aas_types.MultiLanguageProperty
+    ) -> aas_types.MultiLanguageProperty:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.MultiLanguageProperty(
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            (
+                [self.transform_lang_string_text_type(item) for item in that.value]
+                if that.value is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.value_id)
+                if that.value_id is not None
+                else None
+            ),
+        )
+
+    def transform_range(self, that: aas_types.Range) -> aas_types.Range:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Range(
+            that.value_type,
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            that.min,
+            that.max,
+        )
+
+    def transform_reference_element(
+        self, that: aas_types.ReferenceElement
+    ) -> aas_types.ReferenceElement:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.ReferenceElement(
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            (self.transform_reference(that.value) if that.value is not None else None),
+        )
+
+    def transform_blob(self, that: aas_types.Blob) -> aas_types.Blob:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Blob(
+            that.content_type,
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            that.value,
+        )
+
+    def transform_file(self, that: aas_types.File) -> aas_types.File:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.File(
+            that.content_type,
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            that.value,
+        )
+
+    def transform_annotated_relationship_element(
+        self, that: aas_types.AnnotatedRelationshipElement
+    ) -> aas_types.AnnotatedRelationshipElement:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.AnnotatedRelationshipElement(
+            self.transform_reference(that.first),
+            self.transform_reference(that.second),
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            (
+                [
+                    cast(aas_types.DataElement, self.transform(item))
+                    for item in that.annotations
+                ]
+                if that.annotations is not None
+                else None
+            ),
+        )
+
+    def transform_entity(self, that: aas_types.Entity) -> aas_types.Entity:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Entity(
+            that.entity_type,
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            (
+                [
+                    cast(aas_types.SubmodelElement, self.transform(item))
+                    for item in that.statements
+                ]
+                if that.statements is not None
+                else None
+            ),
+            that.global_asset_id,
+            (
+                [
+                    self.transform_specific_asset_id(item)
+                    for item in that.specific_asset_ids
+                ]
+                if that.specific_asset_ids is not None
+                else None
+            ),
+        )
+
+    def transform_event_payload(
+        self, that: aas_types.EventPayload
+    ) -> aas_types.EventPayload:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.EventPayload(
+            self.transform_reference(that.source),
+            self.transform_reference(that.observable_reference),
+            that.time_stamp,
+            (
+                self.transform_reference(that.source_semantic_id)
+                if that.source_semantic_id is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.observable_semantic_id)
+                if that.observable_semantic_id is not None
+                else None
+            ),
+            that.topic,
+            (
+                self.transform_reference(that.subject_id)
+                if that.subject_id is not None
+                else None
+            ),
+            that.payload,
+        )
+
+    def transform_basic_event_element(
+        self, that: aas_types.BasicEventElement
+    ) -> aas_types.BasicEventElement:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.BasicEventElement(
+            self.transform_reference(that.observed),
+            that.direction,
+            that.state,
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            that.message_topic,
+            (
+                self.transform_reference(that.message_broker)
+                if that.message_broker is not None
+                else None
+            ),
+            that.last_update,
+            that.min_interval,
+            that.max_interval,
+        )
+
+    def transform_operation(self, that: aas_types.Operation) -> aas_types.Operation:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Operation(
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_operation_variable(item)
+                    for item in that.input_variables
+                ]
+                if that.input_variables is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_operation_variable(item)
+                    for item in that.output_variables
+                ]
+                if that.output_variables is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_operation_variable(item)
+                    for item in that.inoutput_variables
+                ]
+                if that.inoutput_variables is not None
+                else None
+            ),
+        )
+
+    def transform_operation_variable(
+        self, that: aas_types.OperationVariable
+    ) -> aas_types.OperationVariable:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.OperationVariable(
+            cast(aas_types.SubmodelElement, self.transform(that.value)),
+        )
+
+    def transform_capability(self, that: aas_types.Capability) -> aas_types.Capability:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Capability(
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_reference(that.semantic_id)
+                if that.semantic_id is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_reference(item)
+                    for item in that.supplemental_semantic_ids
+                ]
+                if that.supplemental_semantic_ids is not None
+                else None
+            ),
+            (
+                [self.transform_qualifier(item) for item in that.qualifiers]
+                if that.qualifiers is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+        )
+
+    def transform_concept_description(
+        self, that: aas_types.ConceptDescription
+    ) -> aas_types.ConceptDescription:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.ConceptDescription(
+            that.id,
+            (
+                [self.transform_extension(item) for item in that.extensions]
+                if that.extensions is not None
+                else None
+            ),
+            that.category,
+            that.id_short,
+            (
+                [
+                    self.transform_lang_string_name_type(item)
+                    for item in that.display_name
+                ]
+                if that.display_name is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_lang_string_text_type(item)
+                    for item in that.description
+                ]
+                if that.description is not None
+                else None
+            ),
+            (
+                self.transform_administrative_information(that.administration)
+                if that.administration is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_embedded_data_specification(item)
+                    for item in that.embedded_data_specifications
+                ]
+                if that.embedded_data_specifications is not None
+                else None
+            ),
+            (
+                [self.transform_reference(item) for item in that.is_case_of]
+                if that.is_case_of is not None
+                else None
+            ),
+        )
+
+    def transform_reference(self, that: aas_types.Reference) -> aas_types.Reference:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Reference(
+            that.type,
+            [self.transform_key(item) for item in that.keys],
+            (
+                self.transform_reference(that.referred_semantic_id)
+                if that.referred_semantic_id is not None
+                else None
+            ),
+        )
+
+    def transform_key(self, that: aas_types.Key) -> aas_types.Key:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Key(
+            that.type,
+            that.value,
+        )
+
+    def transform_lang_string_name_type(
+        self, that: aas_types.LangStringNameType
+    ) -> aas_types.LangStringNameType:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.LangStringNameType(
+            that.language,
+            that.text,
+        )
+
+    def transform_lang_string_text_type(
+        self, that: aas_types.LangStringTextType
+    ) -> aas_types.LangStringTextType:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.LangStringTextType(
+            that.language,
+            that.text,
+        )
+
+    def transform_environment(
+        self, that: aas_types.Environment
+    ) -> aas_types.Environment:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.Environment(
+            (
+                [
+                    self.transform_asset_administration_shell(item)
+                    for item in that.asset_administration_shells
+                ]
+                if that.asset_administration_shells is not None
+                else None
+            ),
+            (
+                [self.transform_submodel(item) for item in that.submodels]
+                if that.submodels is not None
+                else None
+            ),
+            (
+                [
+                    self.transform_concept_description(item)
+                    for item in that.concept_descriptions
+                ]
+                if that.concept_descriptions is not None
+                else None
+            ),
+        )
+
+    def transform_embedded_data_specification(
+        self, that: aas_types.EmbeddedDataSpecification
+    ) -> aas_types.EmbeddedDataSpecification:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.EmbeddedDataSpecification(
+            self.transform_reference(that.data_specification),
+            cast(
+                aas_types.DataSpecificationContent,
+                self.transform(that.data_specification_content),
+            ),
+        )
+
+    def transform_level_type(self, that: aas_types.LevelType) -> aas_types.LevelType:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.LevelType(
+            that.min,
+            that.nom,
+            that.typ,
+            that.max,
+        )
+
+    def transform_value_reference_pair(
+        self, that: aas_types.ValueReferencePair
+    ) -> aas_types.ValueReferencePair:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.ValueReferencePair(
+            that.value,
+            self.transform_reference(that.value_id),
+        )
+
+    def transform_value_list(self, that: aas_types.ValueList) -> aas_types.ValueList:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.ValueList(
+            [
+                self.transform_value_reference_pair(item)
+                for item in that.value_reference_pairs
+            ],
+        )
+
+    def transform_lang_string_preferred_name_type_iec_61360(
+        self, that: aas_types.LangStringPreferredNameTypeIEC61360
+    ) -> aas_types.LangStringPreferredNameTypeIEC61360:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.LangStringPreferredNameTypeIEC61360(
+            that.language,
+            that.text,
+        )
+
+    def transform_lang_string_short_name_type_iec_61360(
+        self, that: aas_types.LangStringShortNameTypeIEC61360
+    ) -> aas_types.LangStringShortNameTypeIEC61360:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.LangStringShortNameTypeIEC61360(
+            that.language,
+            that.text,
+        )
+
+    def transform_lang_string_definition_type_iec_61360(
+        self, that: aas_types.LangStringDefinitionTypeIEC61360
+    ) -> aas_types.LangStringDefinitionTypeIEC61360:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.LangStringDefinitionTypeIEC61360(
+            that.language,
+            that.text,
+        )
+
+    def transform_data_specification_iec_61360(
+        self, that: aas_types.DataSpecificationIEC61360
+    ) -> aas_types.DataSpecificationIEC61360:
+        """Copy :paramref:`that` deeply."""
+        return aas_types.DataSpecificationIEC61360(
+            [
+                self.transform_lang_string_preferred_name_type_iec_61360(item)
+                for item in that.preferred_name
+            ],
+            (
+                [
+                    self.transform_lang_string_short_name_type_iec_61360(item)
+                    for item in that.short_name
+                ]
+                if that.short_name is not None
+                else None
+            ),
+            that.unit,
+            (
+                self.transform_reference(that.unit_id)
+                if that.unit_id is not None
+                else None
+            ),
+            that.source_of_definition,
+            that.symbol,
+            that.data_type,
+            (
+                [
+                    self.transform_lang_string_definition_type_iec_61360(item)
+                    for item in that.definition
+                ]
+                if that.definition is not None
+                else None
+            ),
+            that.value_format,
+            (
+                self.transform_value_list(that.value_list)
+                if that.value_list is not None
+                else None
+            ),
+            that.value,
+            (
+                self.transform_level_type(that.level_type)
+                if that.level_type is not None
+                else None
+            ),
+        )
+
+
+_DEEP_COPIER = _DeepCopier()
+
+ClassT = TypeVar("ClassT", bound=aas_types.Class)
+
+
+def deep_copy(that: ClassT) -> ClassT:
+    """
+    Copy :paramref:`that` and all its descendants.
+
+    :param that: instance to be copied
+    :return: the copy, structurally equal to :paramref:`that`
+    """
+    return cast(ClassT, _DEEP_COPIER.transform(that))
+
+
+# This code has been automatically generated by dev_scripts/generate_copying.py.
+# Do NOT edit or append.
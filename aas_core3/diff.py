@@ -0,0 +1,558 @@
+"""
+Compare two versions of a model and report the changes between them.
+
+The identifiables are matched by their :py:attr:`aas_core3.types.Identifiable.id`.
+The submodel elements are matched by their
+:py:attr:`aas_core3.types.Referable.id_short`, except for the elements of
+a :py:class:`aas_core3.types.SubmodelElementList`, which are matched by their
+index. Each change is reported as an :py:class:`Addition`, a :py:class:`Removal`
+or a :py:class:`Modification`, addressed by the ID of the identifiable and
+the path of ID-shorts and indices to the changed instance, in the same manner as
+the keys of a model reference (see :py:mod:`aas_core3.resolution`).
+
+The matched instances are compared by their fingerprints first (see
+:py:class:`aas_core3.hashing.Fingerprinter`), so that the unchanged subtrees are
+skipped without descending into them. The fingerprint of every instance is
+computed only once, so the diff takes time linear in the size of the models.
+If you compare the same versions repeatedly, pass in your own fingerprinter so
+that the fingerprints are kept between the calls.
+
+If you diff only once and expect few changes, you can set
+``compare_structurally`` instead. The matched instances are then compared with
+:py:func:`aas_core3.hashing.structurally_equal`, which needs no digests, but
+walks a changed subtree again at every level of its ancestors.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.diff as aas_diff
+    import aas_core3.jsonization as aas_jsonization
+
+    old_environment = aas_jsonization.environment_from_jsonable(...)
+    new_environment = aas_jsonization.environment_from_jsonable(...)
+
+    for change in aas_diff.diff_environments(old_environment, new_environment):
+        if isinstance(change, aas_diff.Modification):
+            print(
+                f"Modified {change.property_names} "
+                f"in {change.identifiable_id!r} at {change.path}"
+            )
+        elif isinstance(change, aas_diff.Addition):
+            print(f"Added in {change.identifiable_id!r} at {change.path}")
+        elif isinstance(change, aas_diff.Removal):
+            print(f"Removed in {change.identifiable_id!r} at {change.path}")
+"""
+
+import collections
+import inspect
+import sys
+from typing import (
+    Deque,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+if sys.version_info >= (3, 8):
+    from typing import Final
+else:
+    from typing_extensions import Final
+
+import aas_core3.hashing as aas_hashing
+import aas_core3.types as aas_types
+
+#: Segment of a path, either an ID-short or an index in
+#: a :py:class:`aas_core3.types.SubmodelElementList`
+PathSegment = Union[str, int]
+
+
+class Change:
+    """Represent a change between two versions of a model."""
+
+    #: ID of the identifiable in which the change occurred
+    identifiable_id: Final[str]
+
+    #: Path of ID-shorts and indices from the identifiable to the changed
+    #: instance; empty if the identifiable itself changed
+    path: Final[Tuple[PathSegment, ...]]
+
+    def __init__(self, identifiable_id: str, path: Tuple[PathSegment, ...]) -> None:
+        """Initialize with the given values."""
+        self.identifiable_id = identifiable_id
+        self.path = path
+
+    def __repr__(self) -> str:
+        """Represent the change for debugging."""
+        return (
+            f"{self.__class__.__name__}("
+            f"identifiable_id={self.identifiable_id!r}, path={self.path!r})"
+        )
+
+
+class Addition(Change):
+    """Represent an instance which is only in the new version."""
+
+    #: Added instance
+    new: Final[aas_types.Class]
+
+    def __init__(
+        self,
+        identifiable_id: str,
+        path: Tuple[PathSegment, ...],
+        new: aas_types.Class,
+    ) -> None:
+        """Initialize with the given values."""
+        super().__init__(identifiable_id, path)
+        self.new = new
+
+
+class Removal(Change):
+    """Represent an instance which is only in the old version."""
+
+    #: Removed instance
+    old: Final[aas_types.Class]
+
+    def __init__(
+        self,
+        identifiable_id: str,
+        path: Tuple[PathSegment, ...],
+        old: aas_types.Class,
+    ) -> None:
+        """Initialize with the given values."""
+        super().__init__(identifiable_id, path)
+        self.old = old
+
+
+class Modification(Change):
+    """
+    Represent an instance whose own properties changed.
+
+    The changes of the matched submodel elements are reported separately, so
+    the properties holding them never appear in :py:attr:`property_names`.
+    """
+
+    #: Instance in the old version
+    old: Final[aas_types.Class]
+
+    #: Instance in the new version
+    new: Final[aas_types.Class]
+
+    #: Names of the properties which differ, in the order of the constructor
+    #: arguments
+    property_names: Final[Tuple[str, ...]]
+
+    def __init__(
+        self,
+        identifiable_id: str,
+        path: Tuple[PathSegment, ...],
+        old: aas_types.Class,
+        new: aas_types.Class,
+        property_names: Tuple[str, ...],
+    ) -> None:
+        """Initialize with the given values."""
+        super().__init__(identifiable_id, path)
+        self.old = old
+        self.new = new
+        self.property_names = property_names
+
+    def __repr__(self) -> str:
+        """Represent the change for debugging."""
+        return (
+            f"{self.__class__.__name__}("
+            f"identifiable_id={self.identifiable_id!r}, path={self.path!r}, "
+            f"property_names={self.property_names!r})"
+        )
+
+
+# Properties holding the submodel elements matched by their ID-shorts
+_ELEMENTS_BY_ID_SHORT: Final[Mapping[Type[aas_types.Class], Tuple[str, ...]]] = {
+    aas_types.Submodel: ("submodel_elements",),
+    aas_types.SubmodelElementCollection: ("value",),
+    aas_types.Entity: ("statements",),
+    aas_types.AnnotatedRelationshipElement: ("annotations",),
+}
+
+# Properties holding the operation variables, whose values are matched by
+# their ID-shorts
+_VARIABLES: Final[Mapping[Type[aas_types.Class], Tuple[str, ...]]] = {
+    aas_types.Operation: ("input_variables", "output_variables", "inoutput_variables"),
+}
+
+# Properties holding the submodel elements matched by their indices
+_ELEMENTS_BY_INDEX: Final[Mapping[Type[aas_types.Class], Tuple[str, ...]]] = {
+    aas_types.SubmodelElementList: ("value",),
+}
+
+
+def _own_properties(cls: Type[aas_types.Class]) -> Tuple[str, ...]:
+    """
+    List the properties of :paramref:`cls` compared directly.
+
+    :param cls: concrete model class
+    :return: names of the properties except for those holding matched elements
+    """
+    excluded = set(
+        _ELEMENTS_BY_ID_SHORT.get(cls, ())
+        + _VARIABLES.get(cls, ())
+        + _ELEMENTS_BY_INDEX.get(cls, ())
+    )
+
+    return tuple(
+        name
+        for name in list(inspect.signature(cls.__init__).parameters)[1:]
+        if name not in excluded
+    )
+
+
+_OWN_PROPERTIES: Final[Mapping[Type[aas_types.Class], Tuple[str, ...]]] = {
+    cls: _own_properties(cls)
+    for cls in vars(aas_types).values()
+    if inspect.isclass(cls)
+    and issubclass(cls, aas_types.Class)
+    and not inspect.isabstract(cls)
+}
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+InstanceT = TypeVar("InstanceT", bound=aas_types.Class)
+
+
+def _match(
+    olds: Iterable[Tuple[KeyT, InstanceT]],
+    news: Iterable[Tuple[KeyT, InstanceT]],
+) -> Iterator[Tuple[KeyT, Optional[InstanceT], Optional[InstanceT]]]:
+    """
+    Match the old and the new instances by their keys.
+
+    The instances sharing the same key, such as duplicate IDs, are matched in
+    the order of their occurrence. The matched and the added instances are given
+    in the order of :paramref:`news`, followed by the removed instances in
+    the order of :paramref:`olds`.
+
+    :param olds: keys and instances of the old version
+    :param news: keys and instances of the new version
+    :yield: key, old instance or ``None`` if added, new instance or ``None`` if
+        removed
+    """
+    old_by_key = dict()  # type: Dict[KeyT, Deque[InstanceT]]
+    for key, old in olds:
+        same = old_by_key.get(key, None)
+        if same is None:
+            old_by_key[key] = collections.deque([old])
+        else:
+            same.append(old)
+
+    for key, new in news:
+        same = old_by_key.get(key, None)
+        if same is None or len(same) == 0:
+            yield key, None, new
+        else:
+            yield key, same.popleft(), new
+
+    for key, remaining in old_by_key.items():
+        for old in remaining:
+            yield key, old, None
+
+
+def _keyed_by_id_short(
+    elements: Optional[Sequence[aas_types.SubmodelElement]],
+) -> Iterator[Tuple[PathSegment, aas_types.SubmodelElement]]:
+    """
+    Key the :paramref:`elements` by their ID-shorts.
+
+    The elements without an ID-short are keyed by their index instead.
+
+    :param elements: to be keyed
+    :yield: keys and elements
+    """
+    if elements is None:
+        return
+
+    for i, element in enumerate(elements):
+        yield (element.id_short if element.id_short is not None else i), element
+
+
+def _keyed_by_index(
+    elements: Optional[Sequence[aas_types.SubmodelElement]],
+) -> Iterator[Tuple[PathSegment, aas_types.SubmodelElement]]:
+    """
+    Key the :paramref:`elements` by their indices.
+
+    :param elements: to be keyed
+    :yield: keys and elements
+    """
+    if elements is None:
+        return
+
+    yield from enumerate(elements)
+
+
+def _variable_values(
+    variables: Optional[Sequence[aas_types.OperationVariable]],
+) -> Optional[List[aas_types.SubmodelElement]]:
+    """
+    Extract the values of the operation :paramref:`variables`.
+
+    :param variables: to be unwrapped
+    :return: the submodel elements held by the variables
+    """
+    if variables is None:
+        return None
+
+    return [variable.value for variable in variables]
+
+
+class _Differ:
+    """Compare the matched instances recursively."""
+
+    def __init__(
+        self,
+        fingerprinter: Optional[aas_hashing.Fingerprinter],
+        compare_structurally: bool,
+    ) -> None:
+        """
+        Initialize with the given values.
+
+        :param fingerprinter:
+            to fingerprint the instances; if not given, a new one is created
+            unless :paramref:`compare_structurally` is set
+        :param compare_structurally:
+            if set, compare the instances with
+            :py:func:`aas_core3.hashing.structurally_equal` instead of
+            fingerprinting them
+        :raise:
+            :py:class:`ValueError` if both :paramref:`fingerprinter` and
+            :paramref:`compare_structurally` are given
+        """
+        if compare_structurally:
+            if fingerprinter is not None:
+                raise ValueError(
+                    "Expected either a fingerprinter or compare_structurally, "
+                    "but got both"
+                )
+
+            self.fingerprinter = None  # type: Optional[aas_hashing.Fingerprinter]
+        else:
+            self.fingerprinter = (
+                fingerprinter
+                if fingerprinter is not None
+                else aas_hashing.Fingerprinter()
+            )
+
+    def _same(self, old: aas_types.Class, new: aas_types.Class) -> bool:
+        """Check whether :paramref:`old` and :paramref:`new` are equal."""
+        if self.fingerprinter is None:
+            return aas_hashing.structurally_equal(old, new)
+
+        fingerprint = self.fingerprinter.fingerprint
+        return fingerprint(old) == fingerprint(new)
+
+    def _differ(self, old_value: Any, new_value: Any) -> bool:
+        """Check whether the values of a property differ."""
+        if old_value is new_value:
+            return False
+
+        if old_value is None or new_value is None:
+            return True
+
+        if isinstance(old_value, aas_types.Class):
+            return not self._same(old_value, new_value)
+
+        if isinstance(old_value, list):
+            return len(old_value) != len(new_value) or any(
+                self._differ(old_item, new_item)
+                for old_item, new_item in zip(old_value, new_value)
+            )
+
+        return bool(old_value != new_value)
+
+    def diff(
+        self,
+        identifiable_id: str,
+        path: Tuple[PathSegment, ...],
+        old: aas_types.Class,
+        new: aas_types.Class,
+    ) -> Iterator[Change]:
+        """
+        Compare the matched :paramref:`old` and :paramref:`new` instance.
+
+        :param identifiable_id: ID of the identifiable containing the instances
+        :param path: from the identifiable to the instances
+        :param old: instance of the old version
+        :param new: instance of the new version
+        :yield: the changes
+        """
+        # We check the types first so that a change of the type is reported
+        # regardless of how the instances are compared.
+        if type(old) is not type(new):
+            yield Removal(identifiable_id, path, old)
+            yield Addition(identifiable_id, path, new)
+            return
+
+        if self._same(old, new):
+            return
+
+        cls = type(new)
+
+        property_names = tuple(
+            name
+            for name in _OWN_PROPERTIES[cls]
+            if self._differ(getattr(old, name), getattr(new, name))
+        )
+        if len(property_names) > 0:
+            yield Modification(identifiable_id, path, old, new, property_names)
+
+        for name in _ELEMENTS_BY_ID_SHORT.get(cls, ()):
+            yield from self._diff_elements(
+                identifiable_id,
+                path,
+                _keyed_by_id_short(getattr(old, name)),
+                _keyed_by_id_short(getattr(new, name)),
+            )
+
+        for name in _VARIABLES.get(cls, ()):
+            yield from self._diff_elements(
+                identifiable_id,
+                path,
+                _keyed_by_id_short(_variable_values(getattr(old, name))),
+                _keyed_by_id_short(_variable_values(getattr(new, name))),
+            )
+
+        for name in _ELEMENTS_BY_INDEX.get(cls, ()):
+            yield from self._diff_elements(
+                identifiable_id,
+                path,
+                _keyed_by_index(getattr(old, name)),
+                _keyed_by_index(getattr(new, name)),
+            )
+
+    def _diff_elements(
+        self,
+        identifiable_id: str,
+        path: Tuple[PathSegment, ...],
+        olds: Iterable[Tuple[PathSegment, aas_types.SubmodelElement]],
+        news: Iterable[Tuple[PathSegment, aas_types.SubmodelElement]],
+    ) -> Iterator[Change]:
+        """
+        Match the elements and compare them.
+
+        :param identifiable_id: ID of the identifiable containing the elements
+        :param path: from the identifiable to the container of the elements
+        :param olds: keyed elements of the old version
+        :param news: keyed elements of the new version
+        :yield: the changes
+        """
+        for key, old, new in _match(olds, news):
+            element_path = path + (key,)
+
+            if old is None:
+                assert new is not None
+                yield Addition(identifiable_id, element_path, new)
+            elif new is None:
+                yield Removal(identifiable_id, element_path, old)
+            else:
+                yield from self.diff(identifiable_id, element_path, old, new)
+
+
+def diff_identifiables(
+    old: aas_types.Identifiable,
+    new: aas_types.Identifiable,
+    fingerprinter: Optional[aas_hashing.Fingerprinter] = None,
+    compare_structurally: bool = False,
+) -> Iterator[Change]:
+    """
+    Compare the :paramref:`old` and the :paramref:`new` version of an identifiable.
+
+    The changes are addressed by the ID of :paramref:`new`.
+
+    :param old: version of the identifiable
+    :param new: version of the identifiable
+    :param fingerprinter:
+        to fingerprint the instances; if not given, a new one is used for
+        this call
+    :param compare_structurally:
+        if set, compare the instances with
+        :py:func:`aas_core3.hashing.structurally_equal` instead of fingerprinting
+        them
+    :yield: the changes
+    :raise:
+        :py:class:`ValueError` if both :paramref:`fingerprinter` and
+        :paramref:`compare_structurally` are given
+    """
+    differ = _Differ(fingerprinter, compare_structurally)
+
+    yield from differ.diff(new.id, (), old, new)
+
+
+def _keyed_by_id(
+    identifiables: Optional[Sequence[aas_types.Identifiable]],
+) -> Iterator[Tuple[str, aas_types.Identifiable]]:
+    """
+    Key the :paramref:`identifiables` by their IDs.
+
+    :param identifiables: to be keyed
+    :yield: IDs and identifiables
+    """
+    if identifiables is None:
+        return
+
+    for identifiable in identifiables:
+        yield identifiable.id, identifiable
+
+
+def diff_environments(
+    old: aas_types.Environment,
+    new: aas_types.Environment,
+    fingerprinter: Optional[aas_hashing.Fingerprinter] = None,
+    compare_structurally: bool = False,
+) -> Iterator[Change]:
+    """
+    Compare the :paramref:`old` and the :paramref:`new` version of an environment.
+
+    The asset administration shells are compared first, followed by
+    the submodels and the concept descriptions. The added and the removed
+    identifiables are reported with an empty path.
+
+    :param old: version of the environment
+    :param new: version of the environment
+    :param fingerprinter:
+        to fingerprint the instances; if not given, a new one is used for
+        this call
+    :param compare_structurally:
+        if set, compare the instances with
+        :py:func:`aas_core3.hashing.structurally_equal` instead of fingerprinting
+        them
+    :yield: the changes
+    :raise:
+        :py:class:`ValueError` if both :paramref:`fingerprinter` and
+        :paramref:`compare_structurally` are given
+    """
+    differ = _Differ(fingerprinter, compare_structurally)
+
+    for old_identifiables, new_identifiables in (
+        (old.asset_administration_shells, new.asset_administration_shells),
+        (old.submodels, new.submodels),
+        (old.concept_descriptions, new.concept_descriptions),
+    ):
+        for identifiable_id, old_identifiable, new_identifiable in _match(
+            _keyed_by_id(old_identifiables), _keyed_by_id(new_identifiables)
+        ):
+            if old_identifiable is None:
+                assert new_identifiable is not None
+                yield Addition(identifiable_id, (), new_identifiable)
+            elif new_identifiable is None:
+                yield Removal(identifiable_id, (), old_identifiable)
+            else:
+                yield from differ.diff(
+                    identifiable_id, (), old_identifiable, new_identifiable
+                )
@@ -0,0 +1,356 @@
+"""
+Verify the constraints which span the instances of an environment.
+
+:py:func:`aas_core3.verification.verify` checks only the constraints which can
+be decided by looking at an instance and its descendants.
+:py:func:`verify_environment` additionally checks that the identifiers are
+globally unique and that the model references can be resolved within
+the environment. :py:func:`verify_parallel` distributes the verification of
+a large environment over a pool of processes.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.environment_verification as aas_environment_verification
+    import aas_core3.types as aas_types
+
+    environment = aas_types.Environment(
+        submodels=[
+            aas_types.Submodel(id="urn:some-submodel")
+        ]
+    )
+
+    for error in aas_environment_verification.verify_environment(environment):
+        print(f"{error.path}: {error.cause}")
+"""
+
+import concurrent.futures
+import inspect
+import math
+import os
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import aas_core3.indexing as aas_indexing
+import aas_core3.resolution as aas_resolution
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+
+_PROPERTY_NAMES = dict()  # type: Dict[Type[aas_types.Class], Tuple[str, ...]]
+
+
+def _property_names(cls: Type[aas_types.Class]) -> Tuple[str, ...]:
+    """
+    Retrieve the names of the properties of the concrete class :paramref:`cls`.
+
+    The properties of the model classes coincide with the arguments of their
+    constructors, so we inspect the constructor once and cache the result.
+    """
+    names = _PROPERTY_NAMES.get(cls, None)
+    if names is None:
+        names = tuple(inspect.signature(cls.__init__).parameters)[1:]
+        _PROPERTY_NAMES[cls] = names
+
+    return names
+
+
+# An entry in the walk links to the entry of its parent together with
+# the segments leading from the parent to the instance. This way, we construct
+# a path only for the instances which are actually erroneous.
+_WalkEntry = Tuple[aas_types.Class, Optional[Any], Tuple[aas_verification.Segment, ...]]
+
+
+def _prepend_walk_path(path: aas_verification.Path, entry: _WalkEntry) -> None:
+    """Prepend the segments from the root of the walk to :paramref:`entry`."""
+    current = entry  # type: Optional[_WalkEntry]
+    while current is not None:
+        _, parent, segments = current
+        for segment in reversed(segments):
+            path._prepend(segment)
+
+        current = parent
+
+
+def _walk(that: aas_types.Class) -> Iterator[_WalkEntry]:
+    """
+    Iterate over :paramref:`that` and all its descendants in pre-order.
+
+    We do not use recursion so that deeply nested models can be walked.
+    """
+    stack = [(that, None, ())]  # type: List[_WalkEntry]
+
+    while len(stack) > 0:
+        entry = stack.pop()
+        yield entry
+
+        instance = entry[0]
+
+        children = []  # type: List[_WalkEntry]
+        for name in _property_names(type(instance)):
+            value = getattr(instance, name)
+
+            if isinstance(value, aas_types.Class):
+                children.append(
+                    (value, entry, (aas_verification.PropertySegment(instance, name),))
+                )
+            elif isinstance(value, list):
+                for i, item in enumerate(value):
+                    children.append(
+                        (
+                            item,
+                            entry,
+                            (
+                                aas_verification.PropertySegment(instance, name),
+                                aas_verification.IndexSegment(value, i),
+                            ),
+                        )
+                    )
+
+        stack.extend(reversed(children))
+
+
+def verify_environment(
+    environment: aas_types.Environment,
+    *,
+    check_references: bool = True,
+    check_unique_ids: bool = True,
+) -> Iterator[aas_verification.Error]:
+    """
+    Verify :paramref:`environment` including the constraints spanning instances.
+
+    First, we yield the errors from :py:func:`aas_core3.verification.verify`. Then we check that
+    the identifiers of the identifiables are globally unique, if
+    :paramref:`check_unique_ids` is set, and that all the model references
+    can be resolved within the :paramref:`environment`, if
+    :paramref:`check_references` is set. This includes the model references
+    in semantic IDs pointing to concept descriptions. External references are
+    not checked.
+
+    The identifiables and the containers of submodel elements are indexed
+    only once, so the whole check runs in time linear to the size of
+    the :paramref:`environment`.
+
+    :param environment: to be verified
+    :param check_references: if set, check that model references can be resolved
+    :param check_unique_ids: if set, check that identifiers are globally unique
+    :yield: constraint violations
+    """
+    yield from aas_verification.verify(environment)
+
+    if not check_references and not check_unique_ids:
+        return
+
+    index = aas_indexing.EnvironmentIndex(environment)
+
+    if check_unique_ids:
+        for property_name, identifiables in (
+            ("asset_administration_shells", environment.asset_administration_shells),
+            ("submodels", environment.submodels),
+            ("concept_descriptions", environment.concept_descriptions),
+        ):
+            if identifiables is None:
+                continue
+
+            for i, identifiable in enumerate(identifiables):
+                if index.find(identifiable.id) is not identifiable:
+                    error = aas_verification.Error(
+                        f"The identifier {identifiable.id!r} is not unique; "
+                        f"identifiables need to be globally unique."
+                    )
+                    error.path._prepend(
+                        aas_verification.PropertySegment(identifiable, "id")
+                    )
+                    error.path._prepend(aas_verification.IndexSegment(identifiables, i))
+                    error.path._prepend(
+                        aas_verification.PropertySegment(environment, property_name)
+                    )
+                    yield error
+
+    if check_references:
+        resolver = aas_resolution.Resolver(environment, index)
+
+        for entry in _walk(environment):
+            instance = entry[0]
+            if (
+                isinstance(instance, aas_types.Reference)
+                and instance.type == aas_types.ReferenceTypes.MODEL_REFERENCE
+            ):
+                try:
+                    resolver.resolve(instance)
+                except aas_resolution.ResolutionException as exception:
+                    error = aas_verification.Error(
+                        f"The model reference could not be resolved: {exception.cause}"
+                    )
+                    if exception.key_index is not None:
+                        error.path._prepend(
+                            aas_verification.IndexSegment(
+                                instance.keys, exception.key_index
+                            )
+                        )
+                        error.path._prepend(
+                            aas_verification.PropertySegment(instance, "keys")
+                        )
+
+                    _prepend_walk_path(error.path, entry)
+                    yield error
+
+
+# The errors are sent back from the worker processes without the instances,
+# since these would be mere copies of the original ones. We detach
+# a segment to the name of the property or to the index, respectively, and
+# re-attach the path to the original instances in the main process.
+_DetachedError = Tuple[str, Tuple[Union[str, int], ...]]
+
+
+def _detach(error: aas_verification.Error) -> _DetachedError:
+    """Strip the instances from the path of :paramref:`error` for pickling."""
+    return (
+        error.cause,
+        tuple(
+            segment.name
+            if isinstance(segment, aas_verification.PropertySegment)
+            else segment.index
+            for segment in error.path.segments
+        ),
+    )
+
+
+def _verify_shard(
+    shard: Sequence[aas_types.Class],
+) -> List[List[_DetachedError]]:
+    """Verify each instance of :paramref:`shard`, meant for a worker process."""
+    return [
+        [_detach(error) for error in aas_verification.verify(instance)]
+        for instance in shard
+    ]
+
+
+def _prepend_attached_path(
+    path: aas_verification.Path,
+    root: aas_types.Class,
+    detached: Tuple[Union[str, int], ...],
+) -> None:
+    """Prepend the :paramref:`detached` segments re-attached to :paramref:`root`."""
+    segments = []  # type: List[aas_verification.Segment]
+
+    current = root  # type: Any
+    for name_or_index in detached:
+        if isinstance(name_or_index, str):
+            segments.append(aas_verification.PropertySegment(current, name_or_index))
+            current = getattr(current, name_or_index)
+        else:
+            segments.append(aas_verification.IndexSegment(current, name_or_index))
+            current = current[name_or_index]
+
+    for segment in reversed(segments):
+        path._prepend(segment)
+
+
+def verify_parallel(
+    environment: aas_types.Environment,
+    workers: Optional[int] = None,
+    shard_size: Optional[int] = None,
+) -> Iterator[aas_verification.Error]:
+    """
+    Verify :paramref:`environment` with a pool of worker processes.
+
+    The asset administration shells, submodels and concept descriptions are
+    split into contiguous shards, and each shard is verified in a separate
+    process. The errors are yielded in the same order and with the same paths
+    as in :py:func:`aas_core3.verification.verify`. The paths refer to the instances of
+    the :paramref:`environment`, not to the copies in the worker processes.
+
+    The shards need to be pickled and sent to the workers. This pays off only
+    for large environments, where the verification dominates the transfer.
+
+    :param environment: to be verified
+    :param workers:
+        number of worker processes; if not given, the number of CPUs.
+        If set to 1, the environment is verified in this process.
+    :param shard_size:
+        number of identifiables in a shard; if not given, the identifiables are
+        split so that each worker gets a couple of shards for load balancing
+    :yield: constraint violations
+    :raise: :py:class:`ValueError` if :paramref:`workers` or
+        :paramref:`shard_size` is not positive
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError(f"Expected at least one worker, but got: {workers}")
+
+    if shard_size is not None and shard_size < 1:
+        raise ValueError(f"Expected a positive shard size, but got: {shard_size}")
+
+    if workers == 1:
+        yield from aas_verification.verify(environment)
+        return
+
+    # We verify the invariants of the environment itself without descending.
+    # A non-empty list satisfies them just as well as a missing one.
+    shallow = aas_types.Environment(
+        asset_administration_shells=(
+            [] if environment.asset_administration_shells == [] else None
+        ),
+        submodels=[] if environment.submodels == [] else None,
+        concept_descriptions=[] if environment.concept_descriptions == [] else None,
+    )
+    yield from aas_verification.verify(shallow)
+
+    tasks = []  # type: List[Tuple[str, Sequence[aas_types.Class], int, int]]
+    for property_name, identifiables in (
+        ("asset_administration_shells", environment.asset_administration_shells),
+        ("submodels", environment.submodels),
+        ("concept_descriptions", environment.concept_descriptions),
+    ):
+        if identifiables is None or len(identifiables) == 0:
+            continue
+
+        size = (
+            shard_size
+            if shard_size is not None
+            else max(1, math.ceil(len(identifiables) / (4 * workers)))
+        )
+
+        for start in range(0, len(identifiables), size):
+            tasks.append(
+                (
+                    property_name,
+                    identifiables,
+                    start,
+                    min(start + size, len(identifiables)),
+                )
+            )
+
+    if len(tasks) == 0:
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _verify_shard,
+            [sequence[start:end] for _, sequence, start, end in tasks],
+        )
+
+        for (property_name, sequence, start, _), shard_errors in zip(tasks, results):
+            for offset, detached_errors in enumerate(shard_errors):
+                i = start + offset
+                for cause, detached_path in detached_errors:
+                    error = aas_verification.Error(cause)
+                    _prepend_attached_path(error.path, sequence[i], detached_path)
+                    error.path._prepend(aas_verification.IndexSegment(sequence, i))
+                    error.path._prepend(
+                        aas_verification.PropertySegment(environment, property_name)
+                    )
+                    yield error
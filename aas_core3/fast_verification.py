@@ -0,0 +1,291 @@
+"""
+Verify the instances faster by memoizing the repeated checks and stopping early.
+
+:py:func:`verify` behaves like :py:func:`aas_core3.verification.verify`, but
+optionally stops after a given number of errors, and accepts the caches which
+memoize the checks of the values recurring throughout a model.
+:py:func:`is_valid` stops already at the first error.
+
+A :py:class:`ValueConsistencyCache` memoizes the checks of the values against
+their XSD types, such as ``"true"`` against ``xs:boolean``.
+A :py:class:`ValidStringCache` remembers the strings, such as language tags or
+ID-shorts, which have already been verified as valid.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.fast_verification as aas_fast_verification
+
+    for error in aas_fast_verification.verify(environment, max_errors=10):
+        print(f"{error.path}: {error.cause}")
+
+    if not aas_fast_verification.is_valid(environment):
+        print("The environment is invalid.")
+
+    cache = aas_fast_verification.ValueConsistencyCache()
+    for error in aas_fast_verification.verify(
+        environment, value_consistency_cache=cache
+    ):
+        print(f"{error.path}: {error.cause}")
+"""
+
+import functools
+import itertools
+import sys
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
+
+if sys.version_info >= (3, 8):
+    from typing import Final
+else:
+    from typing_extensions import Final
+
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+
+class ValueConsistencyCache:
+    """
+    Memoize :py:func:`aas_core3.verification.value_consistent_with_xsd_type`
+    in a bounded LRU cache.
+
+    Real-world data repeats the same few values over and over again (``"true"``,
+    ``"0"``, time stamps *etc.*), so matching them against the large regular
+    expressions every time is wasteful. Pass an instance of this class to
+    :py:func:`verify` to enable the cache for a verification run. You can re-use
+    the instance across runs, and inspect its hit and miss counters.
+    """
+
+    #: Maximum number of ``(value, value type)`` pairs held in the cache
+    max_size: Final[int]
+
+    #: Check the value consistency, memoized
+    value_consistent_with_xsd_type: Final[
+        Callable[[str, aas_types.DataTypeDefXSD], bool]
+    ]
+
+    def __init__(self, max_size: int = 65536) -> None:
+        """
+        Initialize as an empty cache.
+
+        :param max_size: maximum number of entries before the least recently
+            used ones are evicted
+        :raise: :py:class:`ValueError` if :paramref:`max_size` is not positive
+        """
+        if max_size < 1:
+            raise ValueError(
+                f"Expected a positive maximum size of the cache, but got: {max_size}"
+            )
+
+        self.max_size = max_size
+
+        self._cached = functools.lru_cache(maxsize=max_size)(
+            aas_verification.value_consistent_with_xsd_type
+        )
+        self.value_consistent_with_xsd_type = self._cached
+
+    @property
+    def hits(self) -> int:
+        """Number of look-ups answered from the cache"""
+        return self._cached.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        """Number of look-ups which had to be computed"""
+        return self._cached.cache_info().misses
+
+    def __len__(self) -> int:
+        """Return the number of entries currently held in the cache."""
+        return self._cached.cache_info().currsize
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the counters."""
+        self._cached.cache_clear()
+
+
+class ValidStringCache:
+    """
+    Remember the strings which have already been verified as valid.
+
+    The constrained primitive types such as language tags, content types or
+    ID-shorts recur in nearly every instance, and most of them are valid. Pass
+    an instance of this class to :py:func:`verify` so that a string known to be
+    valid for a given verifier (*e.g.*,
+    :py:func:`aas_core3.verification.verify_bcp_47_language_tag`) is not matched
+    against the regular expressions again. Invalid strings are never cached so
+    that the errors are reported as before.
+
+    Once a verifier has accumulated :py:attr:`max_size` valid strings, its
+    strings are forgotten and the cache is re-filled.
+    """
+
+    #: Maximum number of valid strings remembered per verifier
+    max_size: Final[int]
+
+    def __init__(self, max_size: int = 65536) -> None:
+        """
+        Initialize as an empty cache.
+
+        :param max_size: maximum number of valid strings per verifier
+        :raise: :py:class:`ValueError` if :paramref:`max_size` is not positive
+        """
+        if max_size < 1:
+            raise ValueError(
+                f"Expected a positive maximum size of the cache, but got: {max_size}"
+            )
+
+        self.max_size = max_size
+        self._valid = dict()  # type: Dict[aas_verification.StringVerifier, Set[str]]
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of strings known to be valid without a verification"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of strings which had to be verified"""
+        return self._misses
+
+    def __len__(self) -> int:
+        """Return the number of valid strings currently held in the cache."""
+        return sum(len(valid) for valid in self._valid.values())
+
+    def clear(self) -> None:
+        """Forget all the valid strings and reset the counters."""
+        self._valid.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def verify(
+        self, verifier: aas_verification.StringVerifier, that: str
+    ) -> Iterator[aas_verification.Error]:
+        """
+        Verify :paramref:`that` with :paramref:`verifier` unless known to be valid.
+
+        :param verifier: verification function of a constrained primitive type
+        :param that: string to be verified
+        :return: iterator over the constraint violations
+        """
+        valid = self._valid.get(verifier, None)
+        if valid is None:
+            valid = set()
+            self._valid[verifier] = valid
+        elif that in valid:
+            self._hits += 1
+            return iter(())
+
+        self._misses += 1
+
+        errors = list(verifier(that))
+        if len(errors) == 0:
+            if len(valid) >= self.max_size:
+                valid.clear()
+
+            valid.add(that)
+
+        return iter(errors)
+
+
+def _hooks(
+    value_consistency_cache: Optional[ValueConsistencyCache],
+    valid_string_cache: Optional[ValidStringCache],
+) -> Tuple[
+    Callable[[str, aas_types.DataTypeDefXSD], bool],
+    Callable[[aas_verification.StringVerifier, str], Iterator[aas_verification.Error]],
+]:
+    """Determine the checks of the transformer based on the given caches."""
+    return (
+        (
+            value_consistency_cache.value_consistent_with_xsd_type
+            if value_consistency_cache is not None
+            else aas_verification.value_consistent_with_xsd_type
+        ),
+        (
+            valid_string_cache.verify
+            if valid_string_cache is not None
+            else aas_verification._verify_directly
+        ),
+    )
+
+
+def verify(
+    that: aas_types.Class,
+    value_consistency_cache: Optional[ValueConsistencyCache] = None,
+    valid_string_cache: Optional[ValidStringCache] = None,
+    max_errors: Optional[int] = None,
+) -> Iterator[aas_verification.Error]:
+    """
+    Verify the constraints of :paramref:`that` recursively.
+
+    :param that: instance whose constraints we want to verify
+    :param value_consistency_cache:
+        if given, memoize the checks of values against their XSD types
+    :param valid_string_cache:
+        if given, skip the verification of strings already known to be valid
+    :param max_errors:
+        if given, stop the verification as soon as this many errors have been
+        reported
+    :yield: constraint violations
+    :raise: :py:class:`ValueError` if :paramref:`max_errors` is negative
+    """
+    if max_errors is not None and max_errors < 0:
+        raise ValueError(
+            f"Expected a non-negative maximum number of errors, but got: {max_errors}"
+        )
+
+    if value_consistency_cache is None and valid_string_cache is None:
+        transformer = aas_verification._TRANSFORMER
+    else:
+        value_consistency, verify_string = _hooks(
+            value_consistency_cache, valid_string_cache
+        )
+        transformer = aas_verification._Transformer(value_consistency, verify_string)
+
+    if max_errors is None:
+        yield from transformer.transform(that)
+    else:
+        # The errors are generated lazily, so we stop checking the moment
+        # the budget is exhausted.
+        yield from itertools.islice(transformer.transform(that), max_errors)
+
+
+def is_valid(
+    that: aas_types.Class,
+    value_consistency_cache: Optional[ValueConsistencyCache] = None,
+    valid_string_cache: Optional[ValidStringCache] = None,
+) -> bool:
+    """
+    Check whether :paramref:`that` satisfies all the constraints recursively.
+
+    We stop at the first violation, so at most one error and its path are
+    ever constructed.
+
+    :param that: instance whose constraints we want to check
+    :param value_consistency_cache:
+        if given, memoize the checks of values against their XSD types
+    :param valid_string_cache:
+        if given, skip the verification of strings already known to be valid
+    :return: ``True`` if there are no constraint violations
+    """
+    if value_consistency_cache is None and valid_string_cache is None:
+        transformer = aas_verification._TRANSFORMER
+    else:
+        value_consistency, verify_string = _hooks(
+            value_consistency_cache, valid_string_cache
+        )
+        transformer = aas_verification._Transformer(value_consistency, verify_string)
+
+    for _ in transformer.transform(that):
+        return False
+
+    return True
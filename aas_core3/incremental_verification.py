@@ -0,0 +1,244 @@
+"""
+Re-verify the instances incrementally after they have been edited in place.
+
+:py:func:`aas_core3.verification.verify` checks the whole model every time.
+:py:class:`IncrementalVerifier` caches the errors of every instance, so that
+only the edited instances and their ancestors need to be re-verified.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.incremental_verification as aas_incremental_verification
+
+    verifier = aas_incremental_verification.IncrementalVerifier()
+
+    # The first run verifies the whole environment.
+    errors = list(verifier.verify(environment))
+"""
+
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import aas_core3.fast_verification as aas_fast_verification
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+
+# We cache the errors of an instance with the paths relative to the instance.
+# The parents prepend the segments to the paths of the errors they receive, so
+# we need to hand out fresh errors on every retrieval.
+_RelativeErrors = Tuple[Tuple[str, Tuple[aas_verification.Segment, ...]], ...]
+
+
+def _errors_from(relative_errors: _RelativeErrors) -> Iterator[aas_verification.Error]:
+    """Create fresh errors out of the cached :paramref:`relative_errors`."""
+    for cause, segments in relative_errors:
+        error = aas_verification.Error(cause)
+        for segment in reversed(segments):
+            error.path._prepend(segment)
+
+        yield error
+
+
+class _IncrementalTransformer(aas_verification._Transformer):
+    """Verify instances and cache the errors per instance in the verifier."""
+
+    def __init__(
+        self,
+        verifier: "IncrementalVerifier",
+        value_consistency: Callable[[str, aas_types.DataTypeDefXSD], bool],
+        verify_string: Callable[
+            [aas_verification.StringVerifier, str], Iterator[aas_verification.Error]
+        ],
+    ) -> None:
+        """Initialize with the given values."""
+        super().__init__(value_consistency, verify_string)
+        self._verifier = verifier
+
+        # We collect the errors of an instance eagerly, so the instances being
+        # verified form a proper stack, and its top is the parent of
+        # the instance whose verification is requested.
+        self._stack = []  # type: List[aas_types.Class]
+
+    def transform(self, that: aas_types.Class) -> Iterator[aas_verification.Error]:
+        """Retrieve the cached errors of :paramref:`that`, or verify it."""
+        verifier = self._verifier
+
+        if len(self._stack) > 0:
+            verifier._link(parent=self._stack[-1], child=that)
+
+        cached = verifier._results.get(id(that), None)
+        if cached is not None:
+            return _errors_from(cached[1])
+
+        self._stack.append(that)
+        try:
+            relative_errors = tuple(
+                (error.cause, tuple(error.path.segments))
+                for error in super().transform(that)
+            )  # type: _RelativeErrors
+        finally:
+            self._stack.pop()
+
+        verifier._results[id(that)] = (that, relative_errors)
+        return _errors_from(relative_errors)
+
+
+class IncrementalVerifier:
+    """
+    Verify instances repeatedly, re-verifying only what has been edited.
+
+    The errors of every instance are cached together with the parent ⟷ child
+    relations observed during the verification. After you edit an instance in
+    place, inform the verifier with :py:meth:`mark_dirty`. The next call to
+    :py:meth:`verify` re-checks only the dirty instance and its ancestors, as
+    the invariants of the ancestors such as unique ID-shorts might depend on
+    the edited instance. All the other instances are served from the cache.
+
+    If you add or remove items of a list, mark the instance containing the list
+    as dirty. The newly added instances are verified on the next run. Inform
+    the verifier about the removed or replaced instances with :py:meth:`forget`,
+    so that their cached results are released.
+
+    Here is an example:
+
+    .. code-block::
+
+        verifier = aas_incremental_verification.IncrementalVerifier()
+
+        errors = list(verifier.verify(environment))
+
+        a_property.value = "1984"
+        verifier.mark_dirty(a_property)
+
+        # Only ``a_property`` and its ancestors are re-verified.
+        errors = list(verifier.verify(environment))
+    """
+
+    def __init__(
+        self,
+        value_consistency_cache: Optional[
+            aas_fast_verification.ValueConsistencyCache
+        ] = None,
+        valid_string_cache: Optional[aas_fast_verification.ValidStringCache] = None,
+    ) -> None:
+        """
+        Initialize with an empty cache.
+
+        :param value_consistency_cache:
+            if given, memoize the checks of values against their XSD types
+        :param valid_string_cache:
+            if given, skip the verification of strings already known to be valid
+        """
+        value_consistency, verify_string = aas_fast_verification._hooks(
+            value_consistency_cache, valid_string_cache
+        )
+        self._transformer = _IncrementalTransformer(
+            self, value_consistency, verify_string
+        )
+
+        # We key the caches on the object identity, and keep the instances in
+        # the values so that the identities can not be re-used by other objects.
+        self._results = (
+            dict()
+        )  # type: Dict[int, Tuple[aas_types.Class, _RelativeErrors]]
+        self._parents = dict()  # type: Dict[int, Dict[int, aas_types.Class]]
+
+    def _link(self, parent: aas_types.Class, child: aas_types.Class) -> None:
+        """Record that :paramref:`parent` refers to :paramref:`child`."""
+        parents = self._parents.get(id(child), None)
+        if parents is None:
+            self._parents[id(child)] = {id(parent): parent}
+        elif id(parent) not in parents:
+            parents[id(parent)] = parent
+
+    def verify(self, that: aas_types.Class) -> Iterator[aas_verification.Error]:
+        """
+        Verify :paramref:`that` recursively, re-using the cached results.
+
+        :param that: instance whose constraints we want to verify
+        :yield: constraint violations
+        """
+        yield from self._transformer.transform(that)
+
+    def mark_dirty(self, instance: aas_types.Class) -> None:
+        """
+        Invalidate the cached results of :paramref:`instance` and its ancestors.
+
+        :param instance: which has been edited in place
+        """
+        stack = [instance]
+        visited = set()  # type: Set[int]
+
+        while len(stack) > 0:
+            something = stack.pop()
+            if id(something) in visited:
+                continue
+
+            visited.add(id(something))
+            self._results.pop(id(something), None)
+
+            parents = self._parents.get(id(something), None)
+            if parents is not None:
+                stack.extend(parents.values())
+
+    def forget(
+        self, subtree: aas_types.Class, container: Optional[aas_types.Class] = None
+    ) -> None:
+        """
+        Drop the cached results and relations of a detached :paramref:`subtree`.
+
+        Call this method once you removed :paramref:`subtree` from the verified
+        model, or replaced it with another value, so that the verifier does not
+        keep it alive. The descendants are forgotten as well, unless they are
+        still referenced from outside of :paramref:`subtree`, as is the case with
+        the references shared by :py:class:`aas_core3.interning.Interner`.
+
+        The ancestors are not invalidated. Mark the former container as dirty
+        with :py:meth:`mark_dirty`.
+
+        :param subtree: which has been detached from the verified model
+        :param container:
+            from which :paramref:`subtree` has been detached; if given, only
+            the relation to it is dropped, so that a :paramref:`subtree` shared
+            with other containers is kept. Otherwise, all the relations to
+            the parents of :paramref:`subtree` are dropped.
+        """
+        parents = self._parents.get(id(subtree), None)
+        if parents is not None:
+            if container is None:
+                parents.clear()
+            else:
+                parents.pop(id(container), None)
+
+            if len(parents) > 0:
+                return
+
+        stack = [subtree]
+        while len(stack) > 0:
+            something = stack.pop()
+
+            self._results.pop(id(something), None)
+            self._parents.pop(id(something), None)
+
+            for child in something.descend_once():
+                child_parents = self._parents.get(id(child), None)
+                if child_parents is None:
+                    continue
+
+                child_parents.pop(id(something), None)
+                if len(child_parents) == 0:
+                    stack.append(child)
+
+    def clear(self) -> None:
+        """Forget all the cached results and relations."""
+        self._results.clear()
+        self._parents.clear()
@@ -0,0 +1,229 @@
+"""
+Index the identifiables of an environment by their identifiers.
+
+The look-ups in :py:class:`aas_core3.types.Environment` are linear as the
+identifiables are kept in lists. If you need to look up many identifiables by
+:py:attr:`aas_core3.types.Identifiable.id`, build an
+:py:class:`EnvironmentIndex` once and query it in constant time.
+
+The index is not kept in sync with the environment automatically. If you add
+or remove identifiables after the index has been built, you need to inform the
+index with :py:meth:`EnvironmentIndex.add` and
+:py:meth:`EnvironmentIndex.remove`, respectively.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.indexing as aas_indexing
+    import aas_core3.types as aas_types
+
+    environment = aas_types.Environment(
+        submodels=[
+            aas_types.Submodel(id="urn:some-submodel")
+        ]
+    )
+
+    index = aas_indexing.EnvironmentIndex(environment)
+
+    for duplicate in index.duplicates():
+        print(f"The identifier {duplicate.id!r} is not unique")
+
+    submodel = index.find_submodel("urn:some-submodel")
+"""
+
+import sys
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+if sys.version_info >= (3, 8):
+    from typing import Final
+else:
+    from typing_extensions import Final
+
+import aas_core3.types as aas_types
+
+# pylint: disable=redefined-builtin
+
+
+class Duplicate:
+    """Represent an identifier shared by more than one identifiable."""
+
+    #: Identifier which is not unique
+    id: Final[str]
+
+    #: Identifiables sharing the identifier, in the order they have been indexed
+    identifiables: Final[Sequence[aas_types.Identifiable]]
+
+    def __init__(
+        self, id: str, identifiables: Sequence[aas_types.Identifiable]
+    ) -> None:
+        """Initialize with the given values."""
+        self.id = id
+        self.identifiables = identifiables
+
+    def __repr__(self) -> str:
+        return f"Duplicate(id={self.id!r}, count={len(self.identifiables)})"
+
+
+IdentifiableT = TypeVar("IdentifiableT", bound=aas_types.Identifiable)
+
+
+class EnvironmentIndex:
+    """
+    Map identifiers to the identifiables of an environment.
+
+    The identifiers are expected to be globally unique, so a single map spans
+    asset administration shells, submodels and concept descriptions. If an
+    identifier is shared, the look-ups return the identifiable indexed first,
+    and the identifier is reported in :py:meth:`duplicates`.
+    """
+
+    def __init__(self, environment: Optional[aas_types.Environment] = None) -> None:
+        """
+        Index the identifiables of :paramref:`environment` in one pass.
+
+        :param environment:
+            to be indexed; if not given, start with an empty index
+        """
+        # We keep a list per identifier so that removing one of the duplicates
+        # exposes the next one. In a valid environment, the lists are singletons.
+        self._by_id = dict()  # type: Dict[str, List[aas_types.Identifiable]]
+
+        # We use a dictionary as an insertion-ordered set so that the duplicates
+        # are reported deterministically.
+        self._duplicate_ids = dict()  # type: Dict[str, None]
+
+        if environment is not None:
+            for identifiable in environment.descend_once():
+                assert isinstance(identifiable, aas_types.Identifiable)
+                self.add(identifiable)
+
+    def add(self, identifiable: aas_types.Identifiable) -> bool:
+        """
+        Index the :paramref:`identifiable`.
+
+        :param identifiable: to be indexed
+        :return:
+            ``True`` if the identifier has not been indexed before,
+            ``False`` if it is a duplicate
+        """
+        identifiables = self._by_id.get(identifiable.id, None)
+        if identifiables is None:
+            self._by_id[identifiable.id] = [identifiable]
+            return True
+
+        identifiables.append(identifiable)
+        self._duplicate_ids[identifiable.id] = None
+        return False
+
+    def remove(self, identifiable: aas_types.Identifiable) -> None:
+        """
+        Remove the :paramref:`identifiable` from the index.
+
+        The instance is matched by identity, not by equality. Its
+        :py:attr:`aas_core3.types.Identifiable.id` must not have changed since
+        it has been indexed.
+
+        :param identifiable: to be removed
+        :raise: :py:class:`KeyError` if :paramref:`identifiable` is not indexed
+        """
+        identifiables = self._by_id.get(identifiable.id, None)
+        if identifiables is not None:
+            for i, another_identifiable in enumerate(identifiables):
+                if another_identifiable is identifiable:
+                    del identifiables[i]
+
+                    if len(identifiables) == 0:
+                        del self._by_id[identifiable.id]
+
+                    if len(identifiables) <= 1:
+                        self._duplicate_ids.pop(identifiable.id, None)
+
+                    return
+
+        raise KeyError(
+            f"The identifiable with the ID {identifiable.id!r} has not been indexed"
+        )
+
+    def __len__(self) -> int:
+        """Return the number of distinct identifiers in the index."""
+        return len(self._by_id)
+
+    def __contains__(self, id: object) -> bool:
+        """Check whether the identifier :paramref:`id` is indexed."""
+        return id in self._by_id
+
+    def find(self, id: str) -> Optional[aas_types.Identifiable]:
+        """
+        Find the identifiable by its identifier.
+
+        :param id: identifier of the identifiable
+        :return: the identifiable indexed first under :paramref:`id`, if any
+        """
+        identifiables = self._by_id.get(id, None)
+        if identifiables is None:
+            return None
+
+        return identifiables[0]
+
+    def _find_of_type(
+        self, id: str, expected_type: Type[IdentifiableT]
+    ) -> Optional[IdentifiableT]:
+        """Find the first identifiable of :paramref:`expected_type` under :paramref:`id`."""
+        identifiables = self._by_id.get(id, None)
+        if identifiables is None:
+            return None
+
+        for identifiable in identifiables:
+            if isinstance(identifiable, expected_type):
+                return identifiable
+
+        return None
+
+    def find_asset_administration_shell(
+        self, id: str
+    ) -> Optional[aas_types.AssetAdministrationShell]:
+        """
+        Find the asset administration shell by its identifier.
+
+        :param id: identifier of the asset administration shell
+        :return: the asset administration shell, if any
+        """
+        return self._find_of_type(id, aas_types.AssetAdministrationShell)
+
+    def find_submodel(self, id: str) -> Optional[aas_types.Submodel]:
+        """
+        Find the submodel by its identifier.
+
+        :param id: identifier of the submodel
+        :return: the submodel, if any
+        """
+        return self._find_of_type(id, aas_types.Submodel)
+
+    def find_concept_description(
+        self, id: str
+    ) -> Optional[aas_types.ConceptDescription]:
+        """
+        Find the concept description by its identifier.
+
+        :param id: identifier of the concept description
+        :return: the concept description, if any
+        """
+        return self._find_of_type(id, aas_types.ConceptDescription)
+
+    def duplicates(self) -> Iterator[Duplicate]:
+        """
+        Iterate over the identifiers shared by more than one identifiable.
+
+        :yield: the duplicates in the order they have been first encountered
+        """
+        for id in self._duplicate_ids:
+            yield Duplicate(id=id, identifiables=list(self._by_id[id]))
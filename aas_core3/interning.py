@@ -0,0 +1,410 @@
+"""
+Share structurally equal references and repeated strings among the instances.
+
+The same semantic IDs, such as ECLASS IRDIs or IRIs of the submodel templates,
+usually recur throughout an environment. The de-serialization creates
+a separate :py:class:`aas_core3.types.Reference` with its own
+:py:class:`aas_core3.types.Key`'s for each occurrence. An :py:class:`Interner`
+replaces the structurally equal references and keys with a single shared
+instance, so that the memory is spent only once for each distinct reference.
+
+The references are considered structurally equal if they have the same
+:py:attr:`aas_core3.types.Reference.type`, the same sequence of
+:py:attr:`aas_core3.types.Key.type` and :py:attr:`aas_core3.types.Key.value`
+pairs, and structurally equal
+:py:attr:`aas_core3.types.Reference.referred_semantic_id`'s. Two references
+interned with the same interner are therefore structurally equal if and only if
+they are identical, so you can compare them with ``is``.
+
+The shared instances must be treated as immutable. If you change a shared
+reference or key, the change shows up at all its occurrences, and the interner
+will keep on handing out the changed instance for the original structure.
+Copy a reference with :py:func:`copy.deepcopy` before you modify it.
+
+Similarly, a :py:class:`StringInterner` shares the equal strings of the selected
+properties such as :py:attr:`aas_core3.types.Referable.id_short` or
+:py:attr:`aas_core3.types.AbstractLangString.language`. The strings are immutable
+anyhow, so the sharing is safe.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.interning as aas_interning
+    import aas_core3.json_streaming as aas_json_streaming
+
+    interner = aas_interning.Interner()
+    string_interner = aas_interning.StringInterner()
+
+    with open("some-huge-environment.json", "rb") as fid:
+        for identifiable in aas_json_streaming.iter_identifiables_from_stream(
+            fid, interner=interner, string_interner=string_interner
+        ):
+            # Do something with the ``identifiable``
+            ...
+
+    print(f"Shared {interner.hits} references and keys among {len(interner)}")
+
+Only :py:func:`aas_core3.json_streaming.iter_identifiables_from_stream` and
+:py:func:`aas_core3.xml_streaming.iter_identifiables_from_stream` accept
+an ``interner`` and a ``string_interner``. The other de-serialization functions,
+such as :py:func:`aas_core3.jsonization.environment_from_jsonable`,
+:py:func:`aas_core3.jsonization.reference_from_jsonable` or
+:py:func:`aas_core3.xmlization.environment_from_stream`, do not. Call
+:py:meth:`Interner.intern` and :py:meth:`StringInterner.intern` on their result
+instead, which share the references and the strings in a separate pass after
+the whole input has been de-serialized.
+"""
+
+import inspect
+import sys
+import typing
+from typing import (
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+if sys.version_info >= (3, 8):
+    from typing import Final
+else:
+    from typing_extensions import Final
+
+import aas_core3.types as aas_types
+
+
+def _reference_signature(reference: aas_types.Reference) -> Hashable:
+    """
+    Compute the value under which the :paramref:`reference` is interned.
+
+    :param reference: to be interned
+    :return: the key in the intern table
+    """
+    return (
+        reference.type,
+        tuple((key.type, key.value) for key in reference.keys),
+        (
+            _reference_signature(reference.referred_semantic_id)
+            if reference.referred_semantic_id is not None
+            else None
+        ),
+    )
+
+
+def _reference_properties(
+    cls: Type[aas_types.Class],
+) -> Tuple[Tuple[str, bool], ...]:
+    """
+    List the properties of :paramref:`cls` which hold references.
+
+    :param cls: concrete model class
+    :return: names of the properties, and whether they hold a list of references
+    """
+    result = []  # type: List[Tuple[str, bool]]
+
+    for name, hint in typing.get_type_hints(cls).items():
+        if typing.get_origin(hint) is typing.Union:
+            hint = next(arg for arg in typing.get_args(hint) if arg is not type(None))
+
+        if hint is aas_types.Reference:
+            result.append((name, False))
+        elif (
+            typing.get_origin(hint) is list
+            and typing.get_args(hint)[0] is aas_types.Reference
+        ):
+            result.append((name, True))
+
+    return tuple(result)
+
+
+# We compute the table once on import instead of inspecting the type annotations
+# for every instance.
+_REFERENCE_PROPERTIES: Final[
+    Mapping[Type[aas_types.Class], Tuple[Tuple[str, bool], ...]]
+] = {
+    cls: _reference_properties(cls)
+    for cls in vars(aas_types).values()
+    if inspect.isclass(cls)
+    and issubclass(cls, aas_types.Class)
+    and not inspect.isabstract(cls)
+}
+
+
+def _string_properties(cls: Type[aas_types.Class]) -> Tuple[str, ...]:
+    """
+    List the properties of :paramref:`cls` which hold strings.
+
+    :param cls: concrete model class
+    :return: names of the properties
+    """
+    return tuple(
+        name
+        for name, hint in typing.get_type_hints(cls).items()
+        if hint is str or hint == Optional[str]
+    )
+
+
+_STRING_PROPERTIES: Final[Mapping[Type[aas_types.Class], Tuple[str, ...]]] = {
+    cls: _string_properties(cls) for cls in _REFERENCE_PROPERTIES
+}
+
+#: Names of the properties whose strings are shared by default, as their values
+#: usually come from a small vocabulary
+DEFAULT_STRING_PROPERTIES: Final[FrozenSet[str]] = frozenset(
+    [
+        "category",
+        "content_type",
+        "id_short",
+        "language",
+        "name",
+        "revision",
+        "type",
+        "unit",
+        "version",
+    ]
+)
+
+T = TypeVar("T", bound=aas_types.Class)
+
+
+class Interner:
+    """
+    Map structurally equal references and keys to shared instances.
+
+    The first occurrence of a structure becomes the shared instance. The interner
+    keeps the shared instances alive as long as it lives itself; call
+    :py:meth:`clear` or discard the interner once you are done with
+    the de-serialization.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with empty tables."""
+        self._keys = dict()  # type: Dict[Tuple[aas_types.KeyTypes, str], aas_types.Key]
+        self._references = dict()  # type: Dict[Hashable, aas_types.Reference]
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of look-ups which returned a shared instance"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of look-ups which added a new shared instance"""
+        return self._misses
+
+    def key(self, key: aas_types.Key) -> aas_types.Key:
+        """
+        Retrieve the shared key structurally equal to :paramref:`key`.
+
+        :param key: to be interned
+        :return: the shared key, which is :paramref:`key` on the first occurrence
+        """
+        signature = (key.type, key.value)
+        shared = self._keys.get(signature, None)
+        if shared is not None:
+            self._hits += 1
+            return shared
+
+        self._misses += 1
+        self._keys[signature] = key
+        return key
+
+    def reference(self, reference: aas_types.Reference) -> aas_types.Reference:
+        """
+        Retrieve the shared reference structurally equal to :paramref:`reference`.
+
+        On the first occurrence, the keys and the referred semantic ID of
+        :paramref:`reference` are replaced in-place with their shared instances.
+
+        :param reference: to be interned
+        :return:
+            the shared reference, which is :paramref:`reference` on the first
+            occurrence
+        """
+        signature = _reference_signature(reference)
+        shared = self._references.get(signature, None)
+        if shared is not None:
+            self._hits += 1
+            return shared
+
+        self._misses += 1
+        reference.keys = [self.key(key) for key in reference.keys]
+        if reference.referred_semantic_id is not None:
+            reference.referred_semantic_id = self.reference(
+                reference.referred_semantic_id
+            )
+
+        self._references[signature] = reference
+        return reference
+
+    def intern(self, instance: T) -> T:
+        """
+        Replace in-place all the references within :paramref:`instance` with
+        the shared ones.
+
+        The references themselves are not descended into further, as they are
+        interned as a whole.
+
+        :param instance: to be interned
+        :return:
+            the shared reference if :paramref:`instance` is a reference,
+            :paramref:`instance` otherwise
+        """
+        if isinstance(instance, aas_types.Reference):
+            # We know that ``T`` is a reference here, but mypy can not narrow
+            # the type variable.
+            return self.reference(instance)  # type: ignore
+
+        # We iterate over an explicit stack instead of recursing so that deep
+        # models do not hit the recursion limit.
+        stack = [instance]  # type: List[aas_types.Class]
+        while len(stack) > 0:
+            something = stack.pop()
+
+            for name, is_list in _REFERENCE_PROPERTIES[type(something)]:
+                value = getattr(something, name)
+                if value is None:
+                    continue
+
+                if is_list:
+                    setattr(something, name, [self.reference(item) for item in value])
+                else:
+                    setattr(something, name, self.reference(value))
+
+            stack.extend(
+                child
+                for child in something.descend_once()
+                if not isinstance(child, aas_types.Reference)
+            )
+
+        return instance
+
+    def clear(self) -> None:
+        """Forget all the shared instances and reset the counters."""
+        self._keys.clear()
+        self._references.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of shared references and keys."""
+        return len(self._keys) + len(self._references)
+
+
+class StringInterner:
+    """
+    Map equal strings of the selected properties to a shared string.
+
+    Names, language codes, content types and qualifier types recur throughout
+    an environment, but the de-serialization creates a new string for each
+    occurrence. Sharing them saves memory, and the comparisons of the shared
+    strings short-circuit on identity.
+
+    Unlike :py:func:`sys.intern`, the strings are kept in a local table, which
+    is freed together with the interner. Once the table holds :py:attr:`max_size`
+    strings, it is cleared and re-filled so that the memory of the table stays
+    bounded even if the selected properties take arbitrary values.
+    """
+
+    #: Names of the properties whose strings are interned
+    properties: Final[FrozenSet[str]]
+
+    #: Maximum number of strings held in the table
+    max_size: Final[int]
+
+    def __init__(
+        self,
+        properties: Iterable[str] = DEFAULT_STRING_PROPERTIES,
+        max_size: int = 65536,
+    ) -> None:
+        """
+        Initialize with an empty table.
+
+        :param properties:
+            names of the properties whose strings are interned in all the classes,
+            see :py:data:`DEFAULT_STRING_PROPERTIES`
+        :param max_size: maximum number of strings held in the table
+        :raise: :py:class:`ValueError` if :paramref:`max_size` is not positive
+        """
+        if max_size < 1:
+            raise ValueError(
+                f"Expected a positive maximum size of the table, but got: {max_size}"
+            )
+
+        self.properties = frozenset(properties)
+        self.max_size = max_size
+
+        self._properties_of = {
+            cls: tuple(name for name in names if name in self.properties)
+            for cls, names in _STRING_PROPERTIES.items()
+        }  # type: Mapping[Type[aas_types.Class], Tuple[str, ...]]
+
+        self._strings = dict()  # type: Dict[str, str]
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of look-ups which returned a shared string"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of look-ups which added a new shared string"""
+        return self._misses
+
+    def string(self, value: str) -> str:
+        """
+        Retrieve the shared string equal to :paramref:`value`.
+
+        :param value: to be interned
+        :return: the shared string, which is :paramref:`value` on the first occurrence
+        """
+        shared = self._strings.get(value, None)
+        if shared is not None:
+            self._hits += 1
+            return shared
+
+        self._misses += 1
+        if len(self._strings) >= self.max_size:
+            self._strings.clear()
+
+        self._strings[value] = value
+        return value
+
+    def intern(self, instance: aas_types.Class) -> None:
+        """
+        Replace in-place the strings of the selected properties within
+        :paramref:`instance` with the shared ones.
+
+        :param instance: to be interned
+        """
+        stack = [instance]  # type: List[aas_types.Class]
+        while len(stack) > 0:
+            something = stack.pop()
+
+            for name in self._properties_of[type(something)]:
+                value = getattr(something, name)
+                if value is not None:
+                    setattr(something, name, self.string(value))
+
+            stack.extend(something.descend_once())
+
+    def clear(self) -> None:
+        """Forget all the shared strings and reset the counters."""
+        self._strings.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of strings currently held in the table."""
+        return len(self._strings)
@@ -0,0 +1,601 @@
+"""
+Read and write environments as JSON incrementally.
+
+:py:mod:`aas_core3.jsonization` converts between the instances and
+the JSON-able structures as a whole. For large environments, the JSON-able
+structure of the whole document might not fit in memory. The functions of this
+module process the document one identifiable at a time instead.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.json_streaming as aas_json_streaming
+
+    with open("some-huge-environment.json", "rb") as fid:
+        for identifiable in aas_json_streaming.iter_identifiables_from_stream(fid):
+            print(identifiable.id)
+"""
+
+import codecs
+import io
+import json
+import re
+from types import TracebackType
+from typing import (
+    cast,
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Type,
+    Union,
+)
+
+import aas_core3.interning as aas_interning
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _Tokenizer:
+    """
+    Read the tokens of a JSON document incrementally from a stream.
+
+    Only the structural tokens of the outer levels are read one by one. The nested
+    values are decoded as a whole with :py:meth:`read_value`, so that the memory
+    is bounded by the largest value rather than by the whole document.
+    """
+
+    def __init__(self, stream: Union[TextIO, BinaryIO], chunk_size: int) -> None:
+        """Initialize to read :paramref:`stream` in chunks of :paramref:`chunk_size`."""
+        self._stream = stream
+        self._chunk_size = chunk_size
+
+        self._decoder = None  # type: Optional[codecs.IncrementalDecoder]
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _read_more(self) -> bool:
+        """
+        Append the next chunk to the buffer and drop the consumed text.
+
+        We read at least as much as is still pending in the buffer, so that
+        the repeated attempts to decode a large value take amortized linear time.
+
+        :return: ``False`` if the stream has been exhausted
+        """
+        if self._eof:
+            return False
+
+        pending = len(self._buffer) - self._position
+        chunk = self._stream.read(max(self._chunk_size, pending))
+
+        if isinstance(chunk, bytes):
+            if self._decoder is None:
+                # The encoding is detected from the first four bytes, including
+                # the byte order marks, so we make sure we have all of them even
+                # if the chunks are tiny.
+                while 0 < len(chunk) < 4:
+                    more = self._stream.read(4 - len(chunk))
+                    assert isinstance(more, bytes)
+                    if len(more) == 0:
+                        break
+
+                    chunk += more
+
+                self._decoder = codecs.getincrementaldecoder(
+                    json.detect_encoding(chunk)
+                )()
+
+            text = self._decoder.decode(chunk, final=len(chunk) == 0)
+        else:
+            text = chunk
+
+        if len(chunk) == 0:
+            self._eof = True
+
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+
+        return not self._eof or len(text) > 0
+
+    def peek(self) -> str:
+        """
+        Skip the whitespace and peek at the next character.
+
+        :return: the next character, or an empty string at the end of the stream
+        """
+        while True:
+            match = _WHITESPACE_RE.match(self._buffer, self._position)
+            assert match is not None
+            self._position = match.end()
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+
+            if not self._read_more():
+                return ""
+
+    def consume(self, expected: str) -> None:
+        """
+        Skip the whitespace and consume the :paramref:`expected` character.
+
+        :param expected: character to be consumed
+        :raise: :py:class:`aas_core3.jsonization.DeserializationException` if another character follows
+        """
+        character = self.peek()
+        if character != expected:
+            raise aas_jsonization.DeserializationException(
+                f"Expected {expected!r}, but got: "
+                + (repr(character) if character != "" else "end of input")
+            )
+
+        self._position += 1
+
+    def read_value(self) -> aas_jsonization.Jsonable:
+        """
+        Skip the whitespace and decode the next JSON value as a whole.
+
+        :return: the decoded value
+        :raise: :py:class:`aas_core3.jsonization.DeserializationException` if the value is invalid JSON
+        """
+        self.peek()
+
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as exception:
+                if self._read_more():
+                    continue
+
+                raise aas_jsonization.DeserializationException(
+                    f"Invalid JSON: {exception.msg}"
+                ) from exception
+
+            # A number or a literal might continue in the next chunk, so we can
+            # only trust a value which ends before the end of the buffer.
+            if end == len(self._buffer) and self._read_more():
+                continue
+
+            self._position = end
+            return cast(aas_jsonization.Jsonable, value)
+
+
+_ITEM_FROM_JSONABLE_FOR_ENVIRONMENT: Mapping[
+    str, Callable[[aas_jsonization.Jsonable], aas_types.Identifiable]
+] = {
+    "assetAdministrationShells": aas_jsonization.asset_administration_shell_from_jsonable,
+    "submodels": aas_jsonization.submodel_from_jsonable,
+    "conceptDescriptions": aas_jsonization.concept_description_from_jsonable,
+}
+assert all(
+    key in aas_jsonization._SETTER_MAP_FOR_ENVIRONMENT
+    for key in _ITEM_FROM_JSONABLE_FOR_ENVIRONMENT
+)
+
+
+def _over_identifiables_with_property_names(
+    stream: Union[TextIO, BinaryIO], chunk_size: int
+) -> Iterator[Tuple[str, Optional[aas_types.Identifiable]]]:
+    """
+    Parse the identifiables of an environment from :paramref:`stream` one by one.
+
+    :param stream: containing an environment in JSON
+    :param chunk_size: number of characters or bytes to be read at once
+    :yield:
+        name of the environment property and the identifiable, or ``None`` at
+        the start of the array so that empty arrays can be told from missing ones
+    :raise: :py:class:`aas_core3.jsonization.DeserializationException` if unexpected input
+    """
+    tokenizer = _Tokenizer(stream, chunk_size)
+
+    # The enclosing mappings and arrays are never materialized. We use empty
+    # stand-ins as instances and containers in the path segments.
+    tokenizer.consume("{")
+
+    if tokenizer.peek() == "}":
+        tokenizer.consume("}")
+    else:
+        while True:
+            key = tokenizer.read_value()
+            if not isinstance(key, str):
+                raise aas_jsonization.DeserializationException(
+                    f"Expected a property name, but got: {type(key)}"
+                )
+
+            setter_method = aas_jsonization._SETTER_MAP_FOR_ENVIRONMENT.get(key)
+            if setter_method is None:
+                raise aas_jsonization.DeserializationException(
+                    f"Unexpected property: {key}"
+                )
+
+            tokenizer.consume(":")
+
+            item_from_jsonable = _ITEM_FROM_JSONABLE_FOR_ENVIRONMENT.get(key, None)
+
+            if item_from_jsonable is None or tokenizer.peek() != "[":
+                jsonable_value = tokenizer.read_value()
+                try:
+                    setter_method(
+                        aas_jsonization._SetterForEnvironment(), jsonable_value
+                    )
+                except aas_jsonization.DeserializationException as exception:
+                    exception.path._prepend(
+                        aas_jsonization.PropertySegment(dict(), key)
+                    )
+                    raise exception
+
+                # The setter succeeded, so the value is either ignored or it is
+                # an empty array-like which is not a JSON array.
+                assert item_from_jsonable is None or (
+                    len(cast(Sequence[Any], jsonable_value)) == 0
+                )
+            else:
+                tokenizer.consume("[")
+                yield key, None
+
+                if tokenizer.peek() == "]":
+                    tokenizer.consume("]")
+                else:
+                    i = 0
+                    while True:
+                        jsonable_item = tokenizer.read_value()
+                        try:
+                            item = item_from_jsonable(jsonable_item)
+                        except aas_jsonization.DeserializationException as exception:
+                            exception.path._prepend(aas_jsonization.IndexSegment((), i))
+                            exception.path._prepend(
+                                aas_jsonization.PropertySegment(dict(), key)
+                            )
+                            raise exception
+
+                        yield key, item
+                        i += 1
+
+                        if tokenizer.peek() == ",":
+                            tokenizer.consume(",")
+                        else:
+                            tokenizer.consume("]")
+                            break
+
+            if tokenizer.peek() == ",":
+                tokenizer.consume(",")
+            else:
+                tokenizer.consume("}")
+                break
+
+    character = tokenizer.peek()
+    if character != "":
+        raise aas_jsonization.DeserializationException(
+            f"Expected the end of input after the environment, but got: {character!r}"
+        )
+
+
+def iter_identifiables_from_stream(
+    stream: Union[TextIO, BinaryIO],
+    chunk_size: int = 65536,
+    interner: Optional[aas_interning.Interner] = None,
+    string_interner: Optional[aas_interning.StringInterner] = None,
+) -> Iterator[aas_types.Identifiable]:
+    """
+    Parse the identifiables of an environment from :paramref:`stream` one by one.
+
+    The asset administration shells, submodels and concept descriptions are
+    yielded in the order of the document. Only one identifiable is kept as
+    a JSON-able structure at a time, so the memory is bounded by the largest
+    identifiable rather than by the whole document.
+
+    Example usage:
+
+    .. code-block::
+
+        import aas_core3.json_streaming as aas_json_streaming
+
+        with open("some-huge-environment.json", "rb") as fid:
+            for identifiable in aas_json_streaming.iter_identifiables_from_stream(fid):
+                # Do something with the ``identifiable``
+                ...
+
+    :param stream: containing an environment in JSON, as text or as bytes
+    :param chunk_size: number of characters or bytes to be read at once
+    :param interner:
+        if given, the structurally equal references are shared among
+        the identifiables, see :py:mod:`aas_core3.interning`
+    :param string_interner:
+        if given, the equal strings of the selected properties are shared
+        among the identifiables, see :py:class:`aas_core3.interning.StringInterner`
+    :yield: the parsed identifiables
+    :raise: :py:class:`aas_core3.jsonization.DeserializationException` if unexpected input
+    """
+    for _, identifiable in _over_identifiables_with_property_names(stream, chunk_size):
+        if identifiable is not None:
+            if interner is not None:
+                interner.intern(identifiable)
+
+            if string_interner is not None:
+                string_interner.intern(identifiable)
+
+            yield identifiable
+
+
+def environment_from_stream(
+    stream: Union[TextIO, BinaryIO], chunk_size: int = 65536
+) -> aas_types.Environment:
+    """
+    Parse an instance of :py:class:`aas_core3.types.Environment` from :paramref:`stream`.
+
+    The result is the same as with
+    :py:func:`aas_core3.jsonization.environment_from_jsonable` applied on
+    the whole document, but the document is never loaded in memory as
+    a JSON-able structure.
+
+    :param stream: containing an environment in JSON, as text or as bytes
+    :param chunk_size: number of characters or bytes to be read at once
+    :return: Parsed instance of :py:class:`aas_core3.types.Environment`
+    :raise: :py:class:`aas_core3.jsonization.DeserializationException` if unexpected input
+    """
+    asset_administration_shells = (
+        None
+    )  # type: Optional[List[aas_types.AssetAdministrationShell]]
+    submodels = None  # type: Optional[List[aas_types.Submodel]]
+    concept_descriptions = None  # type: Optional[List[aas_types.ConceptDescription]]
+
+    for key, identifiable in _over_identifiables_with_property_names(
+        stream, chunk_size
+    ):
+        # As with :py:func:`json.load`, a repeated property overrides
+        # the previous one.
+        if key == "assetAdministrationShells":
+            if identifiable is None:
+                asset_administration_shells = []
+            else:
+                assert asset_administration_shells is not None
+                assert isinstance(identifiable, aas_types.AssetAdministrationShell)
+                asset_administration_shells.append(identifiable)
+
+        elif key == "submodels":
+            if identifiable is None:
+                submodels = []
+            else:
+                assert submodels is not None
+                assert isinstance(identifiable, aas_types.Submodel)
+                submodels.append(identifiable)
+
+        elif key == "conceptDescriptions":
+            if identifiable is None:
+                concept_descriptions = []
+            else:
+                assert concept_descriptions is not None
+                assert isinstance(identifiable, aas_types.ConceptDescription)
+                concept_descriptions.append(identifiable)
+
+        else:
+            raise AssertionError(f"Unexpected property: {key}")
+
+    return aas_types.Environment(
+        asset_administration_shells, submodels, concept_descriptions
+    )
+
+
+#: Properties of :py:class:`aas_core3.types.Environment` in the order of serialization,
+#: with the types of their items
+_ENVIRONMENT_SECTIONS: Sequence[Tuple[str, Type[aas_types.Identifiable]]] = (
+    ("assetAdministrationShells", aas_types.AssetAdministrationShell),
+    ("submodels", aas_types.Submodel),
+    ("conceptDescriptions", aas_types.ConceptDescription),
+)
+
+_JSON_ENCODER = json.JSONEncoder()
+
+
+class EnvironmentWriter:
+    """
+    Write an instance of :py:class:`aas_core3.types.Environment` incrementally as JSON.
+
+    The identifiables are passed in one by one and written immediately, so that
+    only one identifiable is held as a JSON-able structure at a time. The output
+    is the same as ``json.dumps(aas_jsonization.to_jsonable(environment))`` on the environment
+    containing the written identifiables.
+
+    The asset administration shells need to be written first, followed by
+    the submodels and, finally, the concept descriptions. This is the order in
+    which the properties of an environment are serialized.
+
+    Example usage:
+
+    .. code-block::
+
+        import pathlib
+
+        import aas_core3.json_streaming as aas_json_streaming
+
+        pth = pathlib.Path(...)
+        with pth.open("wt") as fid:
+            with aas_json_streaming.EnvironmentWriter(fid) as writer:
+                for submodel in produce_submodels_lazily(...):
+                    writer.write(submodel)
+    """
+
+    def __init__(self, stream: Union[TextIO, BinaryIO]) -> None:
+        """
+        Initialize to write to :paramref:`stream`.
+
+        :param stream: where to write to, as text or as UTF-8 encoded bytes
+        """
+        if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+            binary_stream = stream
+            self._write_text = lambda text: binary_stream.write(
+                text.encode("utf-8")
+            )  # type: Callable[[str], Any]
+        else:
+            self._write_text = cast(TextIO, stream).write
+
+        # The section is an index in ``_ENVIRONMENT_SECTIONS`` whose array is
+        # currently open, or -1 if no array has been opened yet.
+        self._section = -1
+        self._section_is_empty = True
+        self._closed = False
+
+        self._write_text("{")
+
+    def _open_section(self, section: int) -> None:
+        """Close the array of the current section, and open the :paramref:`section`."""
+        assert section > self._section
+
+        if self._section == -1:
+            self._write_text(f'"{_ENVIRONMENT_SECTIONS[section][0]}": [')
+        else:
+            self._write_text(f'], "{_ENVIRONMENT_SECTIONS[section][0]}": [')
+
+        self._section = section
+        self._section_is_empty = True
+
+    def write(self, identifiable: aas_types.Identifiable) -> None:
+        """
+        Write the :paramref:`identifiable` as an item of the environment.
+
+        :param identifiable:
+            asset administration shell, submodel or concept description
+        :raise:
+            :py:class:`ValueError` if the writer has been closed, or
+            if :paramref:`identifiable` comes out of order
+        """
+        if self._closed:
+            raise ValueError("The environment writer has been already closed")
+
+        for section, (name, item_type) in enumerate(_ENVIRONMENT_SECTIONS):
+            if isinstance(identifiable, item_type):
+                break
+        else:
+            raise ValueError(
+                f"Expected an asset administration shell, a submodel or "
+                f"a concept description, but got: {type(identifiable).__name__}"
+            )
+
+        if section < self._section:
+            raise ValueError(
+                f"Expected the items of {_ENVIRONMENT_SECTIONS[self._section][0]!r} "
+                f"or of the following properties, but got an item "
+                f"of {name!r}; the items need to be written in the order "
+                f"of the properties"
+            )
+
+        if section > self._section:
+            self._open_section(section)
+
+        # We serialize each identifiable with the C-accelerated encoder rather than
+        # emitting the tokens from Python. The memory is still bounded by
+        # the largest identifiable.
+        text = _JSON_ENCODER.encode(aas_jsonization._SERIALIZER.transform(identifiable))
+        if self._section_is_empty:
+            self._write_text(text)
+            self._section_is_empty = False
+        else:
+            self._write_text(", ")
+            self._write_text(text)
+
+    def close(self) -> None:
+        """
+        Write the end of the environment.
+
+        The stream itself is not closed. Closing the writer more than once has
+        no effect.
+        """
+        if self._closed:
+            return
+
+        if self._section == -1:
+            self._write_text("}")
+        else:
+            self._write_text("]}")
+
+        self._closed = True
+
+    def __enter__(self) -> "EnvironmentWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        # We do not complete the document if an exception has been raised so that
+        # a partial export can not be mistaken for a complete one.
+        if exc_type is None:
+            self.close()
+
+
+def write_environment(
+    stream: Union[TextIO, BinaryIO],
+    asset_administration_shells: Optional[
+        Iterable[aas_types.AssetAdministrationShell]
+    ] = None,
+    submodels: Optional[Iterable[aas_types.Submodel]] = None,
+    concept_descriptions: Optional[Iterable[aas_types.ConceptDescription]] = None,
+) -> None:
+    """
+    Write an environment with the given identifiables as JSON to :paramref:`stream`.
+
+    The identifiables are consumed lazily, so you can pass in generators, *e.g.*,
+    over a database cursor. The output is the same as
+    ``json.dumps(aas_jsonization.to_jsonable(environment))`` on the corresponding environment,
+    where an omitted argument corresponds to a property which is not set.
+
+    Example usage:
+
+    .. code-block::
+
+        import pathlib
+
+        import aas_core3.json_streaming as aas_json_streaming
+
+        pth = pathlib.Path(...)
+        with pth.open("wt") as fid:
+            aas_json_streaming.write_environment(
+                fid,
+                submodels=produce_submodels_lazily(...)
+            )
+
+    :param stream: where to write to, as text or as UTF-8 encoded bytes
+    :param asset_administration_shells: to be written
+    :param submodels: to be written
+    :param concept_descriptions: to be written
+    :raise: :py:class:`ValueError` if an identifiable is passed in as a wrong item
+    """
+    writer = EnvironmentWriter(stream)
+
+    for section, identifiables in enumerate(
+        (asset_administration_shells, submodels, concept_descriptions)
+    ):
+        if identifiables is None:
+            continue
+
+        # We open the section explicitly so that empty iterables are written as
+        # empty arrays, as opposed to properties which are not set.
+        name, item_type = _ENVIRONMENT_SECTIONS[section]
+
+        writer._open_section(section)
+        for identifiable in identifiables:
+            if not isinstance(identifiable, item_type):
+                raise ValueError(
+                    f"Expected only items of type {item_type.__name__} "
+                    f"in {name!r}, but got: {type(identifiable).__name__}"
+                )
+
+            writer.write(identifiable)
+
+    writer.close()
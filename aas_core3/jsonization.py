@@ -75,24 +75,28 @@ class Path:
 
     def __init__(self) -> None:
         """Initialize as an empty path."""
-        self._segments = []  # type: List[Segment]
+        # The segments are prepended once per nesting level while an error
+        # propagates up the call stack. We store them in reverse so that
+        # a prepend is an amortized O(1) append instead of an O(n) insert,
+        # and only materialize the actual order on access.
+        self._reversed_segments = []  # type: List[Segment]
 
     @property
     def segments(self) -> Sequence[Segment]:
         """Get the segments of the path."""
-        return self._segments
+        return self._reversed_segments[::-1]
 
     def _prepend(self, segment: Segment) -> None:
         """Insert the :paramref:`segment` in front of other segments."""
-        self._segments.insert(0, segment)
+        self._reversed_segments.append(segment)
 
     def __str__(self) -> str:
-        if len(self._segments) == 0:
+        if len(self._reversed_segments) == 0:
             return ""
 
         parts = []  # type: List[str]
 
-        iterator = iter(self._segments)
+        iterator = reversed(self._reversed_segments)
         first = next(iterator)
         if isinstance(first, PropertySegment):
             parts.append(f"{first.name}")
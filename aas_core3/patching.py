@@ -0,0 +1,670 @@
+"""
+Apply small change sets to an environment in place.
+
+A patch is a sequence of operations, similar to JSON Patch (RFC 6902). Each
+operation is addressed by the ID of an identifiable and the path of ID-shorts
+and indices from the identifiable to the target, in the same manner as
+the changes reported by :py:mod:`aas_core3.diff`:
+
+* :py:class:`Add` inserts a submodel element into its container, or
+  an identifiable into the environment if the path is empty; the elements added
+  to an operation are wrapped in operation variables,
+* :py:class:`Remove` removes a submodel element from its container, or
+  an identifiable from the environment if the path is empty, and
+* :py:class:`Replace` sets a property of the target.
+
+The identifiables are looked up through an
+:py:class:`aas_core3.indexing.EnvironmentIndex`, and the submodel elements
+through the ``id_short`` indices of a :py:class:`aas_core3.resolution.Resolver`.
+The :py:class:`Patcher` keeps both in sync with the changes it applies, so that
+applying an operation costs time proportional to the length of its path and
+the size of the touched containers, not the size of the environment.
+
+The edited instances are marked dirty in an
+:py:class:`aas_core3.incremental_verification.IncrementalVerifier`. Once
+the environment has been verified, :py:meth:`Patcher.verify` re-verifies only
+the touched instances and their ancestors. The removed and the replaced instances are forgotten by
+the verifier, so that a long-running patcher does not keep them alive.
+
+If you edit the environment outside of the patcher, create a new one.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.patching as aas_patching
+    import aas_core3.types as aas_types
+
+    environment = aas_types.Environment(
+        # ... some constructor arguments ...
+    )
+
+    patcher = aas_patching.Patcher(environment)
+
+    # The first verification checks the whole environment.
+    errors = list(patcher.verify())
+
+    patcher.apply(
+        [
+            aas_patching.Replace(
+                "urn:some-submodel",
+                ("someCollection", "someProperty"),
+                "value",
+                "1984",
+            ),
+            aas_patching.Remove("urn:some-submodel", ("obsoleteProperty",)),
+        ]
+    )
+
+    # Only the touched instances and their ancestors are re-verified.
+    errors = list(patcher.verify())
+"""
+
+import inspect
+import sys
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+if sys.version_info >= (3, 8):
+    from typing import Final
+else:
+    from typing_extensions import Final
+
+import aas_core3.diff as aas_diff
+import aas_core3.incremental_verification as aas_incremental_verification
+import aas_core3.indexing as aas_indexing
+import aas_core3.resolution as aas_resolution
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+
+class PatchException(Exception):
+    """Signal that an operation of a patch could not be applied."""
+
+    #: Human-readable explanation of the exception's cause
+    cause: Final[str]
+
+    #: Index of the operation in the patch which could not be applied
+    operation_index: Final[int]
+
+    def __init__(self, cause: str, operation_index: int) -> None:
+        """Initialize with the given values."""
+        super().__init__(cause)
+        self.cause = cause
+        self.operation_index = operation_index
+
+
+class _Failure(Exception):
+    """Signal that an operation can not be applied; the index is added later."""
+
+    def __init__(self, cause: str) -> None:
+        """Initialize with the given values."""
+        super().__init__(cause)
+        self.cause = cause
+
+
+class PatchOperation:
+    """Represent an operation of a patch."""
+
+    #: ID of the identifiable in which the operation is applied
+    identifiable_id: Final[str]
+
+    #: Path of ID-shorts and indices from the identifiable to the target
+    #: of the operation; empty if the target is the identifiable itself
+    path: Final[Tuple[aas_diff.PathSegment, ...]]
+
+    def __init__(
+        self, identifiable_id: str, path: Tuple[aas_diff.PathSegment, ...]
+    ) -> None:
+        """Initialize with the given values."""
+        self.identifiable_id = identifiable_id
+        self.path = path
+
+    def __repr__(self) -> str:
+        """Represent the operation for debugging."""
+        return (
+            f"{self.__class__.__name__}("
+            f"identifiable_id={self.identifiable_id!r}, path={self.path!r})"
+        )
+
+
+class Add(PatchOperation):
+    """
+    Add an instance at the :py:attr:`path`.
+
+    If the path is empty, :py:attr:`instance` is an identifiable with
+    the ID :py:attr:`identifiable_id`, and it is appended to the environment.
+
+    Otherwise, :py:attr:`instance` is a submodel element. If its container is
+    a :py:class:`aas_core3.types.SubmodelElementList`, the last segment of
+    the path is the index at which the element is inserted. For all other
+    containers, the last segment is the ID-short of the element, and the element
+    is appended to the container.
+
+    If the container is an :py:class:`aas_core3.types.Operation`, the element is
+    wrapped in an :py:class:`aas_core3.types.OperationVariable`, and appended to
+    the variables given by :py:attr:`property_name`.
+    """
+
+    #: Instance to be added
+    instance: Final[aas_types.Referable]
+
+    #: Name of the property of an :py:class:`aas_core3.types.Operation` holding
+    #: the variables to which :py:attr:`instance` is added, *i.e.*,
+    #: ``input_variables``, ``output_variables`` or ``inoutput_variables``;
+    #: ``None`` for all the other containers
+    property_name: Final[Optional[str]]
+
+    def __init__(
+        self,
+        identifiable_id: str,
+        path: Tuple[aas_diff.PathSegment, ...],
+        instance: aas_types.Referable,
+        property_name: Optional[str] = None,
+    ) -> None:
+        """Initialize with the given values."""
+        super().__init__(identifiable_id, path)
+        self.instance = instance
+        self.property_name = property_name
+
+
+class Remove(PatchOperation):
+    """
+    Remove the instance at the :py:attr:`path`.
+
+    If the path is empty, the identifiable itself is removed from
+    the environment. If the container of the removed submodel element becomes
+    empty, the container's list is set to ``None``, as the model does not allow
+    for empty lists.
+    """
+
+
+class Replace(PatchOperation):
+    """Set the property of the instance at the :py:attr:`path`."""
+
+    #: Name of the property to be set, as in the constructor of the target
+    property_name: Final[str]
+
+    #: New value of the property, of the type which the property expects
+    value: Final[Any]
+
+    def __init__(
+        self,
+        identifiable_id: str,
+        path: Tuple[aas_diff.PathSegment, ...],
+        property_name: str,
+        value: Any,
+    ) -> None:
+        """Initialize with the given values."""
+        super().__init__(identifiable_id, path)
+        self.property_name = property_name
+        self.value = value
+
+    def __repr__(self) -> str:
+        """Represent the operation for debugging."""
+        return (
+            f"{self.__class__.__name__}("
+            f"identifiable_id={self.identifiable_id!r}, path={self.path!r}, "
+            f"property_name={self.property_name!r})"
+        )
+
+
+# Properties holding the submodel elements addressed by their ID-shorts, and
+# the expected type of the elements
+_ELEMENTS_BY_ID_SHORT: Final[
+    Mapping[Type[aas_types.Class], Tuple[str, Type[aas_types.SubmodelElement]]]
+] = {
+    aas_types.Submodel: ("submodel_elements", aas_types.SubmodelElement),
+    aas_types.SubmodelElementCollection: ("value", aas_types.SubmodelElement),
+    aas_types.Entity: ("statements", aas_types.SubmodelElement),
+    aas_types.AnnotatedRelationshipElement: ("annotations", aas_types.DataElement),
+}
+
+# Properties of an operation holding the variables
+_VARIABLES: Final[Tuple[str, ...]] = (
+    "input_variables",
+    "output_variables",
+    "inoutput_variables",
+)
+
+# Properties of the environment holding the identifiables of the given type
+_IDENTIFIABLES: Final[Mapping[Type[aas_types.Identifiable], str]] = {
+    aas_types.AssetAdministrationShell: "asset_administration_shells",
+    aas_types.Submodel: "submodels",
+    aas_types.ConceptDescription: "concept_descriptions",
+}
+
+_PROPERTIES: Final[Mapping[Type[aas_types.Class], Tuple[str, ...]]] = {
+    cls: tuple(inspect.signature(cls.__init__).parameters)[1:]
+    for cls in vars(aas_types).values()
+    if inspect.isclass(cls)
+    and issubclass(cls, aas_types.Class)
+    and not inspect.isabstract(cls)
+}
+
+
+def _remove_by_identity(items: List[Any], item: Any) -> bool:
+    """
+    Remove the :paramref:`item` from :paramref:`items` matching by identity.
+
+    :param items: from which the item is removed
+    :param item: to be removed
+    :return: ``True`` if the item has been found
+    """
+    for i, another_item in enumerate(items):
+        if another_item is item:
+            del items[i]
+            return True
+
+    return False
+
+
+def _detached_instances(old_value: Any, new_value: Any) -> Iterator[aas_types.Class]:
+    """
+    Iterate over the instances in :paramref:`old_value` of a property which are
+    not in its :paramref:`new_value` anymore.
+
+    :param old_value: of the property before the replacement
+    :param new_value: of the property after the replacement
+    :yield: the instances which are no longer held by the property
+    """
+    old_instances = (
+        old_value
+        if isinstance(old_value, list)
+        else ([old_value] if isinstance(old_value, aas_types.Class) else [])
+    )
+    if len(old_instances) == 0:
+        return
+
+    kept = set()  # type: Set[int]
+    if isinstance(new_value, list):
+        kept.update(id(item) for item in new_value)
+    elif new_value is not None:
+        kept.add(id(new_value))
+
+    for instance in old_instances:
+        if isinstance(instance, aas_types.Class) and id(instance) not in kept:
+            yield instance
+
+
+class Patcher:
+    """Apply patches to an environment in place, keeping the indices in sync."""
+
+    #: Environment to be patched
+    environment: Final[aas_types.Environment]
+
+    #: Index of the identifiables in :py:attr:`environment`
+    index: Final[aas_indexing.EnvironmentIndex]
+
+    #: Verifier whose cached results are invalidated by the patches
+    verifier: Final[aas_incremental_verification.IncrementalVerifier]
+
+    def __init__(
+        self,
+        environment: aas_types.Environment,
+        index: Optional[aas_indexing.EnvironmentIndex] = None,
+        verifier: Optional[aas_incremental_verification.IncrementalVerifier] = None,
+    ) -> None:
+        """
+        Initialize for the given :paramref:`environment`.
+
+        :param environment: to be patched
+        :param index:
+            of the identifiables in :paramref:`environment`; if not given,
+            it is built here
+        :param verifier:
+            to verify the :paramref:`environment`; if not given, a new one is
+            created, and the first call to :py:meth:`verify` checks the whole
+            environment
+        """
+        self.environment = environment
+        self.index = (
+            index if index is not None else aas_indexing.EnvironmentIndex(environment)
+        )
+        self.verifier = (
+            verifier
+            if verifier is not None
+            else aas_incremental_verification.IncrementalVerifier()
+        )
+
+        self._resolver = aas_resolution.Resolver(environment, self.index)
+
+    def verify(self) -> Iterator[aas_verification.Error]:
+        """
+        Verify the environment, re-using the results of the untouched instances.
+
+        :yield: constraint violations
+        """
+        yield from self.verifier.verify(self.environment)
+
+    def apply(self, operations: Iterable[PatchOperation]) -> None:
+        """
+        Apply the :paramref:`operations` in the given order.
+
+        The operations are not applied atomically. If an operation fails,
+        the preceding operations remain applied.
+
+        :param operations: to be applied
+        :raise:
+            :py:class:`PatchException` if an operation can not be applied
+        """
+        for i, operation in enumerate(operations):
+            try:
+                if isinstance(operation, Add):
+                    self._add(operation)
+                elif isinstance(operation, Remove):
+                    self._remove(operation)
+                elif isinstance(operation, Replace):
+                    self._replace(operation)
+                else:
+                    raise ValueError(
+                        f"Unexpected operation: {type(operation).__name__}"
+                    )
+            except _Failure as failure:
+                raise PatchException(failure.cause, i) from None
+
+    def _resolve(
+        self, operation: PatchOperation, path: Tuple[aas_diff.PathSegment, ...]
+    ) -> List[aas_types.Referable]:
+        """
+        Resolve the :paramref:`path` in the identifiable of :paramref:`operation`.
+
+        :param operation: whose identifiable is looked up
+        :param path: from the identifiable
+        :return: instances from the identifiable to the end of the path
+        :raise: :py:class:`_Failure` if the path can not be resolved
+        """
+        identifiable = self.index.find(operation.identifiable_id)
+        if identifiable is None:
+            raise _Failure(
+                f"No identifiable with the ID {operation.identifiable_id!r} "
+                f"in the environment"
+            )
+
+        chain = [identifiable]  # type: List[aas_types.Referable]
+        for segment in path:
+            chain.append(self._child(chain[-1], segment))
+
+        return chain
+
+    def _child(
+        self, container: aas_types.Referable, segment: aas_diff.PathSegment
+    ) -> aas_types.SubmodelElement:
+        """
+        Find the child of :paramref:`container` addressed by :paramref:`segment`.
+
+        :param container: whose child is searched
+        :param segment: ID-short or index of the child
+        :return: the child
+        :raise: :py:class:`_Failure` if there is no such child
+        """
+        if isinstance(container, aas_types.SubmodelElementList):
+            if not isinstance(segment, int):
+                raise _Failure(
+                    f"Expected an index in the submodel element list, "
+                    f"but got: {segment!r}"
+                )
+
+            if container.value is None or not 0 <= segment < len(container.value):
+                raise _Failure(
+                    f"The index {segment} is out of bounds "
+                    f"in the submodel element list"
+                )
+
+            return container.value[segment]
+
+        if not isinstance(segment, str):
+            raise _Failure(
+                f"Expected an ID-short in the {type(container).__name__}, "
+                f"but got: {segment!r}"
+            )
+
+        child = self._resolver.find_child(container, segment)
+        if child is None:
+            raise _Failure(
+                f"No element with the ID-short {segment!r} found "
+                f"in the {type(container).__name__}"
+            )
+
+        return child
+
+    def _add(self, operation: Add) -> None:
+        """Apply the :paramref:`operation`."""
+        instance = operation.instance
+
+        if (
+            operation.property_name is not None
+            and operation.property_name not in _VARIABLES
+        ):
+            raise _Failure(
+                f"Expected the property name to be one of {', '.join(_VARIABLES)}, "
+                f"but got: {operation.property_name!r}"
+            )
+
+        if len(operation.path) == 0:
+            if operation.property_name is not None:
+                raise _Failure(
+                    f"Expected no property name for adding to the environment, "
+                    f"but got: {operation.property_name!r}"
+                )
+
+            if not isinstance(instance, aas_types.Identifiable):
+                raise _Failure(
+                    f"Expected an identifiable to be added to the environment, "
+                    f"but got: {type(instance).__name__}"
+                )
+
+            if instance.id != operation.identifiable_id:
+                raise _Failure(
+                    f"Expected the identifiable to have the ID "
+                    f"{operation.identifiable_id!r}, but got: {instance.id!r}"
+                )
+
+            if instance.id in self.index:
+                raise _Failure(
+                    f"The identifiable with the ID {instance.id!r} already exists "
+                    f"in the environment"
+                )
+
+            property_name = _IDENTIFIABLES[type(instance)]
+            identifiables = getattr(self.environment, property_name)
+            if identifiables is None:
+                setattr(self.environment, property_name, [instance])
+            else:
+                identifiables.append(instance)
+
+            self.index.add(instance)
+            self.verifier.mark_dirty(self.environment)
+            return
+
+        container = self._resolve(operation, operation.path[:-1])[-1]
+        segment = operation.path[-1]
+
+        if operation.property_name is not None and not isinstance(
+            container, aas_types.Operation
+        ):
+            raise _Failure(
+                f"Expected no property name for adding to "
+                f"the {type(container).__name__}, "
+                f"but got: {operation.property_name!r}"
+            )
+
+        if not isinstance(instance, aas_types.SubmodelElement):
+            raise _Failure(
+                f"Expected a submodel element to be added to the "
+                f"{type(container).__name__}, but got: {type(instance).__name__}"
+            )
+
+        if isinstance(container, aas_types.SubmodelElementList):
+            length = len(container.value) if container.value is not None else 0
+            if not isinstance(segment, int) or not 0 <= segment <= length:
+                raise _Failure(
+                    f"Expected an index from 0 to {length} in the submodel element "
+                    f"list, but got: {segment!r}"
+                )
+
+            if container.value is None:
+                container.value = [instance]
+            else:
+                container.value.insert(segment, instance)
+
+        else:
+            if isinstance(container, aas_types.Operation):
+                if operation.property_name is None:
+                    raise _Failure(
+                        f"Expected the property name of the variables to add to "
+                        f"the operation, one of {', '.join(_VARIABLES)}, "
+                        f"but got none"
+                    )
+
+                property_name = operation.property_name
+                item = aas_types.OperationVariable(instance)  # type: aas_types.Class
+            else:
+                property_name_and_type = _ELEMENTS_BY_ID_SHORT.get(
+                    type(container), None
+                )
+                if property_name_and_type is None:
+                    raise _Failure(
+                        f"Expected a container of submodel elements to add to, "
+                        f"but got: {type(container).__name__}"
+                    )
+
+                property_name, item_type = property_name_and_type
+                if not isinstance(instance, item_type):
+                    raise _Failure(
+                        f"Expected a {item_type.__name__} to be added to the "
+                        f"{type(container).__name__}, "
+                        f"but got: {type(instance).__name__}"
+                    )
+
+                item = instance
+
+            id_short = instance.id_short
+            if id_short is None or id_short != segment:
+                raise _Failure(
+                    f"Expected the element to have the ID-short {segment!r}, "
+                    f"but got: {id_short!r}"
+                )
+
+            if self._resolver.find_child(container, id_short) is not None:
+                raise _Failure(
+                    f"The element with the ID-short {id_short!r} already exists "
+                    f"in the {type(container).__name__}"
+                )
+
+            elements = getattr(container, property_name)
+            if elements is None:
+                setattr(container, property_name, [item])
+            else:
+                elements.append(item)
+
+            self._resolver.forget(container)
+
+        self.verifier.mark_dirty(container)
+
+    def _remove(self, operation: Remove) -> None:
+        """Apply the :paramref:`operation`."""
+        chain = self._resolve(operation, operation.path)
+        target = chain[-1]
+
+        if len(chain) == 1:
+            assert isinstance(target, aas_types.Identifiable)
+            property_name = _IDENTIFIABLES[type(target)]
+            identifiables = getattr(self.environment, property_name)
+            assert identifiables is not None
+            removed = _remove_by_identity(identifiables, target)
+            assert removed, "The resolved identifiable must be in the environment"
+            if len(identifiables) == 0:
+                setattr(self.environment, property_name, None)
+
+            self.index.remove(target)
+            self.verifier.forget(target, self.environment)
+            self.verifier.mark_dirty(self.environment)
+            return
+
+        container = chain[-2]
+
+        # The operation variables wrap the removed element, so we need to forget
+        # the variable rather than the element in the verifier.
+        detached = target  # type: aas_types.Class
+
+        if isinstance(container, aas_types.Operation):
+            for property_name in _VARIABLES:
+                variables = getattr(container, property_name)
+                if variables is None:
+                    continue
+
+                variable = next(
+                    (variable for variable in variables if variable.value is target),
+                    None,
+                )
+                if variable is not None:
+                    removed = _remove_by_identity(variables, variable)
+                    assert removed, "The found variable must be in its list"
+                    if len(variables) == 0:
+                        setattr(container, property_name, None)
+
+                    detached = variable
+                    break
+        else:
+            property_name = (
+                "value"
+                if isinstance(container, aas_types.SubmodelElementList)
+                else _ELEMENTS_BY_ID_SHORT[type(container)][0]
+            )
+            elements = getattr(container, property_name)
+            assert elements is not None
+            removed = _remove_by_identity(elements, target)
+            assert removed, "The resolved element must be in its container"
+            if len(elements) == 0:
+                setattr(container, property_name, None)
+
+        self._resolver.forget(container)
+        self.verifier.forget(detached, container)
+        self.verifier.mark_dirty(container)
+
+    def _replace(self, operation: Replace) -> None:
+        """Apply the :paramref:`operation`."""
+        chain = self._resolve(operation, operation.path)
+        target = chain[-1]
+
+        if operation.property_name not in _PROPERTIES[type(target)]:
+            raise _Failure(
+                f"The {type(target).__name__} has no property "
+                f"{operation.property_name!r}"
+            )
+
+        if operation.property_name == "id":
+            assert isinstance(target, aas_types.Identifiable)
+            if operation.value != target.id and operation.value in self.index:
+                raise _Failure(
+                    f"The identifiable with the ID {operation.value!r} already "
+                    f"exists in the environment"
+                )
+
+            self.index.remove(target)
+            target.id = operation.value
+            self.index.add(target)
+        else:
+            old_value = getattr(target, operation.property_name)
+            setattr(target, operation.property_name, operation.value)
+
+            for detached in _detached_instances(old_value, operation.value):
+                self.verifier.forget(detached, target)
+
+        # The replaced property might hold the children of the target, or
+        # the ID-short of the target in its container.
+        self._resolver.forget(target)
+        if len(chain) > 1:
+            self._resolver.forget(chain[-2])
+
+        self.verifier.mark_dirty(target)
@@ -0,0 +1,362 @@
+"""
+Resolve model references to the referred instances within an environment.
+
+A model reference (see :py:attr:`aas_core3.types.ReferenceTypes.MODEL_REFERENCE`)
+starts with a key pointing to an identifiable, followed by keys which descend
+into the nested submodel elements. The elements of
+a :py:class:`aas_core3.types.SubmodelElementList` are addressed by their index,
+all other submodel elements by their ``id_short``.
+
+The identifiables are looked up through an
+:py:class:`aas_core3.indexing.EnvironmentIndex`. The children of each container
+are indexed by their ``id_short`` lazily, on the first look-up, and cached in
+the :py:class:`Resolver`. Resolving many references thus costs time linear in
+the total number of keys and visited containers, rather than a scan of all the
+elements per reference.
+
+The :py:class:`Resolver` assumes that the environment does not change. If you
+add or remove submodel elements, call :py:meth:`Resolver.forget` on their
+container, or :py:meth:`Resolver.clear_cache` to start afresh. If you
+add or remove identifiables, update :py:attr:`Resolver.index` accordingly, or
+simply create a new resolver.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.resolution as aas_resolution
+    import aas_core3.types as aas_types
+
+    environment = aas_types.Environment(
+        # ... some constructor arguments ...
+    )
+
+    resolver = aas_resolution.Resolver(environment)
+
+    for something in environment.descend():
+        if isinstance(something, aas_types.ReferenceElement):
+            try:
+                target = resolver.resolve(something.value)
+            except aas_resolution.ResolutionException as exception:
+                print(f"{exception.cause} at key {exception.key_index}")
+"""
+
+import sys
+from typing import (
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+if sys.version_info >= (3, 8):
+    from typing import Final
+else:
+    from typing_extensions import Final
+
+import aas_core3.constants as aas_constants
+import aas_core3.indexing as aas_indexing
+import aas_core3.types as aas_types
+
+
+class ResolutionException(Exception):
+    """Signal that a reference could not be resolved."""
+
+    #: Human-readable explanation of the exception's cause
+    cause: Final[str]
+
+    #: Index of the key in :py:attr:`aas_core3.types.Reference.keys` which could
+    #: not be resolved, or ``None`` if the reference as a whole is unresolvable
+    key_index: Final[Optional[int]]
+
+    def __init__(self, cause: str, key_index: Optional[int] = None) -> None:
+        """Initialize with the given values."""
+        super().__init__(cause)
+        self.cause = cause
+        self.key_index = key_index
+
+
+_KEY_TYPE_TO_CLASS: Mapping[aas_types.KeyTypes, Type[aas_types.Referable]] = {
+    aas_types.KeyTypes.ANNOTATED_RELATIONSHIP_ELEMENT: aas_types.AnnotatedRelationshipElement,
+    aas_types.KeyTypes.ASSET_ADMINISTRATION_SHELL: aas_types.AssetAdministrationShell,
+    aas_types.KeyTypes.BASIC_EVENT_ELEMENT: aas_types.BasicEventElement,
+    aas_types.KeyTypes.BLOB: aas_types.Blob,
+    aas_types.KeyTypes.CAPABILITY: aas_types.Capability,
+    aas_types.KeyTypes.CONCEPT_DESCRIPTION: aas_types.ConceptDescription,
+    aas_types.KeyTypes.DATA_ELEMENT: aas_types.DataElement,
+    aas_types.KeyTypes.ENTITY: aas_types.Entity,
+    aas_types.KeyTypes.EVENT_ELEMENT: aas_types.EventElement,
+    aas_types.KeyTypes.FILE: aas_types.File,
+    aas_types.KeyTypes.IDENTIFIABLE: aas_types.Identifiable,
+    aas_types.KeyTypes.MULTI_LANGUAGE_PROPERTY: aas_types.MultiLanguageProperty,
+    aas_types.KeyTypes.OPERATION: aas_types.Operation,
+    aas_types.KeyTypes.PROPERTY: aas_types.Property,
+    aas_types.KeyTypes.RANGE: aas_types.Range,
+    aas_types.KeyTypes.REFERABLE: aas_types.Referable,
+    aas_types.KeyTypes.REFERENCE_ELEMENT: aas_types.ReferenceElement,
+    aas_types.KeyTypes.RELATIONSHIP_ELEMENT: aas_types.RelationshipElement,
+    aas_types.KeyTypes.SUBMODEL: aas_types.Submodel,
+    aas_types.KeyTypes.SUBMODEL_ELEMENT: aas_types.SubmodelElement,
+    aas_types.KeyTypes.SUBMODEL_ELEMENT_COLLECTION: aas_types.SubmodelElementCollection,
+    aas_types.KeyTypes.SUBMODEL_ELEMENT_LIST: aas_types.SubmodelElementList,
+}
+assert all(key_type in _KEY_TYPE_TO_CLASS for key_type in aas_constants.AAS_REFERABLES)
+
+
+def _over_children_with_id_shorts(
+    container: aas_types.Referable,
+) -> Optional[Iterator[aas_types.SubmodelElement]]:
+    """
+    Iterate over the children of :paramref:`container` addressed by ``id_short``.
+
+    :param container: whose children should be iterated over
+    :return: iterator over the children, or ``None`` if not a namespace
+    """
+    if isinstance(container, aas_types.Submodel):
+        return container.over_submodel_elements_or_empty()
+
+    elif isinstance(container, aas_types.SubmodelElementCollection):
+        return container.over_value_or_empty()
+
+    elif isinstance(container, aas_types.Entity):
+        return container.over_statements_or_empty()
+
+    elif isinstance(container, aas_types.AnnotatedRelationshipElement):
+        return container.over_annotations_or_empty()
+
+    elif isinstance(container, aas_types.Operation):
+        return (
+            variable.value
+            for variables in (
+                container.over_input_variables_or_empty(),
+                container.over_output_variables_or_empty(),
+                container.over_inoutput_variables_or_empty(),
+            )
+            for variable in variables
+        )
+
+    return None
+
+
+class Resolver:
+    """Resolve model references within an environment with cached indices."""
+
+    #: Environment in which the references are resolved
+    environment: Final[aas_types.Environment]
+
+    #: Index of the identifiables in :py:attr:`environment`
+    index: Final[aas_indexing.EnvironmentIndex]
+
+    def __init__(
+        self,
+        environment: aas_types.Environment,
+        index: Optional[aas_indexing.EnvironmentIndex] = None,
+    ) -> None:
+        """
+        Initialize for the given :paramref:`environment`.
+
+        :param environment: in which the references are resolved
+        :param index:
+            of the identifiables in :paramref:`environment`; if not given,
+            it is built here
+        """
+        self.environment = environment
+        self.index = (
+            index if index is not None else aas_indexing.EnvironmentIndex(environment)
+        )
+
+        # We key the cache on the object identity of the containers. We keep
+        # the container in the value as well so that the identity can not be
+        # re-used by another object while the cache is alive.
+        self._children_by_id_short = (
+            dict()
+        )  # type: Dict[int, Tuple[aas_types.Referable, Dict[str, aas_types.SubmodelElement]]]
+
+    def clear_cache(self) -> None:
+        """Forget the cached ``id_short`` indices of the containers."""
+        self._children_by_id_short.clear()
+
+    def forget(self, container: aas_types.Referable) -> None:
+        """
+        Forget the cached ``id_short`` index of :paramref:`container`.
+
+        Call this method after you added, removed or renamed the children of
+        :paramref:`container`. The index is rebuilt on the next look-up.
+
+        :param container: whose children changed
+        """
+        self._children_by_id_short.pop(id(container), None)
+
+    def find_child(
+        self, container: aas_types.Referable, id_short: str
+    ) -> Optional[aas_types.SubmodelElement]:
+        """
+        Find the child of :paramref:`container` by its :paramref:`id_short`.
+
+        The children of an operation are the values of its variables.
+
+        :param container: whose children are searched
+        :param id_short: of the child
+        :return:
+            the first child with the :paramref:`id_short`, or ``None`` if there is
+            none or :paramref:`container` does not contain submodel elements
+        """
+        children = self._children_of(container)
+        if children is None:
+            return None
+
+        return children.get(id_short, None)
+
+    def _children_of(
+        self, container: aas_types.Referable
+    ) -> Optional[Mapping[str, aas_types.SubmodelElement]]:
+        """
+        Retrieve the children of :paramref:`container` indexed by ``id_short``.
+
+        :param container: whose children should be retrieved
+        :return: the mapping, or ``None`` if :paramref:`container` is not a namespace
+        """
+        cached = self._children_by_id_short.get(id(container), None)
+        if cached is not None:
+            return cached[1]
+
+        children = _over_children_with_id_shorts(container)
+        if children is None:
+            return None
+
+        mapping = dict()  # type: Dict[str, aas_types.SubmodelElement]
+        for child in children:
+            if child.id_short is not None and child.id_short not in mapping:
+                mapping[child.id_short] = child
+
+        self._children_by_id_short[id(container)] = (container, mapping)
+        return mapping
+
+    def resolve(self, reference: aas_types.Reference) -> aas_types.Referable:
+        """
+        Resolve the :paramref:`reference` to the referred instance.
+
+        :param reference: model reference to be resolved
+        :return: the referred instance
+        :raise:
+            :py:class:`ResolutionException` if the :paramref:`reference` can not be
+            resolved
+        """
+        if reference.type != aas_types.ReferenceTypes.MODEL_REFERENCE:
+            raise ResolutionException(
+                f"Expected a model reference, but got: {reference.type.value}"
+            )
+
+        if len(reference.keys) == 0:
+            raise ResolutionException("Expected at least one key, but got none")
+
+        first_key = reference.keys[0]
+        expected_type = _KEY_TYPE_TO_CLASS.get(first_key.type, None)
+        if expected_type is None or not issubclass(
+            expected_type, aas_types.Identifiable
+        ):
+            raise ResolutionException(
+                f"Expected the first key to refer to an identifiable, "
+                f"but got the key type: {first_key.type.value}",
+                0,
+            )
+
+        identifiable = self.index.find(first_key.value)
+        if identifiable is None:
+            raise ResolutionException(
+                f"No identifiable with the ID {first_key.value!r} "
+                f"in the environment",
+                0,
+            )
+
+        if not isinstance(identifiable, expected_type):
+            raise ResolutionException(
+                f"Expected the identifiable with the ID {first_key.value!r} "
+                f"to be of type {first_key.type.value}, "
+                f"but got: {type(identifiable).__name__}",
+                0,
+            )
+
+        current = identifiable  # type: aas_types.Referable
+
+        for i in range(1, len(reference.keys)):
+            key = reference.keys[i]
+
+            expected_type = _KEY_TYPE_TO_CLASS.get(key.type, None)
+            if expected_type is None:
+                raise ResolutionException(
+                    f"Expected the key to refer to a referable, "
+                    f"but got the key type: {key.type.value}",
+                    i,
+                )
+
+            target = None  # type: Optional[aas_types.Referable]
+
+            if isinstance(current, aas_types.SubmodelElementList):
+                # ``str.isdigit`` also accepts characters such as ``"²"`` which
+                # :py:func:`int` can not parse, so we restrict to ASCII digits.
+                if not (key.value.isascii() and key.value.isdecimal()):
+                    raise ResolutionException(
+                        f"Expected the key to be an index in a submodel element "
+                        f"list, but got: {key.value!r}",
+                        i,
+                    )
+
+                index = int(key.value)
+                if current.value is None or index >= len(current.value):
+                    raise ResolutionException(
+                        f"The index {index} is out of bounds "
+                        f"in the submodel element list",
+                        i,
+                    )
+
+                target = current.value[index]
+            else:
+                children = self._children_of(current)
+                if children is None:
+                    raise ResolutionException(
+                        f"Expected a container of submodel elements to resolve "
+                        f"the key {key.value!r}, "
+                        f"but got: {type(current).__name__}",
+                        i,
+                    )
+
+                target = children.get(key.value, None)
+                if target is None:
+                    raise ResolutionException(
+                        f"No element with the ID-short {key.value!r} found "
+                        f"in the {type(current).__name__}",
+                        i,
+                    )
+
+            if not isinstance(target, expected_type):
+                raise ResolutionException(
+                    f"Expected the element to be of type {key.type.value}, "
+                    f"but got: {type(target).__name__}",
+                    i,
+                )
+
+            current = target
+
+        return current
+
+
+def resolve(
+    reference: aas_types.Reference, environment: aas_types.Environment
+) -> aas_types.Referable:
+    """
+    Resolve the :paramref:`reference` within the :paramref:`environment`.
+
+    The indices are built from scratch on every call. If you resolve more
+    than one reference, use a :py:class:`Resolver` instead.
+
+    :param reference: model reference to be resolved
+    :param environment: in which the :paramref:`reference` is resolved
+    :return: the referred instance
+    :raise:
+        :py:class:`ResolutionException` if the :paramref:`reference` can not be
+        resolved
+    """
+    return Resolver(environment).resolve(reference)
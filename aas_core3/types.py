@@ -105,6 +105,12 @@ ContextT = TypeVar("ContextT")
 class Class(abc.ABC):
     """Represent the most general class of an AAS model."""
 
+    # The instances are slotted to save memory, as large environments contain
+    # millions of them. The abstract classes define empty slots so that they can
+    # be combined in multiple inheritance, and each concrete class lists all its
+    # properties, including the inherited ones.
+    __slots__ = ("__weakref__",)
+
     @abc.abstractmethod
     def descend_once(self) -> Iterator["Class"]:
         """Iterate over all the instances referenced from this one."""
@@ -176,6 +182,8 @@ class HasSemantics(Class):
         then there shall be also a main semantic ID :py:attr:`semantic_id`.
     """
 
+    __slots__ = ()
+
     #: Identifier of the semantic definition of the element. It is called semantic ID
     #: of the element or also main semantic ID of the element.
     #:
@@ -210,6 +218,15 @@ class HasSemantics(Class):
 class Extension(HasSemantics):
     """Single extension of an element."""
 
+    __slots__ = (
+        "name",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "value_type",
+        "value",
+        "refers_to",
+    )
+
     #: Name of the extension.
     #:
     #: :constraint AASd-077:
@@ -329,6 +346,8 @@ class HasExtensions(Class):
         Extensions are proprietary, i.e. they do not support global interoperability.
     """
 
+    __slots__ = ()
+
     #: An extension of the element.
     extensions: Optional[List["Extension"]]
 
@@ -356,6 +375,8 @@ class Referable(HasExtensions):
         within the same name space shall be unique (case-sensitive).
     """
 
+    __slots__ = ()
+
     #: The category is a value that gives further meta information
     #: w.r.t. to the class of the element.
     #: It affects the expected existence of attributes and the applicability of
@@ -425,6 +446,8 @@ class Referable(HasExtensions):
 class Identifiable(Referable):
     """An element that has a globally unique identifier."""
 
+    __slots__ = ()
+
     #: Administrative information of an identifiable element.
     #:
     #: .. note::
@@ -476,6 +499,8 @@ class HasKind(Class):
     Default for an element is that it is representing an instance.
     """
 
+    __slots__ = ()
+
     #: Kind of the element: either type or instance.
     #:
     #: Default: :py:attr:`ModellingKind.INSTANCE`
@@ -499,6 +524,8 @@ class HasDataSpecification(Class):
     with their global ID.
     """
 
+    __slots__ = ()
+
     #: Embedded data specification.
     embedded_data_specifications: Optional[List["EmbeddedDataSpecification"]]
 
@@ -532,6 +559,14 @@ class AdministrativeInformation(HasDataSpecification):
         there is no revision neither. Revision is optional.
     """
 
+    __slots__ = (
+        "embedded_data_specifications",
+        "version",
+        "revision",
+        "creator",
+        "template_id",
+    )
+
     #: Version of the element.
     version: Optional[str]
 
@@ -652,6 +687,8 @@ class Qualifiable(Class):
             This constraint is checked at :py:class:`Submodel`.
     """
 
+    __slots__ = ()
+
     #: Additional qualification of a qualifiable element.
     #:
     #: :constraint AASd-021:
@@ -718,6 +755,16 @@ class Qualifier(HasSemantics):
         defined in :py:attr:`value_type`.
     """
 
+    __slots__ = (
+        "type",
+        "value_type",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "kind",
+        "value",
+        "value_id",
+    )
+
     #: The qualifier kind describes the kind of the qualifier that is applied to the
     #: element.
     #:
@@ -830,6 +877,20 @@ class Qualifier(HasSemantics):
 class AssetAdministrationShell(Identifiable, HasDataSpecification):
     """An asset administration shell."""
 
+    __slots__ = (
+        "id",
+        "asset_information",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "administration",
+        "embedded_data_specifications",
+        "derived_from",
+        "submodels",
+    )
+
     #: The reference to the AAS the AAS was derived from.
     derived_from: Optional["Reference"]
 
@@ -1033,6 +1094,14 @@ class AssetInformation(Class):
         defined or at least one item in :py:attr:`specific_asset_ids`.
     """
 
+    __slots__ = (
+        "asset_kind",
+        "global_asset_id",
+        "specific_asset_ids",
+        "asset_type",
+        "default_thumbnail",
+    )
+
     #: Denotes whether the Asset is of kind :py:attr:`AssetKind.TYPE` or
     #: :py:attr:`AssetKind.INSTANCE`.
     asset_kind: "AssetKind"
@@ -1151,6 +1220,11 @@ class Resource(Class):
     can represent an absolute or relative path
     """
 
+    __slots__ = (
+        "path",
+        "content_type",
+    )
+
     #: Path and name of the resource (with file extension).
     #:
     #: The path can be absolute or relative.
@@ -1248,6 +1322,14 @@ class SpecificAssetID(HasSemantics):
         i.e. :py:attr:`Reference.type` = :py:attr:`ReferenceTypes.EXTERNAL_REFERENCE`.
     """
 
+    __slots__ = (
+        "name",
+        "value",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "external_subject_id",
+    )
+
     #: Name of the identifier
     name: str
 
@@ -1349,6 +1431,22 @@ class Submodel(Identifiable, HasKind, HasSemantics, Qualifiable, HasDataSpecific
     standardized and, thus, become submodels templates.
     """
 
+    __slots__ = (
+        "id",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "administration",
+        "kind",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "submodel_elements",
+    )
+
     #: A submodel consists of zero or more submodel elements.
     submodel_elements: Optional[List["SubmodelElement"]]
 
@@ -1527,6 +1625,8 @@ class SubmodelElement(Referable, HasSemantics, Qualifiable, HasDataSpecification
         :py:class:`HasKind`) value is equal to :py:attr:`ModellingKind.TEMPLATE`.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         extensions: Optional[List["Extension"]] = None,
@@ -1556,6 +1656,20 @@ class RelationshipElement(SubmodelElement):
     being either referable (model reference) or external (global reference).
     """
 
+    __slots__ = (
+        "first",
+        "second",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+    )
+
     #: Reference to the first element in the relationship taking the role of the subject.
     first: "Reference"
 
@@ -1796,6 +1910,23 @@ class SubmodelElementList(SubmodelElement):
         the value type as specified in :py:attr:`value_type_list_element`.
     """
 
+    __slots__ = (
+        "type_value_list_element",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "order_relevant",
+        "semantic_id_list_element",
+        "value_type_list_element",
+        "value",
+    )
+
     #: Defines whether order in list is relevant. If :py:attr:`order_relevant` = ``False``
     #: then the list is representing a set or a bag.
     #:
@@ -1991,6 +2122,19 @@ class SubmodelElementCollection(SubmodelElement):
     of multiple named values. It has a fixed number of submodel elements.
     """
 
+    __slots__ = (
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "value",
+    )
+
     #: Submodel element contained in the collection.
     value: Optional[List["SubmodelElement"]]
 
@@ -2158,6 +2302,8 @@ class DataElement(SubmodelElement):
         Default: ``VARIABLE``
     """
 
+    __slots__ = ()
+
     def category_or_default(self) -> str:
         """Return the :py:attr:`category` if set or the default value otherwise."""
         return self.category if self.category else "VARIABLE"
@@ -2203,6 +2349,21 @@ class Property(DataElement):
         the value of the referenced coded value in :py:attr:`value_id`.
     """
 
+    __slots__ = (
+        "value_type",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "value",
+        "value_id",
+    )
+
     #: Data type of the value
     value_type: "DataTypeDefXSD"
 
@@ -2371,6 +2532,20 @@ class MultiLanguageProperty(DataElement):
         :py:attr:`value_id`.
     """
 
+    __slots__ = (
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "value",
+        "value_id",
+    )
+
     #: The value of the property instance.
     value: Optional[List["LangStringTextType"]]
 
@@ -2541,6 +2716,21 @@ class Range(DataElement):
     A range data element is a data element that defines a range with min and max.
     """
 
+    __slots__ = (
+        "value_type",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "min",
+        "max",
+    )
+
     #: Data type of the min und max
     value_type: "DataTypeDefXSD"
 
@@ -2696,6 +2886,19 @@ class ReferenceElement(DataElement):
     entity.
     """
 
+    __slots__ = (
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "value",
+    )
+
     #: Global reference to an external object or entity or a logical reference to
     #: another element within the same or another AAS (i.e. a model reference to
     #: a Referable).
@@ -2846,6 +3049,20 @@ class Blob(DataElement):
     source code in the value attribute.
     """
 
+    __slots__ = (
+        "content_type",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "value",
+    )
+
     #: The value of the :py:class:`Blob` instance of a blob data element.
     #:
     #: .. note::
@@ -3004,6 +3221,20 @@ class File(DataElement):
     The value is an URI that can represent an absolute or relative path.
     """
 
+    __slots__ = (
+        "content_type",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "value",
+    )
+
     #: Path and name of the referenced file (with file extension).
     #:
     #: The path can be absolute or relative.
@@ -3153,6 +3384,8 @@ class AnnotatedRelationshipElement(RelationshipElement):
     with additional data elements.
     """
 
+    __slots__ = ("annotations",)
+
     #: A data element that represents an annotation that holds for the relationship
     #: between the two elements
     annotations: Optional[List["DataElement"]]
@@ -3332,6 +3565,22 @@ class Entity(SubmodelElement):
         :py:attr:`EntityType.SELF_MANAGED_ENTITY`. They are not existing otherwise.
     """
 
+    __slots__ = (
+        "entity_type",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "statements",
+        "global_asset_id",
+        "specific_asset_ids",
+    )
+
     #: Describes statements applicable to the entity by a set of submodel elements,
     #: typically with a qualified value.
     statements: Optional[List["SubmodelElement"]]
@@ -3576,6 +3825,17 @@ class EventPayload(Class):
         removed completely in future versions of the meta-model.
     """
 
+    __slots__ = (
+        "source",
+        "observable_reference",
+        "time_stamp",
+        "source_semantic_id",
+        "observable_semantic_id",
+        "topic",
+        "subject_id",
+        "payload",
+    )
+
     #: Reference to the source event element, including identification of
     #: :py:class:`AssetAdministrationShell`, :py:class:`Submodel`,
     #: :py:class:`SubmodelElement`'s.
@@ -3725,6 +3985,8 @@ class EventElement(SubmodelElement):
         removed completely in future versions of the meta-model.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         extensions: Optional[List["Extension"]] = None,
@@ -3764,6 +4026,26 @@ class BasicEventElement(EventElement):
         removed completely in future versions of the meta-model.
     """
 
+    __slots__ = (
+        "observed",
+        "direction",
+        "state",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "message_topic",
+        "message_broker",
+        "last_update",
+        "min_interval",
+        "max_interval",
+    )
+
     #: Reference to the :py:class:`Referable`, which defines the scope of the event.
     #: Can be :py:class:`AssetAdministrationShell`, :py:class:`Submodel`, or
     #: :py:class:`SubmodelElement`.
@@ -3992,6 +4274,21 @@ class Operation(SubmodelElement):
         and :py:attr:`inoutput_variables` shall be unique.
     """
 
+    __slots__ = (
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+        "input_variables",
+        "output_variables",
+        "inoutput_variables",
+    )
+
     #: Input parameter of the operation.
     input_variables: Optional[List["OperationVariable"]]
 
@@ -4184,6 +4481,8 @@ class OperationVariable(Class):
     and/or output variable of an operation.
     """
 
+    __slots__ = ("value",)
+
     #: Describes an argument or result of an operation via a submodel element
     value: "SubmodelElement"
 
@@ -4247,6 +4546,18 @@ class Capability(SubmodelElement):
         Thus, reasoning on capabilities is enabled.
     """
 
+    __slots__ = (
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "semantic_id",
+        "supplemental_semantic_ids",
+        "qualifiers",
+        "embedded_data_specifications",
+    )
+
     def descend_once(self) -> Iterator[Class]:
         """
         Iterate over the instances referenced from this instance.
@@ -4458,6 +4769,18 @@ class ConceptDescription(Identifiable, HasDataSpecification):
         the :py:attr:`DataSpecificationIEC61360.value` shall be set.
     """
 
+    __slots__ = (
+        "id",
+        "extensions",
+        "category",
+        "id_short",
+        "display_name",
+        "description",
+        "administration",
+        "embedded_data_specifications",
+        "is_case_of",
+    )
+
     #: Reference to an external definition the concept is compatible to or was derived
     #: from.
     #:
@@ -4699,6 +5022,12 @@ class Reference(Class):
         number denoting the position in the array of the submodel element list.
     """
 
+    __slots__ = (
+        "type",
+        "keys",
+        "referred_semantic_id",
+    )
+
     #: Type of the reference.
     #:
     #: Denotes, whether reference is an external reference or a model reference.
@@ -4785,6 +5114,11 @@ class Reference(Class):
 class Key(Class):
     """A key is a reference to an element by its ID."""
 
+    __slots__ = (
+        "type",
+        "value",
+    )
+
     #: Denotes which kind of entity is referenced.
     #:
     #: In case :py:attr:`type` = :py:attr:`KeyTypes.GLOBAL_REFERENCE`,
@@ -5009,6 +5343,8 @@ class DataTypeDefXSD(enum.Enum):
 class AbstractLangString(Class):
     """Strings with language tags"""
 
+    __slots__ = ()
+
     #: Language tag conforming to BCP 47
     language: str
 
@@ -5026,6 +5362,11 @@ class LangStringNameType(AbstractLangString):
     String with length 128 maximum and minimum 1 characters and with language tags
     """
 
+    __slots__ = (
+        "language",
+        "text",
+    )
+
     def descend_once(self) -> Iterator[Class]:
         """
         Iterate over the instances referenced from this instance.
@@ -5088,6 +5429,11 @@ class LangStringTextType(AbstractLangString):
     String with length 1023 maximum and minimum 1 characters and with language tags
     """
 
+    __slots__ = (
+        "language",
+        "text",
+    )
+
     def descend_once(self) -> Iterator[Class]:
         """
         Iterate over the instances referenced from this instance.
@@ -5156,6 +5502,12 @@ class Environment(Class):
         shall be no element with the same identifier in two different files.
     """
 
+    __slots__ = (
+        "asset_administration_shells",
+        "submodels",
+        "concept_descriptions",
+    )
+
     #: Asset administration shell
     asset_administration_shells: Optional[List["AssetAdministrationShell"]]
 
@@ -5276,10 +5628,17 @@ class DataSpecificationContent(Class):
         https://admin-shell.io/DataSpecificationTemplates/DataSpecificationIEC61360/3/0
     """
 
+    __slots__ = ()
+
 
 class EmbeddedDataSpecification(Class):
     """Embed the content of a data specification."""
 
+    __slots__ = (
+        "data_specification",
+        "data_specification_content",
+    )
+
     #: Reference to the data specification
     data_specification: "Reference"
 
@@ -5491,6 +5850,13 @@ class LevelType(Class):
         in a unique way. Please refer to the specification.
     """
 
+    __slots__ = (
+        "min",
+        "nom",
+        "typ",
+        "max",
+    )
+
     #: Minimum of the value
     min: bool
 
@@ -5569,6 +5935,11 @@ class ValueReferencePair(Class):
     defining its semantic.
     """
 
+    __slots__ = (
+        "value",
+        "value_id",
+    )
+
     #: The value of the referenced concept definition of the value in :py:attr:`value_id`.
     value: str
 
@@ -5632,6 +6003,8 @@ class ValueReferencePair(Class):
 class ValueList(Class):
     """A set of value reference pairs."""
 
+    __slots__ = ("value_reference_pairs",)
+
     #: A pair of a value together with its global unique id.
     value_reference_pairs: List["ValueReferencePair"]
 
@@ -5694,6 +6067,11 @@ class LangStringPreferredNameTypeIEC61360(AbstractLangString):
         It is advised to keep the length of the name limited to 35 characters.
     """
 
+    __slots__ = (
+        "language",
+        "text",
+    )
+
     def descend_once(self) -> Iterator[Class]:
         """
         Iterate over the instances referenced from this instance.
@@ -5760,6 +6138,11 @@ class LangStringShortNameTypeIEC61360(AbstractLangString):
     String with length 18 maximum and minimum 1 characters and with language tags
     """
 
+    __slots__ = (
+        "language",
+        "text",
+    )
+
     def descend_once(self) -> Iterator[Class]:
         """
         Iterate over the instances referenced from this instance.
@@ -5824,6 +6207,11 @@ class LangStringDefinitionTypeIEC61360(AbstractLangString):
     String with length 1023 maximum and minimum 1 characters and with language tags
     """
 
+    __slots__ = (
+        "language",
+        "text",
+    )
+
     def descend_once(self) -> Iterator[Class]:
         """
         Iterate over the instances referenced from this instance.
@@ -5938,6 +6326,21 @@ class DataSpecificationIEC61360(DataSpecificationContent):
         :py:attr:`unit_id` shall be defined.
     """
 
+    __slots__ = (
+        "preferred_name",
+        "short_name",
+        "unit",
+        "unit_id",
+        "source_of_definition",
+        "symbol",
+        "data_type",
+        "definition",
+        "value_format",
+        "value_list",
+        "value",
+        "level_type",
+    )
+
     #: Preferred name
     #:
     #: .. note::
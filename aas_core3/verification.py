@@ -93,19 +93,23 @@ class Path:
 
     def __init__(self) -> None:
         """Initialize as an empty path."""
-        self._segments = []  # type: List[Segment]
+        # The segments are prepended once per nesting level while an error
+        # propagates up the call stack. We store them in reverse so that
+        # a prepend is an amortized O(1) append instead of an O(n) insert,
+        # and only materialize the actual order on access.
+        self._reversed_segments = []  # type: List[Segment]
 
     @property
     def segments(self) -> Sequence[Segment]:
         """Get the segments of the path."""
-        return self._segments
+        return self._reversed_segments[::-1]
 
     def _prepend(self, segment: Segment) -> None:
         """Insert the :paramref:`segment` in front of other segments."""
-        self._segments.insert(0, segment)
+        self._reversed_segments.append(segment)
 
     def __str__(self) -> str:
-        return "".join(str(segment) for segment in self._segments)
+        return "".join(str(segment) for segment in reversed(self._reversed_segments))
 
 
 class Error:
@@ -1498,6 +1502,15 @@ def value_consistent_with_xsd_type(
     return _DATA_TYPE_DEF_XSD_TO_VALUE_CONSISTENCY[value_type](value)
 
 
+#: Verify a string against the constraints of a constrained primitive type
+StringVerifier = Callable[[str], Iterator[Error]]
+
+
+def _verify_directly(verifier: StringVerifier, that: str) -> Iterator[Error]:
+    """Verify :paramref:`that` with :paramref:`verifier` without any caching."""
+    return verifier(that)
+
+
 def is_model_reference_to(
     reference: aas_types.Reference, expected_type: aas_types.KeyTypes
 ) -> bool:
@@ -1900,6 +1913,26 @@ def is_bcp_47_for_english(text: str) -> bool:
 
 
 class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
+    def __init__(
+        self,
+        value_consistency: Callable[
+            [str, aas_types.DataTypeDefXSD], bool
+        ] = value_consistent_with_xsd_type,
+        verify_string: Callable[
+            [StringVerifier, str], Iterator[Error]
+        ] = _verify_directly,
+    ) -> None:
+        """
+        Initialize with the given checks.
+
+        :param value_consistency: check to be used for the XSD value consistency
+        :param verify_string:
+            how to verify a string with the verifier of its constrained
+            primitive type
+        """
+        self._value_consistent_with_xsd_type = value_consistency
+        self._verify_string = verify_string
+
     # noinspection PyMethodMayBeStatic
     def transform_extension(self, that: aas_types.Extension) -> Iterator[Error]:
         if not (
@@ -1925,7 +1958,9 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
 
         if not (
             not (that.value is not None)
-            or value_consistent_with_xsd_type(that.value, that.value_type_or_default())
+            or self._value_consistent_with_xsd_type(
+                that.value, that.value_type_or_default()
+            )
         ):
             yield Error("The value must match the value type.")
 
@@ -1943,12 +1978,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     )
                     yield error
 
-        for error in verify_name_type(that.name):
+        for error in self._verify_string(verify_name_type, that.name):
             error.path._prepend(PropertySegment(that, "name"))
             yield error
 
         if that.value is not None:
-            for error in verify_value_data_type(that.value):
+            for error in self._verify_string(verify_value_data_type, that.value):
                 error.path._prepend(PropertySegment(that, "value"))
                 yield error
 
@@ -1992,12 +2027,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.version is not None:
-            for error in verify_version_type(that.version):
+            for error in self._verify_string(verify_version_type, that.version):
                 error.path._prepend(PropertySegment(that, "version"))
                 yield error
 
         if that.revision is not None:
-            for error in verify_revision_type(that.revision):
+            for error in self._verify_string(verify_revision_type, that.revision):
                 error.path._prepend(PropertySegment(that, "revision"))
                 yield error
 
@@ -2007,7 +2042,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 yield error
 
         if that.template_id is not None:
-            for error in verify_identifier(that.template_id):
+            for error in self._verify_string(verify_identifier, that.template_id):
                 error.path._prepend(PropertySegment(that, "template_id"))
                 yield error
 
@@ -2033,7 +2068,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
 
         if not (
             not (that.value is not None)
-            or value_consistent_with_xsd_type(that.value, that.value_type)
+            or self._value_consistent_with_xsd_type(that.value, that.value_type)
         ):
             yield Error(
                 "Constraint AASd-020: The value shall be consistent to "
@@ -2054,12 +2089,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     )
                     yield error
 
-        for error in verify_qualifier_type(that.type):
+        for error in self._verify_string(verify_qualifier_type, that.type):
             error.path._prepend(PropertySegment(that, "type"))
             yield error
 
         if that.value is not None:
-            for error in verify_value_data_type(that.value):
+            for error in self._verify_string(verify_value_data_type, that.value):
                 error.path._prepend(PropertySegment(that, "value"))
                 yield error
 
@@ -2148,12 +2183,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -2176,7 +2211,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 error.path._prepend(PropertySegment(that, "administration"))
                 yield error
 
-        for error in verify_identifier(that.id):
+        for error in self._verify_string(verify_identifier, that.id):
             error.path._prepend(PropertySegment(that, "id"))
             yield error
 
@@ -2265,7 +2300,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
             )
 
         if that.global_asset_id is not None:
-            for error in verify_identifier(that.global_asset_id):
+            for error in self._verify_string(verify_identifier, that.global_asset_id):
                 error.path._prepend(PropertySegment(that, "global_asset_id"))
                 yield error
 
@@ -2277,7 +2312,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.asset_type is not None:
-            for error in verify_identifier(that.asset_type):
+            for error in self._verify_string(verify_identifier, that.asset_type):
                 error.path._prepend(PropertySegment(that, "asset_type"))
                 yield error
 
@@ -2288,12 +2323,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
 
     # noinspection PyMethodMayBeStatic
     def transform_resource(self, that: aas_types.Resource) -> Iterator[Error]:
-        for error in verify_path_type(that.path):
+        for error in self._verify_string(verify_path_type, that.path):
             error.path._prepend(PropertySegment(that, "path"))
             yield error
 
         if that.content_type is not None:
-            for error in verify_content_type(that.content_type):
+            for error in self._verify_string(verify_content_type, that.content_type):
                 error.path._prepend(PropertySegment(that, "content_type"))
                 yield error
 
@@ -2345,11 +2380,11 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     )
                     yield error
 
-        for error in verify_label_type(that.name):
+        for error in self._verify_string(verify_label_type, that.name):
             error.path._prepend(PropertySegment(that, "name"))
             yield error
 
-        for error in verify_identifier(that.value):
+        for error in self._verify_string(verify_identifier, that.value):
             error.path._prepend(PropertySegment(that, "value"))
             yield error
 
@@ -2519,12 +2554,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -2547,7 +2582,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 error.path._prepend(PropertySegment(that, "administration"))
                 yield error
 
-        for error in verify_identifier(that.id):
+        for error in self._verify_string(verify_identifier, that.id):
             error.path._prepend(PropertySegment(that, "id"))
             yield error
 
@@ -2679,12 +2714,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -2919,12 +2954,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -3090,12 +3125,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -3241,7 +3276,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
 
         if not (
             not (that.value is not None)
-            or value_consistent_with_xsd_type(that.value, that.value_type)
+            or self._value_consistent_with_xsd_type(that.value, that.value_type)
         ):
             yield Error("Value must be consistent with the value type.")
 
@@ -3253,12 +3288,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -3311,7 +3346,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.value is not None:
-            for error in verify_value_data_type(that.value):
+            for error in self._verify_string(verify_value_data_type, that.value):
                 error.path._prepend(PropertySegment(that, "value"))
                 yield error
 
@@ -3424,12 +3459,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -3580,13 +3615,13 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
 
         if not (
             not (that.max is not None)
-            or value_consistent_with_xsd_type(that.max, that.value_type)
+            or self._value_consistent_with_xsd_type(that.max, that.value_type)
         ):
             yield Error("Max must be consistent with the value type.")
 
         if not (
             not (that.min is not None)
-            or value_consistent_with_xsd_type(that.min, that.value_type)
+            or self._value_consistent_with_xsd_type(that.min, that.value_type)
         ):
             yield Error("Min must be consistent with the value type.")
 
@@ -3598,12 +3633,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -3656,12 +3691,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.min is not None:
-            for error in verify_value_data_type(that.min):
+            for error in self._verify_string(verify_value_data_type, that.min):
                 error.path._prepend(PropertySegment(that, "min"))
                 yield error
 
         if that.max is not None:
-            for error in verify_value_data_type(that.max):
+            for error in self._verify_string(verify_value_data_type, that.max):
                 error.path._prepend(PropertySegment(that, "max"))
                 yield error
 
@@ -3760,12 +3795,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -3915,12 +3950,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -3977,7 +4012,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 error.path._prepend(PropertySegment(that, "value"))
                 yield error
 
-        for error in verify_content_type(that.content_type):
+        for error in self._verify_string(verify_content_type, that.content_type):
             error.path._prepend(PropertySegment(that, "content_type"))
             yield error
 
@@ -4074,12 +4109,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -4132,11 +4167,11 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.value is not None:
-            for error in verify_path_type(that.value):
+            for error in self._verify_string(verify_path_type, that.value):
                 error.path._prepend(PropertySegment(that, "value"))
                 yield error
 
-        for error in verify_content_type(that.content_type):
+        for error in self._verify_string(verify_content_type, that.content_type):
             error.path._prepend(PropertySegment(that, "content_type"))
             yield error
 
@@ -4241,12 +4276,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -4458,12 +4493,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -4523,7 +4558,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.global_asset_id is not None:
-            for error in verify_identifier(that.global_asset_id):
+            for error in self._verify_string(verify_identifier, that.global_asset_id):
                 error.path._prepend(PropertySegment(that, "global_asset_id"))
                 yield error
 
@@ -4572,7 +4607,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 yield error
 
         if that.topic is not None:
-            for error in verify_message_topic_type(that.topic):
+            for error in self._verify_string(verify_message_topic_type, that.topic):
                 error.path._prepend(PropertySegment(that, "topic"))
                 yield error
 
@@ -4581,7 +4616,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 error.path._prepend(PropertySegment(that, "subject_id"))
                 yield error
 
-        for error in verify_date_time_utc(that.time_stamp):
+        for error in self._verify_string(verify_date_time_utc, that.time_stamp):
             error.path._prepend(PropertySegment(that, "time_stamp"))
             yield error
 
@@ -4690,12 +4725,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -4752,7 +4787,9 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
             yield error
 
         if that.message_topic is not None:
-            for error in verify_message_topic_type(that.message_topic):
+            for error in self._verify_string(
+                verify_message_topic_type, that.message_topic
+            ):
                 error.path._prepend(PropertySegment(that, "message_topic"))
                 yield error
 
@@ -4762,17 +4799,17 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 yield error
 
         if that.last_update is not None:
-            for error in verify_date_time_utc(that.last_update):
+            for error in self._verify_string(verify_date_time_utc, that.last_update):
                 error.path._prepend(PropertySegment(that, "last_update"))
                 yield error
 
         if that.min_interval is not None:
-            for error in verify_duration(that.min_interval):
+            for error in self._verify_string(verify_duration, that.min_interval):
                 error.path._prepend(PropertySegment(that, "min_interval"))
                 yield error
 
         if that.max_interval is not None:
-            for error in verify_duration(that.max_interval):
+            for error in self._verify_string(verify_duration, that.max_interval):
                 error.path._prepend(PropertySegment(that, "max_interval"))
                 yield error
 
@@ -4893,12 +4930,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -5074,12 +5111,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -5288,12 +5325,12 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.category is not None:
-            for error in verify_name_type(that.category):
+            for error in self._verify_string(verify_name_type, that.category):
                 error.path._prepend(PropertySegment(that, "category"))
                 yield error
 
         if that.id_short is not None:
-            for error in verify_id_short_type(that.id_short):
+            for error in self._verify_string(verify_id_short_type, that.id_short):
                 error.path._prepend(PropertySegment(that, "id_short"))
                 yield error
 
@@ -5316,7 +5353,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 error.path._prepend(PropertySegment(that, "administration"))
                 yield error
 
-        for error in verify_identifier(that.id):
+        for error in self._verify_string(verify_identifier, that.id):
             error.path._prepend(PropertySegment(that, "id"))
             yield error
 
@@ -5501,7 +5538,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
 
     # noinspection PyMethodMayBeStatic
     def transform_key(self, that: aas_types.Key) -> Iterator[Error]:
-        for error in verify_identifier(that.value):
+        for error in self._verify_string(verify_identifier, that.value):
             error.path._prepend(PropertySegment(that, "value"))
             yield error
 
@@ -5512,11 +5549,13 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
         if not (len(that.text) <= 128):
             yield Error("String shall have a maximum length of 128 characters.")
 
-        for error in verify_bcp_47_language_tag(that.language):
+        for error in self._verify_string(verify_bcp_47_language_tag, that.language):
             error.path._prepend(PropertySegment(that, "language"))
             yield error
 
-        for error in verify_non_empty_xml_serializable_string(that.text):
+        for error in self._verify_string(
+            verify_non_empty_xml_serializable_string, that.text
+        ):
             error.path._prepend(PropertySegment(that, "text"))
             yield error
 
@@ -5527,11 +5566,13 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
         if not (len(that.text) <= 1023):
             yield Error("String shall have a maximum length of 1023 characters.")
 
-        for error in verify_bcp_47_language_tag(that.language):
+        for error in self._verify_string(verify_bcp_47_language_tag, that.language):
             error.path._prepend(PropertySegment(that, "language"))
             yield error
 
-        for error in verify_non_empty_xml_serializable_string(that.text):
+        for error in self._verify_string(
+            verify_non_empty_xml_serializable_string, that.text
+        ):
             error.path._prepend(PropertySegment(that, "text"))
             yield error
 
@@ -5608,7 +5649,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
     def transform_value_reference_pair(
         self, that: aas_types.ValueReferencePair
     ) -> Iterator[Error]:
-        for error in verify_value_type_iec_61360(that.value):
+        for error in self._verify_string(verify_value_type_iec_61360, that.value):
             error.path._prepend(PropertySegment(that, "value"))
             yield error
 
@@ -5634,11 +5675,13 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
         if not (len(that.text) <= 255):
             yield Error("String shall have a maximum length of 255 characters.")
 
-        for error in verify_bcp_47_language_tag(that.language):
+        for error in self._verify_string(verify_bcp_47_language_tag, that.language):
             error.path._prepend(PropertySegment(that, "language"))
             yield error
 
-        for error in verify_non_empty_xml_serializable_string(that.text):
+        for error in self._verify_string(
+            verify_non_empty_xml_serializable_string, that.text
+        ):
             error.path._prepend(PropertySegment(that, "text"))
             yield error
 
@@ -5649,11 +5692,13 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
         if not (len(that.text) <= 18):
             yield Error("String shall have a maximum length of 18 characters.")
 
-        for error in verify_bcp_47_language_tag(that.language):
+        for error in self._verify_string(verify_bcp_47_language_tag, that.language):
             error.path._prepend(PropertySegment(that, "language"))
             yield error
 
-        for error in verify_non_empty_xml_serializable_string(that.text):
+        for error in self._verify_string(
+            verify_non_empty_xml_serializable_string, that.text
+        ):
             error.path._prepend(PropertySegment(that, "text"))
             yield error
 
@@ -5664,11 +5709,13 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
         if not (len(that.text) <= 1023):
             yield Error("String shall have a maximum length of 1023 characters.")
 
-        for error in verify_bcp_47_language_tag(that.language):
+        for error in self._verify_string(verify_bcp_47_language_tag, that.language):
             error.path._prepend(PropertySegment(that, "language"))
             yield error
 
-        for error in verify_non_empty_xml_serializable_string(that.text):
+        for error in self._verify_string(
+            verify_non_empty_xml_serializable_string, that.text
+        ):
             error.path._prepend(PropertySegment(that, "text"))
             yield error
 
@@ -5746,7 +5793,9 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.unit is not None:
-            for error in verify_non_empty_xml_serializable_string(that.unit):
+            for error in self._verify_string(
+                verify_non_empty_xml_serializable_string, that.unit
+            ):
                 error.path._prepend(PropertySegment(that, "unit"))
                 yield error
 
@@ -5756,14 +5805,16 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 yield error
 
         if that.source_of_definition is not None:
-            for error in verify_non_empty_xml_serializable_string(
-                that.source_of_definition
+            for error in self._verify_string(
+                verify_non_empty_xml_serializable_string, that.source_of_definition
             ):
                 error.path._prepend(PropertySegment(that, "source_of_definition"))
                 yield error
 
         if that.symbol is not None:
-            for error in verify_non_empty_xml_serializable_string(that.symbol):
+            for error in self._verify_string(
+                verify_non_empty_xml_serializable_string, that.symbol
+            ):
                 error.path._prepend(PropertySegment(that, "symbol"))
                 yield error
 
@@ -5775,7 +5826,9 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                     yield error
 
         if that.value_format is not None:
-            for error in verify_non_empty_xml_serializable_string(that.value_format):
+            for error in self._verify_string(
+                verify_non_empty_xml_serializable_string, that.value_format
+            ):
                 error.path._prepend(PropertySegment(that, "value_format"))
                 yield error
 
@@ -5785,7 +5838,7 @@ class _Transformer(aas_types.AbstractTransformer[Iterator[Error]]):
                 yield error
 
         if that.value is not None:
-            for error in verify_value_type_iec_61360(that.value):
+            for error in self._verify_string(verify_value_type_iec_61360, that.value):
                 error.path._prepend(PropertySegment(that, "value"))
                 yield error
 
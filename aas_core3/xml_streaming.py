@@ -0,0 +1,471 @@
+"""
+Read and write environments as XML incrementally.
+
+:py:func:`aas_core3.xmlization.environment_from_stream` reads the document in
+one pass, but builds the whole environment in memory. The functions of this
+module process the document one identifiable at a time instead, so that
+the memory is bounded by the largest identifiable rather than by the size of
+the document. Conversely, :py:class:`EnvironmentWriter` writes the identifiables
+one by one as they are produced.
+
+The parameters ``has_iterparse`` and ``backend`` are the same as in
+:py:mod:`aas_core3.xmlization`. If you do not trust the source, please consider
+using `defusedxml.ElementTree`_. If you set ``backend`` to ``"lxml"``, the XML is
+parsed with `lxml`_, which needs to be installed separately.
+
+.. _defusedxml.ElementTree: https://pypi.org/project/defusedxml/#defusedxml-elementtree
+
+.. _lxml: https://lxml.de/
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.xml_streaming as aas_xml_streaming
+
+    with open("some-huge-environment.xml", "rt", encoding="utf-8") as fid:
+        for identifiable in aas_xml_streaming.iter_identifiables_from_stream(fid):
+            print(identifiable.id)
+"""
+
+import xml.etree.ElementTree
+from types import TracebackType
+from typing import (
+    Callable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Type,
+)
+
+import aas_core3.interning as aas_interning
+import aas_core3.types as aas_types
+import aas_core3.xmlization as aas_xmlization
+
+
+_READ_ITEM_AS_ELEMENT_DISPATCH_FOR_ENVIRONMENT: Mapping[
+    str,
+    Callable[
+        [aas_xmlization.Element, Iterator[Tuple[str, aas_xmlization.Element]]],
+        aas_types.Identifiable,
+    ],
+] = aas_xmlization._qualify_tags(
+    {
+        "assetAdministrationShells": aas_xmlization._read_asset_administration_shell_as_element,
+        "submodels": aas_xmlization._read_submodel_as_element,
+        "conceptDescriptions": aas_xmlization._read_concept_description_as_element,
+    }
+)
+assert all(
+    property_name in aas_xmlization._READ_AND_SET_DISPATCH_FOR_ENVIRONMENT
+    for property_name in _READ_ITEM_AS_ELEMENT_DISPATCH_FOR_ENVIRONMENT
+)
+
+
+def _iter_identifiables_of_environment_list(
+    element: aas_xmlization.Element,
+    iterator: Iterator[Tuple[str, aas_xmlization.Element]],
+    read_as_element: Callable[
+        [aas_xmlization.Element, Iterator[Tuple[str, aas_xmlization.Element]]],
+        aas_types.Identifiable,
+    ],
+) -> Iterator[aas_types.Identifiable]:
+    """
+    Read the items of a list property of :py:class:`aas_core3.types.Environment` one by one.
+
+    The end element corresponding to the :paramref:`element` will be
+    read as well.
+
+    :param element: start element of the list
+    :param iterator:
+        Input stream of ``(event, element)`` coming from
+        :py:func:`xml.etree.ElementTree.iterparse` with the argument
+        ``events=["start", "end"]``
+    :param read_as_element: function to read an item
+    :raise: :py:class:`aas_core3.xmlization.DeserializationException` if unexpected input
+    :yield: parsed items
+    """
+    if element.text is not None and len(element.text.strip()) != 0:
+        raise aas_xmlization.DeserializationException(
+            f"Expected only item elements and whitespace text, "
+            f"but got text: {element.text!r}"
+        )
+
+    item_i = 0
+
+    while True:
+        next_event_element = next(iterator, None)
+        if next_event_element is None:
+            raise aas_xmlization.DeserializationException(
+                "Expected one or more items from a list or the end element, "
+                "but got end-of-input"
+            )
+
+        next_event, next_element = next_event_element
+        if next_event == "end" and next_element.tag == element.tag:
+            # We reached the end of the list.
+            break
+
+        if next_event != "start":
+            raise aas_xmlization.DeserializationException(
+                "Expected a start element corresponding to an item, "
+                f"but got event {next_event!r} and element {next_element.tag!r}"
+            )
+
+        try:
+            item = read_as_element(next_element, iterator)
+        except aas_xmlization.DeserializationException as exception:
+            exception.path._prepend(aas_xmlization.IndexSegment(next_element, item_i))
+            raise
+
+        # The item element has been cleared already, but it would still linger
+        # as an empty child of the list element. We drop it so that the memory
+        # does not grow with the number of items. The text of the list element
+        # has been checked above, so we lose nothing here.
+        element.clear()
+
+        yield item
+        item_i += 1
+
+
+def _iter_identifiables_of_environment_as_element(
+    element: aas_xmlization.Element,
+    iterator: Iterator[Tuple[str, aas_xmlization.Element]],
+) -> Iterator[aas_types.Identifiable]:
+    """
+    Read the identifiables of an instance of :py:class:`aas_core3.types.Environment`
+    one by one from :paramref:`iterator`, including the end element.
+
+    :param element: start element
+    :param iterator:
+        Input stream of ``(event, element)`` coming from
+        :py:func:`xml.etree.ElementTree.iterparse` with the argument
+        ``events=["start", "end"]``
+    :raise: :py:class:`aas_core3.xmlization.DeserializationException` if unexpected input
+    :yield: parsed identifiables
+    """
+    if element.tag != aas_xmlization._TAG_ENVIRONMENT:
+        tag_wo_ns = aas_xmlization._parse_element_tag(element)
+        raise aas_xmlization.DeserializationException(
+            f"Expected the element with the tag 'environment', "
+            f"but got tag: {tag_wo_ns}"
+        )
+
+    if element.text is not None and len(element.text.strip()) != 0:
+        raise aas_xmlization.DeserializationException(
+            f"Expected only XML elements representing the properties and whitespace text, "
+            f"but got text: {element.text!r}"
+        )
+
+    aas_xmlization._raise_if_has_tail_or_attrib(element)
+
+    while True:
+        next_event_element = next(iterator, None)
+        if next_event_element is None:
+            raise aas_xmlization.DeserializationException(
+                "Expected one or more XML-encoded properties or the end element, "
+                "but got the end-of-input"
+            )
+
+        next_event, next_element = next_event_element
+        if next_event == "end" and next_element.tag == element.tag:
+            # We reached the end element enclosing the sequence.
+            break
+
+        if next_event != "start":
+            raise aas_xmlization.DeserializationException(
+                "Expected a start element corresponding to a property, "
+                f"but got event {next_event!r} and element {next_element.tag!r}"
+            )
+
+        read_as_element = _READ_ITEM_AS_ELEMENT_DISPATCH_FOR_ENVIRONMENT.get(
+            next_element.tag, None
+        )
+        if read_as_element is None:
+            try:
+                tag_wo_ns = aas_xmlization._parse_element_tag(next_element)
+            except aas_xmlization.DeserializationException as exception:
+                exception.path._prepend(aas_xmlization.ElementSegment(next_element))
+                raise
+
+            an_exception = aas_xmlization.DeserializationException(
+                f"Expected an element representing a property, "
+                f"but got an element with unexpected tag: {tag_wo_ns!r}"
+            )
+            an_exception.path._prepend(aas_xmlization.ElementSegment(next_element))
+            raise an_exception
+
+        try:
+            yield from _iter_identifiables_of_environment_list(
+                next_element, iterator, read_as_element
+            )
+        except aas_xmlization.DeserializationException as exception:
+            exception.path._prepend(aas_xmlization.ElementSegment(next_element))
+            raise
+
+
+def iter_identifiables_from_iterparse(
+    iterator: Iterator[Tuple[str, aas_xmlization.Element]]
+) -> Iterator[aas_types.Identifiable]:
+    """
+    Read the identifiables of an instance of :py:class:`aas_core3.types.Environment`
+    one by one from the :paramref:`iterator`.
+
+    Each identifiable is yielded as soon as its end element has been read.
+    The list elements of the environment are cleared after every item so that
+    the memory does not grow with the number of identifiables.
+
+    Example usage:
+
+    .. code-block::
+
+        import pathlib
+        import xml.etree.ElementTree as ET
+
+        import aas_core3.xml_streaming as aas_xml_streaming
+
+        path = pathlib.Path(...)
+        with path.open("rt") as fid:
+            iterator = ET.iterparse(
+                source=fid,
+                events=['start', 'end']
+            )
+            for identifiable in aas_xml_streaming.iter_identifiables_from_iterparse(
+                iterator
+            ):
+                # Do something with the ``identifiable``
+                ...
+
+    :param iterator:
+        Input stream of ``(event, element)`` coming from
+        :py:func:`xml.etree.ElementTree.iterparse` with the argument
+        ``events=["start", "end"]``
+    :raise: :py:class:`aas_core3.xmlization.DeserializationException` if unexpected input
+    :yield:
+        Asset administration shells, submodels and concept descriptions
+        in the order of the document
+    """
+    next_event_element = next(iterator, None)
+    if next_event_element is None:
+        raise aas_xmlization.DeserializationException(
+            # fmt: off
+            "Expected the start element for Environment, "
+            "but got the end-of-input"
+            # fmt: on
+        )
+
+    next_event, next_element = next_event_element
+    if next_event != "start":
+        raise aas_xmlization.DeserializationException(
+            f"Expected the start element for Environment, "
+            f"but got event {next_event!r} and element {next_element.tag!r}"
+        )
+
+    try:
+        yield from _iter_identifiables_of_environment_as_element(next_element, iterator)
+    except aas_xmlization.DeserializationException as exception:
+        exception.path._prepend(aas_xmlization.ElementSegment(next_element))
+        raise exception
+
+
+def iter_identifiables_from_stream(
+    stream: TextIO,
+    has_iterparse: aas_xmlization.HasIterparse = xml.etree.ElementTree,
+    backend: str = "stdlib",
+    interner: Optional[aas_interning.Interner] = None,
+    string_interner: Optional[aas_interning.StringInterner] = None,
+) -> Iterator[aas_types.Identifiable]:
+    """
+    Read the identifiables of an instance of :py:class:`aas_core3.types.Environment`
+    one by one from the :paramref:`stream`.
+
+    Unlike :py:func:`aas_core3.xmlization.environment_from_stream`, the environment is never built
+    as a whole, so the memory is bounded by the largest identifiable rather than
+    by the size of the document.
+
+    Example usage:
+
+    .. code-block::
+
+        import aas_core3.xml_streaming as aas_xml_streaming
+
+        with open_some_stream_over_network(...) as stream:
+            for identifiable in aas_xml_streaming.iter_identifiables_from_stream(
+                stream
+            ):
+                # Do something with the ``identifiable``
+                ...
+
+    :param stream:
+        representing an instance of
+        :py:class:`aas_core3.types.Environment` in XML
+    :param has_iterparse:
+        Module containing ``iterparse`` function.
+
+        Default is to use :py:mod:`xml.etree.ElementTree` from the standard
+        library. If you have to deal with malicious input, consider using
+        a library such as `defusedxml.ElementTree`_.
+    :param backend:
+        Parser to use, either ``"stdlib"`` for :paramref:`has_iterparse`,
+        or ``"lxml"`` for `lxml`_, which needs to be installed separately.
+        The processed elements are freed with both backends.
+    :param interner:
+        if given, the structurally equal references are shared among
+        the identifiables, see :py:mod:`aas_core3.interning`
+    :param string_interner:
+        if given, the equal strings of the selected properties are shared
+        among the identifiables, see :py:class:`aas_core3.interning.StringInterner`
+    :raise: :py:class:`aas_core3.xmlization.DeserializationException` if unexpected input
+    :yield:
+        Asset administration shells, submodels and concept descriptions
+        in the order of the document
+    """
+    for identifiable in iter_identifiables_from_iterparse(
+        aas_xmlization._iterparse(stream, has_iterparse, backend)
+    ):
+        if interner is not None:
+            interner.intern(identifiable)
+
+        if string_interner is not None:
+            string_interner.intern(identifiable)
+
+        yield identifiable
+
+
+#: Properties of :py:class:`aas_core3.types.Environment` in the order of serialization,
+#: with the types of their items
+_ENVIRONMENT_SECTIONS: Sequence[Tuple[str, Type[aas_types.Identifiable]]] = (
+    ("assetAdministrationShells", aas_types.AssetAdministrationShell),
+    ("submodels", aas_types.Submodel),
+    ("conceptDescriptions", aas_types.ConceptDescription),
+)
+
+
+class EnvironmentWriter:
+    """
+    Write an instance of :py:class:`aas_core3.types.Environment` incrementally to a stream.
+
+    The identifiables are passed in one by one and written immediately, so that
+    they need not be kept in memory all at once. The output is the same as with
+    :py:func:`aas_core3.xmlization.write` applied on the environment containing the written
+    identifiables.
+
+    The asset administration shells need to be written first, followed by
+    the submodels and, finally, the concept descriptions. This is the order in
+    which the properties of an environment are serialized.
+
+    Example usage:
+
+    .. code-block::
+
+        import pathlib
+
+        import aas_core3.xml_streaming as aas_xml_streaming
+
+        pth = pathlib.Path(...)
+        with pth.open("wt") as fid:
+            with aas_xml_streaming.EnvironmentWriter(fid) as writer:
+                for submodel in produce_submodels_lazily(...):
+                    writer.write(submodel)
+    """
+
+    def __init__(self, stream: TextIO, flush_threshold: int = 4096) -> None:
+        """
+        Initialize to write to :paramref:`stream`.
+
+        Nothing is written until the first identifiable, or until the writer is
+        closed.
+
+        :param stream: where to write to
+        :param flush_threshold:
+            number of text fragments to buffer before writing them to
+            the :paramref:`stream` in a single call
+        :raise: :py:class:`ValueError` if :paramref:`flush_threshold` is not positive
+        """
+        self._serializer = aas_xmlization._Serializer(stream, flush_threshold)
+
+        # The section is an index in ``_ENVIRONMENT_SECTIONS`` whose list element
+        # is currently open, or -1 if the environment has not been started yet.
+        self._section = -1
+        self._closed = False
+
+    def write(self, identifiable: aas_types.Identifiable) -> None:
+        """
+        Write the :paramref:`identifiable` as an item of the environment.
+
+        :param identifiable:
+            asset administration shell, submodel or concept description
+        :raise:
+            :py:class:`ValueError` if the writer has been closed, or
+            if :paramref:`identifiable` comes out of order
+        """
+        if self._closed:
+            raise ValueError("The environment writer has been already closed")
+
+        for section, (name, item_type) in enumerate(_ENVIRONMENT_SECTIONS):
+            if isinstance(identifiable, item_type):
+                break
+        else:
+            raise ValueError(
+                f"Expected an asset administration shell, a submodel or "
+                f"a concept description, but got: {type(identifiable).__name__}"
+            )
+
+        if section < self._section:
+            raise ValueError(
+                f"Expected the items of {_ENVIRONMENT_SECTIONS[self._section][0]!r} "
+                f"or of the following properties, but got an item "
+                f"of {name!r}; the items need to be written in the order "
+                f"of the properties"
+            )
+
+        if section > self._section:
+            if self._section == -1:
+                self._serializer._write_start_element("environment")
+            else:
+                self._serializer._write_end_element(
+                    _ENVIRONMENT_SECTIONS[self._section][0]
+                )
+
+            self._serializer._write_start_element(name)
+            self._section = section
+
+        self._serializer.visit(identifiable)
+
+    def close(self) -> None:
+        """
+        Write the end of the environment.
+
+        The stream itself is not closed. Closing the writer more than once has
+        no effect.
+        """
+        if self._closed:
+            return
+
+        if self._section == -1:
+            self._serializer._write_empty_element("environment")
+        else:
+            self._serializer._write_end_element(_ENVIRONMENT_SECTIONS[self._section][0])
+            self._serializer._write_end_element("environment")
+
+        self._serializer.flush()
+        self._closed = True
+
+    def __enter__(self) -> "EnvironmentWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        # We do not complete the document if an exception has been raised so that
+        # a partial export can not be mistaken for a complete one.
+        if exc_type is None:
+            self.close()
+        else:
+            self._serializer.flush()
@@ -0,0 +1 @@
+"""Benchmark the performance-critical parts of the SDK."""
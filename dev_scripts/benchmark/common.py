@@ -0,0 +1,118 @@
+"""Provide functionality shared among the benchmarks."""
+
+import contextlib
+import json
+import os
+import pathlib
+import time
+from typing import Any, Iterator, List, Mapping
+
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+_REPO_ROOT = pathlib.Path(os.path.realpath(__file__)).parent.parent.parent
+
+#: Path to the directory which contains the test data
+TEST_DATA_DIR = _REPO_ROOT / "test_data"
+
+
+def load_environment_jsonables(*parts: str) -> List[Mapping[str, Any]]:
+    """
+    Load the JSON-able environments from the test data.
+
+    :param parts:
+        of the path relative to the environments in the test data; if not given,
+        load the environments which are expected to be valid
+    :return: the JSON-able environments
+    """
+    if len(parts) == 0:
+        parts = ("Expected",)
+
+    jsonables = []  # type: List[Mapping[str, Any]]
+
+    for path in sorted(
+        TEST_DATA_DIR.joinpath("Json", "ContainedInEnvironment", *parts).glob(
+            "**/*.json"
+        )
+    ):
+        with path.open("rt", encoding="utf-8") as fid:
+            jsonables.append(json.load(fid))
+
+    return jsonables
+
+
+def make_large_environment(
+    copies: int, jsonables: List[Mapping[str, Any]]
+) -> aas_types.Environment:
+    """
+    Merge the :paramref:`jsonables` into a single environment :paramref:`copies`
+    times.
+
+    Each copy is de-serialized anew so that no instances are shared.
+    """
+    environment = aas_types.Environment(
+        asset_administration_shells=[], submodels=[], concept_descriptions=[]
+    )
+
+    assert environment.asset_administration_shells is not None
+    assert environment.submodels is not None
+    assert environment.concept_descriptions is not None
+
+    for _ in range(copies):
+        for jsonable in jsonables:
+            another = aas_jsonization.environment_from_jsonable(jsonable)
+            environment.asset_administration_shells.extend(
+                another.over_asset_administration_shells_or_empty()
+            )
+            environment.submodels.extend(another.over_submodels_or_empty())
+            environment.concept_descriptions.extend(
+                another.over_concept_descriptions_or_empty()
+            )
+
+    return environment
+
+
+def make_property_environment(
+    submodel_count: int, element_count: int
+) -> aas_types.Environment:
+    """
+    Generate an environment of :paramref:`submodel_count` submodels, each with
+    :paramref:`element_count` properties nested in collections of ten.
+    """
+    return aas_types.Environment(
+        submodels=[
+            aas_types.Submodel(
+                id=f"urn:submodel{i}",
+                submodel_elements=[
+                    aas_types.SubmodelElementCollection(
+                        id_short=f"collection{j}",
+                        value=[
+                            aas_types.Property(
+                                id_short=f"property{k}",
+                                value_type=aas_types.DataTypeDefXSD.INT,
+                                value=f"{i * element_count + j * 10 + k}",
+                            )
+                            for k in range(10)
+                        ],
+                    )
+                    for j in range(element_count // 10)
+                ],
+            )
+            for i in range(submodel_count)
+        ]
+    )
+
+
+def count_instances(instance: aas_types.Class) -> int:
+    """Count :paramref:`instance` and all its descendants."""
+    return 1 + sum(1 for _ in instance.descend())
+
+
+@contextlib.contextmanager
+def timed(label: str, results: List[float]) -> Iterator[None]:
+    """Measure the wall time of the block, print it and append it to results."""
+    start = time.perf_counter()
+    yield
+    duration = time.perf_counter() - start
+    results.append(duration)
+    print(f"{label}: {duration:.3f} s")
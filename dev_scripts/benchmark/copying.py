@@ -0,0 +1,51 @@
+"""
+Benchmark the deep copy of the model instances against :py:func:`copy.deepcopy`.
+
+We merge the test data into a large environment, and copy it deeply, first with
+:py:func:`copy.deepcopy`, and then with :py:func:`aas_core3.copying.deep_copy`.
+"""
+
+import argparse
+import copy
+import sys
+from typing import List
+
+import aas_core3.copying as aas_copying
+import aas_core3.hashing as aas_hashing
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is merged into the environment",
+        type=int,
+        default=50,
+    )
+    args = parser.parse_args()
+
+    jsonables = common.load_environment_jsonables()
+    environment = common.make_large_environment(int(args.copies), jsonables)
+    print(f"Benchmarking on {common.count_instances(environment)} instances.")
+
+    durations = []  # type: List[float]
+    with common.timed("copy.deepcopy", durations):
+        expected = copy.deepcopy(environment)
+
+    with common.timed("aas_core3.copying.deep_copy", durations):
+        got = aas_copying.deep_copy(environment)
+
+    if not aas_hashing.structurally_equal(expected, got):
+        print("Expected the copies to be equal", file=sys.stderr)
+        return 1
+
+    print(f"Speed-up: {durations[0] / durations[1]:.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
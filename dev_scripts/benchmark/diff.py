@@ -0,0 +1,131 @@
+"""
+Benchmark the structural diff against a generic diff of the JSON-able structures.
+
+We generate two versions of an environment with many submodel elements, which
+differ in a handful of elements. We compare them with a generic diff of their
+JSON-able structures, and with :py:func:`aas_core3.diff.diff_environments`, first
+with a fresh fingerprinter, then comparing the instances structurally, then with
+the fingerprints of the old version cached, and finally with the fingerprints of
+both versions cached.
+"""
+
+import argparse
+import sys
+from typing import Any, List
+
+import aas_core3.diff as aas_diff
+import aas_core3.hashing as aas_hashing
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+from dev_scripts.benchmark import common
+
+
+def _change(environment: aas_types.Environment, change_count: int) -> None:
+    """Change a property value in :paramref:`change_count` submodels."""
+    assert environment.submodels is not None
+    step = max(1, len(environment.submodels) // change_count)
+    for submodel in environment.submodels[::step][:change_count]:
+        assert submodel.submodel_elements is not None
+        collection = submodel.submodel_elements[-1]
+        assert isinstance(collection, aas_types.SubmodelElementCollection)
+        assert collection.value is not None
+        element = collection.value[-1]
+        assert isinstance(element, aas_types.Property)
+        element.value = "changed"
+
+
+def _generic_diff(old: Any, new: Any, path: List[Any], changes: List[Any]) -> None:
+    """Diff two JSON-able structures, and collect the paths of the changes."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            _generic_diff(old.get(key, None), new.get(key, None), path + [key], changes)
+    elif isinstance(old, list) and isinstance(new, list):
+        for i in range(max(len(old), len(new))):
+            _generic_diff(
+                old[i] if i < len(old) else None,
+                new[i] if i < len(new) else None,
+                path + [i],
+                changes,
+            )
+    elif old != new:
+        changes.append(path)
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--submodels", help="Number of the submodels", type=int, default=1000
+    )
+    parser.add_argument(
+        "--elements",
+        help="Number of the properties in each submodel",
+        type=int,
+        default=100,
+    )
+    parser.add_argument(
+        "--changes", help="Number of the changed properties", type=int, default=10
+    )
+    args = parser.parse_args()
+
+    old = common.make_property_environment(int(args.submodels), int(args.elements))
+    new = common.make_property_environment(int(args.submodels), int(args.elements))
+    _change(new, int(args.changes))
+
+    element_count = sum(
+        1
+        for something in old.descend()
+        if isinstance(something, aas_types.SubmodelElement)
+    )
+    print(f"Benchmarking on {element_count} submodel elements.")
+
+    durations = []  # type: List[float]
+    with common.timed("generic diff of JSON-able structures", durations):
+        generic_changes = []  # type: List[Any]
+        _generic_diff(
+            aas_jsonization.to_jsonable(old),
+            aas_jsonization.to_jsonable(new),
+            [],
+            generic_changes,
+        )
+
+    with common.timed("diff with a fresh fingerprinter", durations):
+        changes = list(aas_diff.diff_environments(old, new))
+
+    with common.timed("diff comparing structurally", durations):
+        structural_changes = list(
+            aas_diff.diff_environments(old, new, compare_structurally=True)
+        )
+
+    fingerprinter = aas_hashing.Fingerprinter()
+    fingerprinter.fingerprint(old)
+    with common.timed("diff with the old fingerprints cached", durations):
+        changes = list(aas_diff.diff_environments(old, new, fingerprinter))
+
+    with common.timed("diff with all the fingerprints cached", durations):
+        changes = list(aas_diff.diff_environments(old, new, fingerprinter))
+
+    if (
+        len(changes) != int(args.changes)
+        or len(generic_changes) != len(changes)
+        or len(structural_changes) != len(changes)
+    ):
+        print(
+            f"Expected {args.changes} changes, but got {len(changes)} "
+            f"and {len(generic_changes)} from the generic diff",
+            file=sys.stderr,
+        )
+        return 1
+
+    print(
+        f"Speed-up with a fresh fingerprinter: {durations[0] / durations[1]:.1f}x, "
+        f"comparing structurally: {durations[0] / durations[2]:.1f}x, "
+        f"with all the fingerprints cached: {durations[0] / durations[4]:.1f}x"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
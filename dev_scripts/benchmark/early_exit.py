@@ -0,0 +1,68 @@
+"""
+Benchmark the early exit of the verification on a deliberately broken environment.
+
+We merge all the invalid environments from the test data into a single large
+environment, and compare reporting all the errors against stopping at an error
+budget or at the first error.
+"""
+
+import argparse
+import sys
+from typing import List
+
+import aas_core3.fast_verification as aas_fast_verification
+import aas_core3.verification as aas_verification
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the invalid test data is merged into the environment",
+        type=int,
+        default=20,
+    )
+    parser.add_argument(
+        "--max_errors", help="Budget of the reported errors", type=int, default=100
+    )
+    args = parser.parse_args()
+
+    environment = common.make_large_environment(
+        int(args.copies), common.load_environment_jsonables("Unexpected", "Invalid")
+    )
+    print(f"Benchmarking on {common.count_instances(environment)} instances.")
+
+    durations = []  # type: List[float]
+    with common.timed("verify all", durations):
+        errors = list(aas_verification.verify(environment))
+
+    with common.timed(f"verify with max_errors={args.max_errors}", durations):
+        limited = list(
+            aas_fast_verification.verify(environment, max_errors=int(args.max_errors))
+        )
+
+    with common.timed("is_valid", durations):
+        valid = aas_fast_verification.is_valid(environment)
+
+    if [str(error) for error in limited] != [
+        str(error) for error in errors[: int(args.max_errors)]
+    ]:
+        print("The limited errors are not a prefix of all the errors", file=sys.stderr)
+        return 1
+
+    if valid != (len(errors) == 0):
+        print("The result of is_valid contradicts verify", file=sys.stderr)
+        return 1
+
+    print(f"Errors in total: {len(errors)}")
+    print(f"Speed-up of max_errors: {durations[0] / durations[1]:.2f}x")
+    print(f"Speed-up of is_valid: {durations[0] / durations[2]:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Benchmark the change detection with the cached fingerprints.
+
+We merge the test data into a large environment twice. We fingerprint both
+environments, change a single property deep down in the second one, and
+re-fingerprint it after forgetting the changed path. Finally, we find the changed
+instances top-down by descending only into the subtrees whose fingerprints differ.
+"""
+
+import argparse
+import sys
+from typing import List
+
+import aas_core3.hashing as aas_hashing
+import aas_core3.types as aas_types
+
+from dev_scripts.benchmark import common
+
+
+def _find_changes(
+    fingerprinter: aas_hashing.Fingerprinter,
+    old: aas_types.Class,
+    new: aas_types.Class,
+    changes: List[aas_types.Class],
+) -> None:
+    """Collect the instances of :paramref:`new` whose own properties changed."""
+    if fingerprinter.fingerprint(old) == fingerprinter.fingerprint(new):
+        return
+
+    changed_children = False
+    for old_child, new_child in zip(old.descend_once(), new.descend_once()):
+        if fingerprinter.fingerprint(old_child) != fingerprinter.fingerprint(new_child):
+            changed_children = True
+            _find_changes(fingerprinter, old_child, new_child, changes)
+
+    if not changed_children:
+        changes.append(new)
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is merged into the environment",
+        type=int,
+        default=50,
+    )
+    args = parser.parse_args()
+
+    jsonables = common.load_environment_jsonables()
+    old = common.make_large_environment(int(args.copies), jsonables)
+    new = common.make_large_environment(int(args.copies), jsonables)
+    print(f"Benchmarking on {common.count_instances(old)} instances.")
+
+    fingerprinter = aas_hashing.Fingerprinter()
+
+    durations = []  # type: List[float]
+    with common.timed("fingerprint the old environment", durations):
+        fingerprinter.fingerprint(old)
+
+    with common.timed("fingerprint the new environment", durations):
+        fingerprinter.fingerprint(new)
+
+    assert new.submodels is not None
+    submodel, element = next(
+        (submodel, something)
+        for submodel in new.submodels[len(new.submodels) // 2 :]
+        for something in submodel.descend()
+        if isinstance(something, aas_types.Property)
+    )
+    path = [new, submodel] + [
+        something
+        for something in submodel.descend()
+        if any(descendant is element for descendant in something.descend())
+    ]
+    element.value = "changed"
+
+    with common.timed("re-fingerprint after the change", durations):
+        for something in path + [element]:
+            fingerprinter.forget(something)
+        fingerprinter.fingerprint(new)
+
+    changes = []  # type: List[aas_types.Class]
+    with common.timed("find the changes top-down", durations):
+        _find_changes(fingerprinter, old, new, changes)
+
+    if len(changes) != 1 or changes[0] is not element:
+        print(f"Expected only the changed property, got: {changes}", file=sys.stderr)
+        return 1
+
+    with common.timed("compare with ==", durations):
+        equal = old == new
+
+    if equal:
+        print("Expected the environments to differ", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""
+Benchmark the sharing of references and strings on templated submodels.
+
+We generate an environment where all the submodels follow the same template so
+that the semantic IDs, the ID-shorts, the language codes and the content types of
+the submodels and their elements recur. We read it identifiable by identifiable
+without interning, with an interner for the references, and additionally with
+an interner for the strings. We measure the time and the memory retained by
+the identifiables with :py:mod:`tracemalloc`.
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+import tracemalloc
+from typing import Optional, Tuple
+
+import aas_core3.interning as aas_interning
+import aas_core3.json_streaming as aas_json_streaming
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+
+def _external_reference(value: str) -> aas_types.Reference:
+    """Create an external reference with a single global key."""
+    return aas_types.Reference(
+        type=aas_types.ReferenceTypes.EXTERNAL_REFERENCE,
+        keys=[aas_types.Key(type=aas_types.KeyTypes.GLOBAL_REFERENCE, value=value)],
+    )
+
+
+def _make_templated_environment(
+    submodel_count: int, element_count: int
+) -> aas_types.Environment:
+    """Generate submodels which follow the same template."""
+    return aas_types.Environment(
+        submodels=[
+            aas_types.Submodel(
+                id=f"urn:submodel{i}",
+                semantic_id=_external_reference(
+                    "https://admin-shell.io/idta/SubmodelTemplate/1/0"
+                ),
+                submodel_elements=[
+                    aas_types.Property(
+                        id_short=f"property{j}",
+                        value_type=aas_types.DataTypeDefXSD.STRING,
+                        value=f"value{i}",
+                        semantic_id=_external_reference(f"0173-1#02-AAO{j:03d}#002"),
+                        description=[
+                            aas_types.LangStringTextType(
+                                language="en-US", text=f"Something {i}"
+                            )
+                        ],
+                    )
+                    for j in range(element_count)
+                ]
+                + [
+                    aas_types.File(
+                        id_short="document",
+                        content_type="application/pdf",
+                        value=f"/aasx/documents/document{i}.pdf",
+                    )
+                ],
+            )
+            for i in range(submodel_count)
+        ]
+    )
+
+
+def _read(
+    text: str,
+    interner: Optional[aas_interning.Interner],
+    string_interner: Optional[aas_interning.StringInterner],
+) -> Tuple[float, int]:
+    """Read the identifiables, and measure the duration and the retained memory."""
+    # The tracing slows down the allocations considerably, so we measure
+    # the duration in a separate run.
+    start = time.perf_counter()
+    identifiables = list(
+        aas_json_streaming.iter_identifiables_from_stream(
+            io.StringIO(text), interner=interner, string_interner=string_interner
+        )
+    )
+    duration = time.perf_counter() - start
+    del identifiables
+
+    if interner is not None:
+        interner.clear()
+
+    if string_interner is not None:
+        string_interner.clear()
+
+    tracemalloc.start()
+    identifiables = list(
+        aas_json_streaming.iter_identifiables_from_stream(
+            io.StringIO(text), interner=interner, string_interner=string_interner
+        )
+    )
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del identifiables
+
+    return duration, size
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--submodels", help="Number of the submodels", type=int, default=2000
+    )
+    parser.add_argument(
+        "--elements",
+        help="Number of the elements in each submodel",
+        type=int,
+        default=50,
+    )
+    args = parser.parse_args()
+
+    environment = _make_templated_environment(int(args.submodels), int(args.elements))
+    text = json.dumps(aas_jsonization.to_jsonable(environment))
+    del environment
+
+    print(f"Benchmarking on {len(text) / 2**20:.1f} MiB of JSON")
+
+    duration, size = _read(text, None, None)
+    print(f"Without interning: {duration:.3f} s, {size / 2**20:.1f} MiB retained")
+
+    interner = aas_interning.Interner()
+    interned_duration, interned_size = _read(text, interner, None)
+    print(
+        f"With interned references: {interned_duration:.3f} s, "
+        f"{interned_size / 2**20:.1f} MiB retained "
+        f"(saved {1 - interned_size / size:.0%}), "
+        f"{interner.hits} hits, {interner.misses} misses"
+    )
+
+    string_interner = aas_interning.StringInterner()
+    interned_duration, interned_size = _read(text, interner, string_interner)
+    print(
+        f"With interned references and strings: {interned_duration:.3f} s, "
+        f"{interned_size / 2**20:.1f} MiB retained "
+        f"(saved {1 - interned_size / size:.0%}), "
+        f"{string_interner.hits} string hits, {string_interner.misses} misses"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
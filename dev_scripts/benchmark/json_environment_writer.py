@@ -0,0 +1,76 @@
+"""
+Benchmark writing an environment incrementally to JSON.
+
+We merge the test data into a large environment, and compare
+``json.dumps(to_jsonable(environment))`` against
+:py:func:`aas_core3.json_streaming.write_environment`. The output is written to
+:py:data:`os.devnull`. The peak memory is measured with :py:mod:`tracemalloc`.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from typing import List
+
+import aas_core3.json_streaming as aas_json_streaming
+import aas_core3.jsonization as aas_jsonization
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is merged into the environment",
+        type=int,
+        default=10,
+    )
+    args = parser.parse_args()
+
+    environment = common.make_large_environment(
+        int(args.copies), common.load_environment_jsonables()
+    )
+    print(f"Benchmarking on {common.count_instances(environment)} instances.")
+
+    def dump_whole() -> None:
+        fid.write(json.dumps(aas_jsonization.to_jsonable(environment)))
+
+    def write_incrementally() -> None:
+        aas_json_streaming.write_environment(
+            fid,
+            asset_administration_shells=environment.asset_administration_shells,
+            submodels=environment.submodels,
+            concept_descriptions=environment.concept_descriptions,
+        )
+
+    durations = []  # type: List[float]
+    peaks = []  # type: List[int]
+
+    with open(os.devnull, "wt", encoding="utf-8") as fid:
+        with common.timed("json.dumps(to_jsonable(...))", durations):
+            dump_whole()
+
+        with common.timed("write_environment", durations):
+            write_incrementally()
+
+        # We measure the memory in separate runs as tracing slows down
+        # the execution considerably.
+        for run in (dump_whole, write_incrementally):
+            tracemalloc.start()
+            run()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    print(f"Peak memory of json.dumps(to_jsonable(...)): {peaks[0] / 2**20:.1f} MiB")
+    print(f"Peak memory of write_environment: {peaks[1] / 2**20:.1f} MiB")
+    print(f"Speed-up: {durations[0] / durations[1]:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Benchmark the streaming de-serialization of an environment from JSON.
+
+We write a large environment to a temporary file, and compare loading it whole
+with :py:func:`json.load` against streaming its identifiables one by one.
+The peak memory is measured with :py:mod:`tracemalloc`.
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import tempfile
+import tracemalloc
+from typing import List
+
+import aas_core3.json_streaming as aas_json_streaming
+import aas_core3.jsonization as aas_jsonization
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is merged into the environment",
+        type=int,
+        default=10,
+    )
+    args = parser.parse_args()
+
+    environment = common.make_large_environment(
+        int(args.copies), common.load_environment_jsonables()
+    )
+    print(f"Benchmarking on {common.count_instances(environment)} instances.")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir) / "environment.json"
+        with path.open("wt", encoding="utf-8") as fid:
+            json.dump(aas_jsonization.to_jsonable(environment), fid)
+        del environment
+
+        print(f"File size: {path.stat().st_size / 2**20:.1f} MiB")
+
+        durations = []  # type: List[float]
+        peaks = []  # type: List[int]
+
+        tracemalloc.start()
+        with common.timed("json.load and environment_from_jsonable", durations):
+            with path.open("rb") as fid:
+                jsonable = json.load(fid)
+            expected_count = len(
+                list(aas_jsonization.environment_from_jsonable(jsonable).descend_once())
+            )
+            del jsonable
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        with common.timed("iter_identifiables_from_stream", durations):
+            with path.open("rb") as fid:
+                got_count = sum(
+                    1 for _ in aas_json_streaming.iter_identifiables_from_stream(fid)
+                )
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    if got_count != expected_count:
+        print(
+            f"Expected {expected_count} identifiables, but got {got_count}",
+            file=sys.stderr,
+        )
+        return 1
+
+    print(f"Peak memory loading whole: {peaks[0] / 2**20:.1f} MiB")
+    print(f"Peak memory streaming: {peaks[1] / 2**20:.1f} MiB")
+    print(f"Slow-down of streaming: {durations[1] / durations[0]:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
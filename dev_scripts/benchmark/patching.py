@@ -0,0 +1,129 @@
+"""
+Benchmark the in-place application of a small patch to a large environment.
+
+We generate an environment with many properties, and verify it once with
+the incremental verifier of the patcher. Then we apply a patch of a handful
+of operations and re-verify the environment. For comparison, we re-build
+the patched environment from its JSON-able structure and verify it from
+scratch, as the patch would have to be applied without the patcher.
+"""
+
+import argparse
+import sys
+from typing import List
+
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.patching as aas_patching
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+from dev_scripts.benchmark import common
+
+
+def _make_patch(
+    submodel_count: int, element_count: int, operation_count: int
+) -> List[aas_patching.PatchOperation]:
+    """Generate a patch spread over the submodels."""
+    patch = []  # type: List[aas_patching.PatchOperation]
+
+    for i in range(operation_count):
+        submodel_id = f"urn:submodel{i * submodel_count // operation_count}"
+        collection = f"collection{i * (element_count // 10) // operation_count}"
+
+        if i % 3 == 0:
+            patch.append(
+                aas_patching.Replace(
+                    submodel_id, (collection, "property0"), "value", "1984"
+                )
+            )
+        elif i % 3 == 1:
+            patch.append(
+                aas_patching.Add(
+                    submodel_id,
+                    (collection, "addedProperty"),
+                    aas_types.Property(
+                        id_short="addedProperty",
+                        value_type=aas_types.DataTypeDefXSD.INT,
+                        value="2001",
+                    ),
+                )
+            )
+        else:
+            patch.append(aas_patching.Remove(submodel_id, (collection, "property1")))
+
+    return patch
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--submodels", help="Number of the submodels", type=int, default=1000
+    )
+    parser.add_argument(
+        "--elements",
+        help="Number of the properties in each submodel",
+        type=int,
+        default=1000,
+    )
+    parser.add_argument(
+        "--operations",
+        help="Number of the operations in the patch",
+        type=int,
+        default=10,
+    )
+    args = parser.parse_args()
+
+    submodel_count = int(args.submodels)
+    element_count = int(args.elements)
+
+    environment = common.make_property_environment(submodel_count, element_count)
+    print(
+        f"Benchmarking on "
+        f"{submodel_count * (element_count + element_count // 10)} "
+        f"submodel elements."
+    )
+
+    durations = []  # type: List[float]
+    with common.timed("index the environment", durations):
+        patcher = aas_patching.Patcher(environment)
+
+    with common.timed("verify the environment for the first time", durations):
+        errors = list(patcher.verify())
+
+    if len(errors) != 0:
+        print(f"Expected no errors, but got: {errors[0]}", file=sys.stderr)
+        return 1
+
+    patch = _make_patch(submodel_count, element_count, int(args.operations))
+
+    with common.timed(f"apply a patch of {len(patch)} operations", durations):
+        patcher.apply(patch)
+
+    with common.timed("re-verify the touched instances", durations):
+        errors = list(patcher.verify())
+
+    if len(errors) != 0:
+        print(f"Expected no errors, but got: {errors[0]}", file=sys.stderr)
+        return 1
+
+    jsonable = aas_jsonization.to_jsonable(environment)
+    with common.timed("re-build from JSON-able and verify from scratch", durations):
+        errors = list(
+            aas_verification.verify(aas_jsonization.environment_from_jsonable(jsonable))
+        )
+
+    if len(errors) != 0:
+        print(f"Expected no errors, but got: {errors[0]}", file=sys.stderr)
+        return 1
+
+    print(
+        f"Speed-up of the patch and the re-verification: "
+        f"{durations[4] / (durations[2] + durations[3]):.0f}x"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
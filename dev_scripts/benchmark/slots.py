@@ -0,0 +1,136 @@
+"""
+Benchmark the memory footprint of the slotted model classes.
+
+We load the environments from the test data with :py:mod:`tracemalloc` running.
+To compare against the classes as they were before they were slotted, we mirror
+the loaded instances into plain classes, which keep their properties in
+an instance dictionary, and into the slotted classes. Both mirrors share
+the primitive values with the loaded environment, so that the difference
+is only due to the instances themselves.
+"""
+
+import argparse
+import sys
+import tracemalloc
+from typing import Any, Dict, List, Mapping, Tuple, Type
+
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+from dev_scripts.benchmark import common
+
+
+def _properties_of(cls: Type[aas_types.Class]) -> Tuple[str, ...]:
+    """List the names of the properties of the concrete :paramref:`cls`."""
+    names = []  # type: List[str]
+    for base in reversed(cls.__mro__):
+        for name in base.__dict__.get("__slots__", ()):
+            if name != "__weakref__":
+                names.append(name)
+
+    return tuple(names)
+
+
+class _Mirror:
+    """Copy the instances into either plain or slotted classes."""
+
+    def __init__(self, unslotted: bool) -> None:
+        """Initialize with the given values."""
+        self.unslotted = unslotted
+        self._plain_classes = {}  # type: Dict[Type[aas_types.Class], Type[Any]]
+
+    def _target_class(self, cls: Type[aas_types.Class]) -> Type[Any]:
+        """Retrieve the class into which the instances of :paramref:`cls` go."""
+        if not self.unslotted:
+            return cls
+
+        target = self._plain_classes.get(cls, None)
+        if target is None:
+            target = type(cls.__name__, (), {})
+            self._plain_classes[cls] = target
+
+        return target
+
+    def copy(self, instance: aas_types.Class) -> Any:
+        """Copy the :paramref:`instance` recursively."""
+        cls = type(instance)
+        target_cls = self._target_class(cls)
+        result = object.__new__(target_cls)
+
+        for name in _properties_of(cls):
+            value = getattr(instance, name)
+            if isinstance(value, aas_types.Class):
+                value = self.copy(value)
+            elif isinstance(value, list):
+                value = [self.copy(item) for item in value]
+
+            setattr(result, name, value)
+
+        return result
+
+
+def _measure_mirror(
+    environments: List[aas_types.Environment], unslotted: bool
+) -> Tuple[int, List[Any]]:
+    """Mirror the :paramref:`environments` and measure the memory of the mirror."""
+    mirror = _Mirror(unslotted)
+
+    tracemalloc.start()
+    copies = [mirror.copy(environment) for environment in environments]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return size, copies
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is loaded",
+        type=int,
+        default=10,
+    )
+    args = parser.parse_args()
+
+    jsonables = common.load_environment_jsonables()  # type: List[Mapping[str, Any]]
+
+    tracemalloc.start()
+    environments = [
+        aas_jsonization.environment_from_jsonable(jsonable)
+        for _ in range(int(args.copies))
+        for jsonable in jsonables
+    ]
+    loaded_size, loaded_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    instance_count = sum(
+        common.count_instances(environment) for environment in environments
+    )
+    print(
+        f"Loaded {len(environments)} environments with {instance_count} instances: "
+        f"{loaded_size / 2**20:.1f} MiB, peak {loaded_peak / 2**20:.1f} MiB"
+    )
+
+    unslotted_size, unslotted = _measure_mirror(environments, unslotted=True)
+    del unslotted
+
+    slotted_size, slotted = _measure_mirror(environments, unslotted=False)
+    del slotted
+
+    print(
+        f"Instances with a dictionary: {unslotted_size / 2**20:.1f} MiB, "
+        f"{unslotted_size / instance_count:.0f} bytes per instance"
+    )
+    print(
+        f"Slotted instances: {slotted_size / 2**20:.1f} MiB, "
+        f"{slotted_size / instance_count:.0f} bytes per instance"
+    )
+    print(f"Saved: {1 - slotted_size / unslotted_size:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Benchmark the structural equality against comparing the JSON-able structures.
+
+We merge the test data into a large environment twice so that the two
+environments are structurally equal, but share no instances. We compare them
+with :py:func:`aas_core3.hashing.structurally_equal` and with the work-around of comparing the results of
+:py:func:`aas_core3.jsonization.to_jsonable`, both when they are equal and when
+they differ in the first submodel. We also measure
+:py:func:`aas_core3.hashing.structural_hash`.
+"""
+
+import argparse
+import sys
+from typing import List
+
+import aas_core3.hashing as aas_hashing
+import aas_core3.jsonization as aas_jsonization
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is merged into the environment",
+        type=int,
+        default=50,
+    )
+    args = parser.parse_args()
+
+    jsonables = common.load_environment_jsonables()
+    environment = common.make_large_environment(int(args.copies), jsonables)
+    another = common.make_large_environment(int(args.copies), jsonables)
+    print(f"Benchmarking on {common.count_instances(environment)} instances.")
+
+    durations = []  # type: List[float]
+    with common.timed("equal, to_jsonable", durations):
+        jsonable_equal = aas_jsonization.to_jsonable(
+            environment
+        ) == aas_jsonization.to_jsonable(another)
+
+    with common.timed("equal, structurally_equal", durations):
+        equal = aas_hashing.structurally_equal(environment, another)
+
+    if not (jsonable_equal and equal):
+        print("Expected the environments to be equal", file=sys.stderr)
+        return 1
+
+    assert another.submodels is not None
+    another.submodels[0].id += "-changed"
+
+    with common.timed("different, to_jsonable", durations):
+        jsonable_equal = aas_jsonization.to_jsonable(
+            environment
+        ) == aas_jsonization.to_jsonable(another)
+
+    with common.timed("different, structurally_equal", durations):
+        equal = aas_hashing.structurally_equal(environment, another)
+
+    if jsonable_equal or equal:
+        print("Expected the environments to differ", file=sys.stderr)
+        return 1
+
+    with common.timed("structural_hash", durations):
+        aas_hashing.structural_hash(environment)
+
+    print(
+        f"Speed-up of structurally_equal on equal environments: "
+        f"{durations[0] / durations[1]:.2f}x"
+    )
+    print(
+        f"Speed-up of structurally_equal on different environments: "
+        f"{durations[2] / durations[3]:.2f}x"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
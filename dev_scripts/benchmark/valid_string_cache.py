@@ -0,0 +1,66 @@
+"""
+Benchmark the caching of strings known to be valid during the verification.
+
+We verify all the expected environments from ``test_data/Json`` several times,
+once without and once with a shared cache.
+"""
+
+import argparse
+import sys
+from typing import List
+
+import aas_core3.fast_verification as aas_fast_verification
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rounds",
+        help="How many times the corpus should be verified",
+        type=int,
+        default=10,
+    )
+    args = parser.parse_args()
+
+    environments = [
+        aas_jsonization.environment_from_jsonable(jsonable)
+        for jsonable in common.load_environment_jsonables()
+    ]  # type: List[aas_types.Environment]
+
+    rounds = int(args.rounds)
+    print(
+        f"Benchmarking on {len(environments)} environment(s) "
+        f"with {sum(common.count_instances(env) for env in environments)} "
+        f"instances in {rounds} round(s)."
+    )
+
+    durations = []  # type: List[float]
+    with common.timed("verify without cache", durations):
+        for _ in range(rounds):
+            for environment in environments:
+                for _ in aas_verification.verify(environment):
+                    pass
+
+    cache = aas_fast_verification.ValidStringCache()
+    with common.timed("verify with cache", durations):
+        for _ in range(rounds):
+            for environment in environments:
+                for _ in aas_fast_verification.verify(
+                    environment, valid_string_cache=cache
+                ):
+                    pass
+
+    print(f"Cache hits: {cache.hits}, misses: {cache.misses}, size: {len(cache)}")
+    print(f"Speed-up: {durations[0] / durations[1]:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
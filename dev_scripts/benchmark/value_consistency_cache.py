@@ -0,0 +1,112 @@
+"""
+Benchmark the memoization of the value consistency with XSD types.
+
+We build an environment of properties, ranges, qualifiers and extensions whose
+values repeat over a small pool, as is common in industrial data.
+"""
+
+import argparse
+import sys
+from typing import List, Tuple
+
+import aas_core3.fast_verification as aas_fast_verification
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+from dev_scripts.benchmark import common
+
+_VALUE_POOL = [
+    ("true", aas_types.DataTypeDefXSD.BOOLEAN),
+    ("false", aas_types.DataTypeDefXSD.BOOLEAN),
+    ("0", aas_types.DataTypeDefXSD.INT),
+    ("1984", aas_types.DataTypeDefXSD.LONG),
+    ("3.14", aas_types.DataTypeDefXSD.DOUBLE),
+    ("-1.5E-3", aas_types.DataTypeDefXSD.FLOAT),
+    ("2024-02-29", aas_types.DataTypeDefXSD.DATE),
+    ("2024-02-29T12:34:56.789Z", aas_types.DataTypeDefXSD.DATE_TIME),
+    ("P1Y2M3DT4H5M6S", aas_types.DataTypeDefXSD.DURATION),
+    ("0173-1#05-AAA650#002", aas_types.DataTypeDefXSD.STRING),
+]  # type: List[Tuple[str, aas_types.DataTypeDefXSD]]
+
+
+def _make_environment(submodel_count: int) -> aas_types.Environment:
+    """Generate submodels with values repeating over the pool."""
+    submodels = []  # type: List[aas_types.Submodel]
+
+    for i in range(submodel_count):
+        elements = []  # type: List[aas_types.SubmodelElement]
+
+        for j, (value, value_type) in enumerate(_VALUE_POOL):
+            elements.append(
+                aas_types.Property(
+                    id_short=f"property{j}",
+                    value_type=value_type,
+                    value=value,
+                    qualifiers=[
+                        aas_types.Qualifier(
+                            type="someQualifier", value_type=value_type, value=value
+                        )
+                    ],
+                    extensions=[
+                        aas_types.Extension(
+                            name="someExtension", value_type=value_type, value=value
+                        )
+                    ],
+                )
+            )
+
+            elements.append(
+                aas_types.Range(
+                    id_short=f"range{j}", value_type=value_type, min=value, max=value
+                )
+            )
+
+        submodels.append(
+            aas_types.Submodel(id=f"urn:submodel{i}", submodel_elements=elements)
+        )
+
+    return aas_types.Environment(submodels=submodels)
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--submodels",
+        help="Number of submodels in the generated environment",
+        type=int,
+        default=2000,
+    )
+    parser.add_argument(
+        "--max_size", help="Maximum size of the cache", type=int, default=4096
+    )
+    args = parser.parse_args()
+
+    environment = _make_environment(int(args.submodels))
+    print(f"Benchmarking on {common.count_instances(environment)} instances.")
+
+    durations = []  # type: List[float]
+    with common.timed("verify without cache", durations):
+        expected = [str(error) for error in aas_verification.verify(environment)]
+
+    cache = aas_fast_verification.ValueConsistencyCache(max_size=int(args.max_size))
+    with common.timed("verify with cache", durations):
+        got = [
+            str(error)
+            for error in aas_fast_verification.verify(
+                environment, value_consistency_cache=cache
+            )
+        ]
+
+    if got != expected:
+        print("The errors with and without the cache differ", file=sys.stderr)
+        return 1
+
+    print(f"Cache hits: {cache.hits}, misses: {cache.misses}, size: {len(cache)}")
+    print(f"Speed-up: {durations[0] / durations[1]:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Benchmark the parallel verification against the sequential one.
+
+The environment is built by merging the expected test data multiple times.
+The speed-up can only be near-linear if the machine has at least as many
+physical cores as there are workers.
+"""
+
+import argparse
+import os
+import sys
+from typing import List
+
+import aas_core3.environment_verification as aas_environment_verification
+import aas_core3.verification as aas_verification
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="How many times the test data should be merged into the environment",
+        type=int,
+        default=50,
+    )
+    parser.add_argument(
+        "--workers",
+        help="Numbers of worker processes to benchmark",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+    )
+    args = parser.parse_args()
+
+    environment = common.make_large_environment(
+        copies=int(args.copies), jsonables=common.load_environment_jsonables()
+    )
+    print(
+        f"Benchmarking on {common.count_instances(environment)} instances "
+        f"with {os.cpu_count()} CPU(s) available."
+    )
+
+    durations = []  # type: List[float]
+    with common.timed("verify", durations):
+        expected = [str(error) for error in aas_verification.verify(environment)]
+
+    baseline = durations[0]
+
+    for workers in args.workers:
+        durations = []
+        with common.timed(f"verify_parallel with {workers} worker(s)", durations):
+            got = [
+                str(error)
+                for error in aas_environment_verification.verify_parallel(
+                    environment, workers=workers
+                )
+            ]
+
+        if got != expected:
+            print(
+                f"The errors of verify_parallel with {workers} worker(s) "
+                f"differ from the errors of verify",
+                file=sys.stderr,
+            )
+            return 1
+
+        print(f"  speed-up: {baseline / durations[0]:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Benchmark the XML de-serialization with the stdlib and the lxml backends.
+
+We write two synthetic environments to temporary files, one merged from the test
+data with many small elements, and another one with large blobs. We read each with
+both backends as a whole and identifiable by identifiable.
+Every reading runs in a separate process so that the peak resident set size
+(RSS) is not spoiled by the other runs. The RSS is measured with
+:py:mod:`resource` or read from ``/proc``, and is thus only available on Unix-like
+systems.
+"""
+
+import argparse
+import json
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Mapping, Optional
+
+import aas_core3.types as aas_types
+import aas_core3.xml_streaming as aas_xml_streaming
+import aas_core3.xmlization as aas_xmlization
+
+from dev_scripts.benchmark import common
+
+_BACKENDS = ["stdlib", "lxml"]
+_MODES = ["environment_from_file", "iter_identifiables_from_stream"]
+
+
+def _peak_rss_in_mib() -> float:
+    """Retrieve the peak resident set size of this process."""
+    # The ``ru_maxrss`` survives ``exec``, so that a child process would report
+    # the peak of its parent. On Linux, we read the high-water mark of the process
+    # itself instead.
+    status = pathlib.Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text(encoding="utf-8").splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 2**10
+
+    # The ``ru_maxrss`` is given in kibibytes on Linux, but in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _measure(path: pathlib.Path, mode: str, backend: str) -> int:
+    """Read the file at :paramref:`path`, and report the measurements as JSON."""
+    rss_before = _peak_rss_in_mib()
+
+    start = time.perf_counter()
+    if mode == "environment_from_file":
+        environment = aas_xmlization.environment_from_file(path, backend=backend)
+        count = sum(1 for _ in environment.descend_once())
+    elif mode == "iter_identifiables_from_stream":
+        with path.open("rt", encoding="utf-8") as fid:
+            count = sum(
+                1
+                for _ in aas_xml_streaming.iter_identifiables_from_stream(
+                    fid, backend=backend
+                )
+            )
+    else:
+        raise ValueError(f"Unexpected mode: {mode!r}")
+    duration = time.perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "count": count,
+                "duration": duration,
+                "rss_before": rss_before,
+                "rss_peak": _peak_rss_in_mib(),
+            }
+        )
+    )
+    return 0
+
+
+def _make_environment_with_blobs(submodel_count: int) -> aas_types.Environment:
+    """Generate submodels, each with four blobs of one MiB."""
+    return aas_types.Environment(
+        submodels=[
+            aas_types.Submodel(
+                id=f"urn:submodel{i}",
+                submodel_elements=[
+                    aas_types.Blob(
+                        id_short=f"blob{j}",
+                        content_type="application/octet-stream",
+                        value=bytes(range(256)) * 4096,
+                    )
+                    for j in range(4)
+                ],
+            )
+            for i in range(submodel_count)
+        ]
+    )
+
+
+def _run_measurement(
+    path: pathlib.Path, mode: str, backend: str
+) -> Optional[Mapping[str, Any]]:
+    """Measure in a separate process, and return ``None`` on failure."""
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "dev_scripts.benchmark.xml_backends",
+            "--measure",
+            str(path),
+            mode,
+            backend,
+        ],
+        stdout=subprocess.PIPE,
+        encoding="utf-8",
+        check=False,
+    )
+    if process.returncode != 0:
+        return None
+
+    result = json.loads(process.stdout)  # type: Mapping[str, Any]
+    return result
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is merged into the environment",
+        type=int,
+        default=20,
+    )
+    parser.add_argument(
+        "--blob_submodels",
+        help="Number of submodels in the environment with large blobs",
+        type=int,
+        default=20,
+    )
+    parser.add_argument("--measure", help=argparse.SUPPRESS, nargs=3)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        path, mode, backend = args.measure
+        return _measure(pathlib.Path(path), mode, backend)
+
+    environments = [
+        (
+            "test data",
+            common.make_large_environment(
+                int(args.copies), common.load_environment_jsonables()
+            ),
+        ),
+        ("large blobs", _make_environment_with_blobs(int(args.blob_submodels))),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, environment in environments:
+            path = pathlib.Path(tmp_dir) / "environment.xml"
+            with path.open("wt", encoding="utf-8") as fid:
+                aas_xmlization.write(environment, fid)
+            expected_count = sum(1 for _ in environment.descend_once())
+
+            size_in_mib = path.stat().st_size / 2**20
+            print(
+                f"Benchmarking on {label}, {expected_count} identifiables "
+                f"in {size_in_mib:.1f} MiB of XML:"
+            )
+
+            for mode in _MODES:
+                print(f"  {mode}:")
+                for backend in _BACKENDS:
+                    result = _run_measurement(path, mode, backend)
+                    if result is None:
+                        print(f"The measurement with {backend} failed", file=sys.stderr)
+                        return 1
+
+                    if result["count"] != expected_count:
+                        print(
+                            f"Expected {expected_count} identifiables "
+                            f"with {backend}, but got {result['count']}",
+                            file=sys.stderr,
+                        )
+                        return 1
+
+                    print(
+                        f"    {backend}: {result['duration']:.3f} s, "
+                        f"{size_in_mib / result['duration']:.1f} MiB/s, "
+                        f"peak RSS {result['rss_peak']:.1f} MiB "
+                        f"(+{result['rss_peak'] - result['rss_before']:.1f} MiB "
+                        f"while reading)"
+                    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Benchmark the buffering of the XML serialization.
+
+We merge the test data into a large environment and write it to an unbuffered
+stream over :py:data:`os.devnull`, where every write is a system call. We
+measure the number of write calls and the time spent in them without buffering
+(a flush threshold of 1) and with the given flush threshold.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+from typing import List
+
+import aas_core3.xmlization as aas_xmlization
+
+from dev_scripts.benchmark import common
+
+
+class _TimedStream(io.TextIOWrapper):
+    """Write through to an unbuffered file, and measure the write calls."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            io.FileIO(os.devnull, "w"), encoding="utf-8", write_through=True
+        )
+        self.write_count = 0
+        self.write_duration = 0.0
+
+    def write(self, s: str) -> int:
+        start = time.perf_counter()
+        result = super().write(s)
+        self.write_duration += time.perf_counter() - start
+        self.write_count += 1
+        return result
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is merged into the environment",
+        type=int,
+        default=10,
+    )
+    parser.add_argument(
+        "--flush_threshold",
+        help="Number of text fragments to buffer before writing",
+        type=int,
+        default=4096,
+    )
+    args = parser.parse_args()
+
+    environment = common.make_large_environment(
+        int(args.copies), common.load_environment_jsonables()
+    )
+    print(f"Benchmarking on {common.count_instances(environment)} instances.")
+
+    durations = []  # type: List[float]
+    write_durations = []  # type: List[float]
+
+    for flush_threshold in (1, int(args.flush_threshold)):
+        with _TimedStream() as stream:
+            with common.timed(
+                f"write with flush_threshold={flush_threshold}", durations
+            ):
+                aas_xmlization.write(environment, stream, flush_threshold)
+
+            write_durations.append(stream.write_duration)
+            print(
+                f"  {stream.write_count} write calls "
+                f"taking {stream.write_duration:.3f} s"
+            )
+
+    with common.timed("to_bytes", durations):
+        aas_xmlization.to_bytes(environment)
+
+    print(f"Speed-up in write calls: {write_durations[0] / write_durations[1]:.2f}x")
+    print(f"Speed-up in total: {durations[0] / durations[1]:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Benchmark the de-serialization of environments from XML.
+
+We de-serialize all the environments in the XML test data, as well as a large
+synthetic environment obtained by merging the test data multiple times.
+"""
+
+import argparse
+import sys
+from typing import List
+
+import aas_core3.xmlization as aas_xmlization
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is merged into the large environment",
+        type=int,
+        default=10,
+    )
+    parser.add_argument(
+        "--repetitions", help="Number of de-serializations", type=int, default=3
+    )
+    args = parser.parse_args()
+
+    texts = [
+        path.read_text(encoding="utf-8")
+        for path in sorted(
+            (common.TEST_DATA_DIR / "Xml" / "ContainedInEnvironment" / "Expected").glob(
+                "**/*.xml"
+            )
+        )
+    ]
+
+    large_text = aas_xmlization.to_str(
+        common.make_large_environment(
+            int(args.copies), common.load_environment_jsonables()
+        )
+    )
+
+    print(
+        f"Benchmarking on {len(texts)} test files and "
+        f"a synthetic environment of {len(large_text) / 2**20:.1f} MiB."
+    )
+
+    test_data_durations = []  # type: List[float]
+    large_durations = []  # type: List[float]
+
+    for i in range(int(args.repetitions)):
+        with common.timed(f"test data, run {i + 1}", test_data_durations):
+            for text in texts:
+                aas_xmlization.environment_from_str(text)
+
+        with common.timed(f"synthetic environment, run {i + 1}", large_durations):
+            aas_xmlization.environment_from_str(large_text)
+
+    print(f"Best on test data: {min(test_data_durations):.3f} s")
+    print(f"Best on the synthetic environment: {min(large_durations):.3f} s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
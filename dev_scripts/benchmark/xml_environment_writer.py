@@ -0,0 +1,82 @@
+"""
+Benchmark writing an environment incrementally to XML.
+
+We generate the submodels lazily, as an exporter reading from a database would,
+and compare building the environment first and writing it with
+:py:func:`aas_core3.xmlization.write` against passing the submodels one by one
+to :py:class:`aas_core3.xml_streaming.EnvironmentWriter`. The output is discarded.
+The peak memory is measured with :py:mod:`tracemalloc`.
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from typing import Iterator, List
+
+import aas_core3.types as aas_types
+import aas_core3.xml_streaming as aas_xml_streaming
+import aas_core3.xmlization as aas_xmlization
+
+from dev_scripts.benchmark import common
+
+
+def _generate_submodels(count: int) -> Iterator[aas_types.Submodel]:
+    """Generate :paramref:`count` submodels, each with a handful of properties."""
+    for i in range(count):
+        yield aas_types.Submodel(
+            id=f"urn:submodel{i}",
+            submodel_elements=[
+                aas_types.Property(
+                    id_short=f"property{j}",
+                    value_type=aas_types.DataTypeDefXSD.INT,
+                    value=str(i * j),
+                )
+                for j in range(5)
+            ],
+        )
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--submodels",
+        help="Number of the generated submodels",
+        type=int,
+        default=20000,
+    )
+    args = parser.parse_args()
+
+    count = int(args.submodels)
+    print(f"Benchmarking on {count} submodels.")
+
+    durations = []  # type: List[float]
+    peaks = []  # type: List[int]
+
+    with open(os.devnull, "wt", encoding="utf-8") as fid:
+        tracemalloc.start()
+        with common.timed("build the environment and write", durations):
+            aas_xmlization.write(
+                aas_types.Environment(submodels=list(_generate_submodels(count))),
+                fid,
+            )
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        with common.timed("EnvironmentWriter", durations):
+            with aas_xml_streaming.EnvironmentWriter(fid) as writer:
+                for submodel in _generate_submodels(count):
+                    writer.write(submodel)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    print(f"Peak memory building the environment: {peaks[0] / 2**20:.1f} MiB")
+    print(f"Peak memory with the writer: {peaks[1] / 2**20:.1f} MiB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
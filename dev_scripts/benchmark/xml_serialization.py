@@ -0,0 +1,49 @@
+"""
+Benchmark the serialization of a large environment to XML.
+
+We merge the test data into a large environment and serialize it repeatedly
+with :py:func:`aas_core3.xmlization.to_str`.
+"""
+
+import argparse
+import sys
+from typing import List
+
+import aas_core3.xmlization as aas_xmlization
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Number of times the test data is merged into the environment",
+        type=int,
+        default=10,
+    )
+    parser.add_argument(
+        "--repetitions", help="Number of serializations", type=int, default=5
+    )
+    args = parser.parse_args()
+
+    environment = common.make_large_environment(
+        int(args.copies), common.load_environment_jsonables()
+    )
+    print(f"Benchmarking on {common.count_instances(environment)} instances.")
+
+    durations = []  # type: List[float]
+    size = 0
+    for i in range(int(args.repetitions)):
+        with common.timed(f"to_str, run {i + 1}", durations):
+            size = len(aas_xmlization.to_str(environment))
+
+    best = min(durations)
+    print(f"Best: {best:.3f} s, {size / 2**20 / best:.1f} MiB/s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
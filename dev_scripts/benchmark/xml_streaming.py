@@ -0,0 +1,83 @@
+"""
+Benchmark the streaming de-serialization of identifiables from XML.
+
+We write environments of growing size to temporary files, and compare
+the peak memory of reading each as a whole against iterating over its
+identifiables one by one. The peak memory is measured with :py:mod:`tracemalloc`.
+"""
+
+import argparse
+import pathlib
+import sys
+import tempfile
+import tracemalloc
+from typing import List
+
+import aas_core3.xml_streaming as aas_xml_streaming
+import aas_core3.xmlization as aas_xmlization
+
+from dev_scripts.benchmark import common
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies",
+        help="Numbers of times the test data is merged into the environments",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16],
+    )
+    args = parser.parse_args()
+
+    jsonables = common.load_environment_jsonables()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for copies in args.copies:
+            path = pathlib.Path(tmp_dir) / f"environment{copies}.xml"
+            environment = common.make_large_environment(int(copies), jsonables)
+            with path.open("wt", encoding="utf-8") as fid:
+                aas_xmlization.write(environment, fid)
+            expected_count = sum(1 for _ in environment.descend_once())
+            del environment
+
+            print(
+                f"{copies} copies, {expected_count} identifiables, "
+                f"{path.stat().st_size / 2**20:.1f} MiB:"
+            )
+
+            durations = []  # type: List[float]
+
+            tracemalloc.start()
+            with common.timed("  environment_from_stream", durations):
+                with path.open("rt", encoding="utf-8") as fid:
+                    environment = aas_xmlization.environment_from_stream(fid)
+            whole_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del environment
+
+            tracemalloc.start()
+            with common.timed("  iter_identifiables_from_stream", durations):
+                with path.open("rt", encoding="utf-8") as fid:
+                    got_count = sum(
+                        1 for _ in aas_xml_streaming.iter_identifiables_from_stream(fid)
+                    )
+            streaming_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            if got_count != expected_count:
+                print(
+                    f"Expected {expected_count} identifiables, but got {got_count}",
+                    file=sys.stderr,
+                )
+                return 1
+
+            print(f"  peak memory reading whole: {whole_peak / 2**20:.1f} MiB")
+            print(f"  peak memory streaming: {streaming_peak / 2**20:.1f} MiB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Generate :py:mod:`aas_core3.copying` from the classes in :py:mod:`aas_core3.types`.
+
+The deep copier calls the constructor of each concrete class with all its
+arguments in order. We inspect the constructor signatures and their type
+annotations, so that the copier follows the meta-model whenever
+:py:mod:`aas_core3.types` has been re-generated.
+"""
+
+import argparse
+import enum
+import inspect
+import pathlib
+import sys
+import typing
+from typing import Any, Dict, List, Tuple
+
+import black
+import black.mode
+
+import aas_core3.types as aas_types
+
+_HEADER = '''\
+"""
+Copy the model instances deeply.
+
+:py:func:`copy.deepcopy` works on the model instances as well, but it goes
+through the generic machinery of :py:mod:`copy`: it looks up how to reduce
+every object, and keeps a memo of all the copied objects, including the
+strings. :py:func:`deep_copy` calls the constructor of each class directly
+instead. The immutable values, such as strings, enumeration literals and bytes,
+are shared between the original and the copy, while the instances and
+the lists are copied.
+
+The model instances are expected to form a tree. If an instance is referenced
+more than once, *e.g.*, after the references have been shared with
+:py:class:`aas_core3.interning.Interner`, each occurrence is copied separately.
+Use :py:func:`copy.deepcopy` if you need to preserve the sharing.
+
+Here is an example:
+
+.. code-block::
+
+    import aas_core3.copying as aas_copying
+    import aas_core3.types as aas_types
+
+    submodel = aas_types.Submodel(
+        id="urn:some-submodel",
+        # ... some constructor arguments ...
+    )
+
+    another_submodel = aas_copying.deep_copy(submodel)
+    another_submodel.id = "urn:another-submodel"
+
+This module is generated by ``dev_scripts/generate_copying.py`` from
+the constructors in :py:mod:`aas_core3.types`. Re-run the script whenever
+:py:mod:`aas_core3.types` changes.
+"""
+
+
+# This code has been automatically generated by dev_scripts/generate_copying.py.
+# Do NOT edit or append.
+
+
+from typing import TypeVar, cast
+
+import aas_core3.types as aas_types
+
+
+class _DeepCopier(aas_types.AbstractTransformer[aas_types.Class]):
+    """Copy the instances deeply by calling their constructors."""
+
+'''
+
+_FOOTER = '''\
+
+
+_DEEP_COPIER = _DeepCopier()
+
+ClassT = TypeVar("ClassT", bound=aas_types.Class)
+
+
+def deep_copy(that: ClassT) -> ClassT:
+    """
+    Copy :paramref:`that` and all its descendants.
+
+    :param that: instance to be copied
+    :return: the copy, structurally equal to :paramref:`that`
+    """
+    return cast(ClassT, _DEEP_COPIER.transform(that))
+
+
+# This code has been automatically generated by dev_scripts/generate_copying.py.
+# Do NOT edit or append.
+'''
+
+
+def _map_classes_to_transform_methods() -> Dict[Any, str]:
+    """Map each class to the name of its method in the abstract transformer."""
+    result = dict()  # type: Dict[Any, str]
+    for name, method in inspect.getmembers(
+        aas_types.AbstractTransformer, inspect.isfunction
+    ):
+        if name.startswith("transform_"):
+            result[typing.get_type_hints(method)["that"]] = name
+
+    return result
+
+
+_TRANSFORM_METHODS = _map_classes_to_transform_methods()
+
+
+def _unwrap_optional(hint: Any) -> Tuple[Any, bool]:
+    """Strip ``Optional`` from the :paramref:`hint`, and report if it was there."""
+    if typing.get_origin(hint) is typing.Union:
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        assert len(args) == 1, f"Unexpected union: {hint}"
+        return args[0], True
+
+    return hint, False
+
+
+def _copy_item(hint: Any, variable: str) -> str:
+    """Generate the expression copying an item of the type :paramref:`hint`."""
+    if hint in (str, bytes, bool, int, float) or (
+        inspect.isclass(hint) and issubclass(hint, enum.Enum)
+    ):
+        # The immutable values are shared between the original and the copy.
+        return variable
+
+    assert inspect.isclass(hint) and issubclass(
+        hint, aas_types.Class
+    ), f"Unexpected type annotation: {hint}"
+
+    if hint in _TRANSFORM_METHODS and not inspect.isabstract(hint):
+        return f"self.{_TRANSFORM_METHODS[hint]}({variable})"
+
+    return f"cast(aas_types.{hint.__name__}, self.transform({variable}))"
+
+
+def _copy_property(hint: Any, attribute: str) -> str:
+    """Generate the expression copying the property of the type :paramref:`hint`."""
+    inner, optional = _unwrap_optional(hint)
+
+    if typing.get_origin(inner) is list:
+        (item_hint,) = typing.get_args(inner)
+        item = _copy_item(item_hint, "item")
+        if item == "item":
+            expression = f"list({attribute})"
+        else:
+            expression = f"[{item} for item in {attribute}]"
+    else:
+        expression = _copy_item(inner, attribute)
+
+    if optional and expression != attribute:
+        expression = f"({expression} if {attribute} is not None else None)"
+
+    return expression
+
+
+def generate() -> str:
+    """Generate the code of :py:mod:`aas_core3.copying`, formatted with black."""
+    blocks = []  # type: List[str]
+
+    for cls, method in sorted(
+        _TRANSFORM_METHODS.items(),
+        key=lambda item: inspect.getsourcelines(item[0])[1],
+    ):
+        if inspect.isabstract(cls):
+            continue
+
+        hints = typing.get_type_hints(cls.__init__)
+        parameters = list(inspect.signature(cls.__init__).parameters)[1:]
+
+        arguments = "".join(
+            f"            {_copy_property(hints[parameter], 'that.' + parameter)},\n"
+            for parameter in parameters
+        )
+
+        blocks.append(
+            f"""\
+    def {method}(self, that: aas_types.{cls.__name__}) -> aas_types.{cls.__name__}:
+        \"\"\"Copy :paramref:`that` deeply.\"\"\"
+        return aas_types.{cls.__name__}(
+{arguments}        )
+"""
+        )
+
+    code = _HEADER + "\n".join(blocks) + _FOOTER
+    return black.format_str(code, mode=black.mode.Mode())
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output",
+        help="Path to the generated module",
+        default=str(pathlib.Path(aas_types.__file__).parent / "copying.py"),
+    )
+    args = parser.parse_args()
+
+    pathlib.Path(args.output).write_text(generate(), encoding="utf-8")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,6 +38,7 @@ setup(
     keywords="asset administration shell sdk industry 4.0 industrie i4.0 industry iot iiot",
     packages=find_packages(exclude=["tests", "continuous_integration", "dev_scripts"]),
     install_requires=[] if sys.version_info >= (3, 8) else ["typing_extensions"],
+    extras_require={"lxml": ["lxml"]},
     py_modules=["aas_core3"],
     package_data={"aas_core3": ["py.typed"]},
 )
@@ -4,14 +4,16 @@ import base64
 import collections.abc
 import difflib
 import enum
+import inspect
 import io
 import os
 import pathlib
 import textwrap
-from typing import Union, Sequence
+from typing import Iterable, List, Type, Union, Sequence
 
 import aas_core3.common as aas_common
 import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
 
 _REPO_ROOT = pathlib.Path(os.path.realpath(__file__)).parent.parent
 
@@ -128,3 +130,58 @@ def trace_log_as_text_file_content(log: Sequence[str]) -> str:
         writer.write(f"{entry}\n")
     writer.write("\n")
     return writer.getvalue()
+
+
+def render_errors(errors: Iterable[aas_verification.Error]) -> List[str]:
+    """
+    Render the verification :paramref:`errors` so that they can be compared.
+
+    :param errors: to be rendered
+    :return: path and cause of each error
+    """
+    return [f"{error.path}: {error.cause}" for error in errors]
+
+
+def concrete_classes() -> List[Type[aas_types.Class]]:
+    """
+    List all the concrete classes of the meta-model.
+
+    :return: classes of :py:mod:`aas_core3.types` which can be instantiated
+    """
+    result = [
+        cls
+        for cls in vars(aas_types).values()
+        if inspect.isclass(cls)
+        and issubclass(cls, aas_types.Class)
+        and not inspect.isabstract(cls)
+    ]
+    assert len(result) > 0
+    return result
+
+
+def environment_paths() -> List[pathlib.Path]:
+    """
+    List the JSON files of the test data which contain a valid environment.
+
+    :return: paths to the environments, sorted
+    """
+    paths = sorted(
+        (TEST_DATA_DIR / "Json" / "ContainedInEnvironment" / "Expected").glob(
+            "**/*.json"
+        )
+    )
+    assert len(paths) > 0
+    return paths
+
+
+def int_property(id_short: str, value: str) -> aas_types.Property:
+    """
+    Create a property of integers, to be used as a small submodel element.
+
+    :param id_short: of the property
+    :param value: of the property
+    :return: the new property
+    """
+    return aas_types.Property(
+        id_short=id_short, value_type=aas_types.DataTypeDefXSD.INT, value=value
+    )
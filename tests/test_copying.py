@@ -0,0 +1,166 @@
+"""Test the deep copies of the model instances."""
+
+# pylint: disable=missing-docstring
+
+import enum
+import inspect
+import json
+import typing
+import unittest
+from typing import Any
+
+import aas_core3.copying as aas_copying
+import aas_core3.hashing as aas_hashing
+import aas_core3.interning as aas_interning
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+import tests.common
+
+
+def _make_value(hint: Any, fill_optional: bool) -> Any:
+    if typing.get_origin(hint) is typing.Union:
+        if not fill_optional:
+            return None
+
+        (hint,) = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+
+    if typing.get_origin(hint) is list:
+        (item_hint,) = typing.get_args(hint)
+        return [_make_value(item_hint, fill_optional=False)]
+
+    if hint is str:
+        return "something"
+    if hint is bytes:
+        return b"\xDE\xAD\xBE\xEF"
+    if hint is bool:
+        return True
+    if inspect.isclass(hint) and issubclass(hint, enum.Enum):
+        return list(hint)[-1]
+
+    if inspect.isabstract(hint):
+        (hint,) = [
+            cls for cls in tests.common.concrete_classes() if issubclass(cls, hint)
+        ][:1]
+
+    return _make_instance(hint, fill_optional=False)
+
+
+def _make_instance(cls: Any, fill_optional: bool) -> aas_types.Class:
+    hints = typing.get_type_hints(cls.__init__)
+    parameters = list(inspect.signature(cls.__init__).parameters)[1:]
+
+    return cls(  # type: ignore
+        **{
+            parameter: _make_value(hints[parameter], fill_optional)
+            for parameter in parameters
+        }
+    )
+
+
+class TestDeepCopy(unittest.TestCase):
+    def test_all_constructor_arguments_are_copied(self) -> None:
+        # The test data does not set every property of every class. We set all
+        # the constructor arguments here so that the test fails if the generated
+        # deep copier drifts from the constructors in :py:mod:`aas_core3.types`.
+        classes = tests.common.concrete_classes()
+        assert len(classes) > 0
+
+        for cls in classes:
+            instance = _make_instance(cls, fill_optional=True)
+            copy = aas_copying.deep_copy(instance)
+
+            self.assertIs(cls, type(copy), f"class is {cls.__name__}")
+            self.assertIsNot(instance, copy, f"class is {cls.__name__}")
+
+            for parameter in list(inspect.signature(cls.__init__).parameters)[1:]:
+                self.assertIsNotNone(
+                    getattr(instance, parameter),
+                    f"class is {cls.__name__}, parameter is {parameter}",
+                )
+
+            self.assertTrue(
+                aas_hashing.structurally_equal(instance, copy),
+                f"class is {cls.__name__}",
+            )
+
+    def test_on_test_data(self) -> None:
+        for path in tests.common.environment_paths():
+            with path.open("rt", encoding="utf-8") as fid:
+                jsonable = json.load(fid)
+
+            environment = aas_jsonization.environment_from_jsonable(jsonable)
+            copy = aas_copying.deep_copy(environment)
+
+            self.assertTrue(
+                aas_hashing.structurally_equal(environment, copy), f"path is {path}"
+            )
+            self.assertEqual(
+                jsonable, aas_jsonization.to_jsonable(copy), f"path is {path}"
+            )
+
+            originals = {id(something) for something in environment.descend()}
+            self.assertTrue(
+                all(id(something) not in originals for something in copy.descend()),
+                f"path is {path}",
+            )
+
+    def test_immutable_values_are_shared(self) -> None:
+        blob = aas_types.Blob(
+            content_type="application/octet-stream",
+            id_short="someBlob",
+            value=b"\xDE\xAD\xBE\xEF",
+            qualifiers=[
+                aas_types.Qualifier(
+                    type="something", value_type=aas_types.DataTypeDefXSD.INT
+                )
+            ],
+        )
+
+        copy = aas_copying.deep_copy(blob)
+
+        self.assertIsNot(blob, copy)
+        self.assertIs(blob.id_short, copy.id_short)
+        self.assertIs(blob.value, copy.value)
+
+        assert blob.qualifiers is not None
+        assert copy.qualifiers is not None
+        self.assertIsNot(blob.qualifiers, copy.qualifiers)
+        self.assertIsNot(blob.qualifiers[0], copy.qualifiers[0])
+        self.assertIs(blob.qualifiers[0].value_type, copy.qualifiers[0].value_type)
+
+    def test_shared_instances_are_copied_separately(self) -> None:
+        def reference() -> aas_types.Reference:
+            return aas_types.Reference(
+                type=aas_types.ReferenceTypes.EXTERNAL_REFERENCE,
+                keys=[
+                    aas_types.Key(
+                        type=aas_types.KeyTypes.GLOBAL_REFERENCE, value="urn:something"
+                    )
+                ],
+            )
+
+        submodel = aas_types.Submodel(
+            id="urn:submodel",
+            semantic_id=reference(),
+            supplemental_semantic_ids=[reference()],
+        )
+        aas_interning.Interner().intern(submodel)
+
+        assert submodel.supplemental_semantic_ids is not None
+        self.assertIs(submodel.semantic_id, submodel.supplemental_semantic_ids[0])
+
+        copy = aas_copying.deep_copy(submodel)
+
+        assert copy.supplemental_semantic_ids is not None
+        self.assertIsNot(copy.semantic_id, copy.supplemental_semantic_ids[0])
+        assert copy.semantic_id is not None
+        self.assertTrue(
+            aas_hashing.structurally_equal(
+                copy.semantic_id, copy.supplemental_semantic_ids[0]
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
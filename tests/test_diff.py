@@ -0,0 +1,405 @@
+"""Test the comparison of two versions of a model."""
+
+# pylint: disable=missing-docstring
+
+import copy
+import json
+import unittest
+from typing import List, Tuple
+
+import aas_core3.diff as aas_diff
+import aas_core3.hashing as aas_hashing
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+import tests.common
+
+
+def _make_environment() -> aas_types.Environment:
+    return aas_types.Environment(
+        submodels=[
+            aas_types.Submodel(
+                id="urn:submodel",
+                id_short="someSubmodel",
+                submodel_elements=[
+                    tests.common.int_property("someProperty", "1"),
+                    aas_types.SubmodelElementCollection(
+                        id_short="someCollection",
+                        value=[tests.common.int_property("nestedProperty", "2")],
+                    ),
+                    aas_types.SubmodelElementList(
+                        id_short="someList",
+                        type_value_list_element=aas_types.AASSubmodelElements.PROPERTY,
+                        value_type_list_element=aas_types.DataTypeDefXSD.INT,
+                        value=[
+                            aas_types.Property(
+                                value_type=aas_types.DataTypeDefXSD.INT, value=f"{i}"
+                            )
+                            for i in range(3)
+                        ],
+                    ),
+                    aas_types.Operation(
+                        id_short="someOperation",
+                        input_variables=[
+                            aas_types.OperationVariable(
+                                value=tests.common.int_property("someInput", "3")
+                            )
+                        ],
+                    ),
+                ],
+            ),
+            aas_types.Submodel(id="urn:another-submodel"),
+        ],
+        concept_descriptions=[aas_types.ConceptDescription(id="urn:concept")],
+    )
+
+
+def _summarize(
+    changes: List[aas_diff.Change],
+) -> List[Tuple[str, str, Tuple[aas_diff.PathSegment, ...], Tuple[str, ...]]]:
+    return [
+        (
+            type(change).__name__,
+            change.identifiable_id,
+            change.path,
+            (
+                change.property_names
+                if isinstance(change, aas_diff.Modification)
+                else ()
+            ),
+        )
+        for change in changes
+    ]
+
+
+def _submodel(environment: aas_types.Environment) -> aas_types.Submodel:
+    assert environment.submodels is not None
+    return environment.submodels[0]
+
+
+def _element(environment: aas_types.Environment, i: int) -> aas_types.SubmodelElement:
+    elements = _submodel(environment).submodel_elements
+    assert elements is not None
+    return elements[i]
+
+
+class TestDiffEnvironments(unittest.TestCase):
+    def test_no_changes_on_test_data(self) -> None:
+        for path in tests.common.environment_paths():
+            with path.open("rt", encoding="utf-8") as fid:
+                jsonable = json.load(fid)
+
+            self.assertListEqual(
+                [],
+                list(
+                    aas_diff.diff_environments(
+                        aas_jsonization.environment_from_jsonable(jsonable),
+                        aas_jsonization.environment_from_jsonable(jsonable),
+                    )
+                ),
+                f"path is {path}",
+            )
+
+    def test_identifiables_added_and_removed(self) -> None:
+        old = _make_environment()
+        new = _make_environment()
+
+        assert new.submodels is not None
+        del new.submodels[1]
+        new.submodels.append(aas_types.Submodel(id="urn:new-submodel"))
+        new.concept_descriptions = None
+
+        changes = list(aas_diff.diff_environments(old, new))
+        self.assertListEqual(
+            [
+                ("Addition", "urn:new-submodel", (), ()),
+                ("Removal", "urn:another-submodel", (), ()),
+                ("Removal", "urn:concept", (), ()),
+            ],
+            _summarize(changes),
+        )
+
+        assert isinstance(changes[0], aas_diff.Addition)
+        self.assertIs(new.submodels[1], changes[0].new)
+
+    def test_identifiable_modified(self) -> None:
+        old = _make_environment()
+        new = _make_environment()
+        _submodel(new).id_short = "changed"
+        _submodel(new).category = "changed"
+
+        self.assertListEqual(
+            [("Modification", "urn:submodel", (), ("category", "id_short"))],
+            _summarize(list(aas_diff.diff_environments(old, new))),
+        )
+
+    def test_nested_element_modified(self) -> None:
+        old = _make_environment()
+        new = _make_environment()
+
+        collection = _element(new, 1)
+        assert isinstance(collection, aas_types.SubmodelElementCollection)
+        assert collection.value is not None
+        nested = collection.value[0]
+        assert isinstance(nested, aas_types.Property)
+        nested.value = "changed"
+
+        changes = list(aas_diff.diff_environments(old, new))
+        self.assertListEqual(
+            [
+                (
+                    "Modification",
+                    "urn:submodel",
+                    ("someCollection", "nestedProperty"),
+                    ("value",),
+                )
+            ],
+            _summarize(changes),
+        )
+
+        assert isinstance(changes[0], aas_diff.Modification)
+        self.assertIs(nested, changes[0].new)
+
+    def test_elements_added_and_removed(self) -> None:
+        old = _make_environment()
+        new = _make_environment()
+
+        elements = _submodel(new).submodel_elements
+        assert elements is not None
+        del elements[0]
+        elements.append(tests.common.int_property("anotherProperty", "4"))
+
+        self.assertListEqual(
+            [
+                ("Addition", "urn:submodel", ("anotherProperty",), ()),
+                ("Removal", "urn:submodel", ("someProperty",), ()),
+            ],
+            _summarize(list(aas_diff.diff_environments(old, new))),
+        )
+
+    def test_element_type_changed(self) -> None:
+        old = _make_environment()
+        new = _make_environment()
+
+        elements = _submodel(new).submodel_elements
+        assert elements is not None
+        elements[0] = aas_types.Range(
+            id_short="someProperty", value_type=aas_types.DataTypeDefXSD.INT
+        )
+
+        self.assertListEqual(
+            [
+                ("Removal", "urn:submodel", ("someProperty",), ()),
+                ("Addition", "urn:submodel", ("someProperty",), ()),
+            ],
+            _summarize(list(aas_diff.diff_environments(old, new))),
+        )
+
+    def test_relationship_replaced_by_annotated_relationship(self) -> None:
+        def reference() -> aas_types.Reference:
+            return aas_types.Reference(
+                type=aas_types.ReferenceTypes.EXTERNAL_REFERENCE,
+                keys=[
+                    aas_types.Key(
+                        type=aas_types.KeyTypes.GLOBAL_REFERENCE, value="urn:something"
+                    )
+                ],
+            )
+
+        old = _make_environment()
+        new = _make_environment()
+
+        old_elements = _submodel(old).submodel_elements
+        assert old_elements is not None
+        old_elements[0] = aas_types.RelationshipElement(
+            first=reference(), second=reference(), id_short="someProperty"
+        )
+
+        new_elements = _submodel(new).submodel_elements
+        assert new_elements is not None
+        new_elements[0] = aas_types.AnnotatedRelationshipElement(
+            first=reference(),
+            second=reference(),
+            id_short="someProperty",
+            annotations=[tests.common.int_property("someAnnotation", "1")],
+        )
+
+        expected = [
+            ("Removal", "urn:submodel", ("someProperty",), ()),
+            ("Addition", "urn:submodel", ("someProperty",), ()),
+        ]
+
+        self.assertListEqual(
+            expected, _summarize(list(aas_diff.diff_environments(old, new)))
+        )
+        self.assertListEqual(
+            expected,
+            _summarize(
+                list(aas_diff.diff_environments(old, new, compare_structurally=True))
+            ),
+        )
+
+    def test_list_elements_matched_by_index(self) -> None:
+        old = _make_environment()
+        new = _make_environment()
+
+        some_list = _element(new, 2)
+        assert isinstance(some_list, aas_types.SubmodelElementList)
+        assert some_list.value is not None
+        del some_list.value[0]
+
+        self.assertListEqual(
+            [
+                ("Modification", "urn:submodel", ("someList", 0), ("value",)),
+                ("Modification", "urn:submodel", ("someList", 1), ("value",)),
+                ("Removal", "urn:submodel", ("someList", 2), ()),
+            ],
+            _summarize(list(aas_diff.diff_environments(old, new))),
+        )
+
+    def test_operation_variable_modified(self) -> None:
+        old = _make_environment()
+        new = _make_environment()
+
+        operation = _element(new, 3)
+        assert isinstance(operation, aas_types.Operation)
+        assert operation.input_variables is not None
+        variable_value = operation.input_variables[0].value
+        assert isinstance(variable_value, aas_types.Property)
+        variable_value.value = "changed"
+
+        self.assertListEqual(
+            [
+                (
+                    "Modification",
+                    "urn:submodel",
+                    ("someOperation", "someInput"),
+                    ("value",),
+                )
+            ],
+            _summarize(list(aas_diff.diff_environments(old, new))),
+        )
+
+    def test_duplicate_ids_matched_in_order(self) -> None:
+        old = aas_types.Environment(
+            submodels=[
+                aas_types.Submodel(id="urn:duplicate", id_short="first"),
+                aas_types.Submodel(id="urn:duplicate", id_short="second"),
+            ]
+        )
+        new = copy.deepcopy(old)
+        assert new.submodels is not None
+        new.submodels[1].id_short = "changed"
+
+        self.assertListEqual(
+            [("Modification", "urn:duplicate", (), ("id_short",))],
+            _summarize(list(aas_diff.diff_environments(old, new))),
+        )
+
+    def test_fingerprinter_is_reused(self) -> None:
+        old = _make_environment()
+        new = _make_environment()
+        _submodel(new).id_short = "changed"
+
+        fingerprinter = aas_hashing.Fingerprinter()
+        list(aas_diff.diff_environments(old, new, fingerprinter))
+
+        self.assertGreater(len(fingerprinter), 0)
+        for something in _submodel(old).descend():
+            self.assertEqual(
+                aas_hashing.fingerprint(something), fingerprinter.fingerprint(something)
+            )
+
+    def test_same_changes_when_compared_structurally(self) -> None:
+        old = _make_environment()
+        new = _make_environment()
+        _submodel(new).id_short = "changed"
+
+        operation = _element(new, 3)
+        assert isinstance(operation, aas_types.Operation)
+        operation.input_variables = None
+
+        expected = _summarize(list(aas_diff.diff_environments(old, new)))
+        self.assertGreater(len(expected), 0)
+
+        self.assertListEqual(
+            expected,
+            _summarize(
+                list(aas_diff.diff_environments(old, new, compare_structurally=True))
+            ),
+        )
+        self.assertListEqual(
+            expected,
+            _summarize(
+                list(aas_diff.diff_environments(old, new, aas_hashing.Fingerprinter()))
+            ),
+        )
+
+    def test_fingerprinter_and_compare_structurally_exclude_each_other(
+        self,
+    ) -> None:
+        with self.assertRaises(ValueError):
+            list(
+                aas_diff.diff_environments(
+                    _make_environment(),
+                    _make_environment(),
+                    aas_hashing.Fingerprinter(),
+                    compare_structurally=True,
+                )
+            )
+
+    def test_many_duplicate_ids_matched_in_order(self) -> None:
+        def environment(value: str) -> aas_types.Environment:
+            return aas_types.Environment(
+                concept_descriptions=[
+                    aas_types.ConceptDescription(
+                        id="urn:duplicate", id_short=f"something{i}{value}"
+                    )
+                    for i in range(1000)
+                ]
+            )
+
+        changes = list(aas_diff.diff_environments(environment(""), environment("x")))
+
+        self.assertEqual(1000, len(changes))
+        self.assertListEqual(
+            [f"something{i}x" for i in range(1000)],
+            [
+                change.new.id_short
+                for change in changes
+                if isinstance(change, aas_diff.Modification)
+                and isinstance(change.new, aas_types.ConceptDescription)
+            ],
+        )
+
+
+class TestDiffIdentifiables(unittest.TestCase):
+    def test_submodels(self) -> None:
+        old = _submodel(_make_environment())
+        new = _submodel(_make_environment())
+        new.id = "urn:changed"
+
+        self.assertListEqual(
+            [("Modification", "urn:changed", (), ("id",))],
+            _summarize(list(aas_diff.diff_identifiables(old, new))),
+        )
+
+    def test_different_types(self) -> None:
+        self.assertListEqual(
+            [
+                ("Removal", "urn:something", (), ()),
+                ("Addition", "urn:something", (), ()),
+            ],
+            _summarize(
+                list(
+                    aas_diff.diff_identifiables(
+                        aas_types.Submodel(id="urn:something"),
+                        aas_types.ConceptDescription(id="urn:something"),
+                    )
+                )
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
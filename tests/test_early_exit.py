@@ -0,0 +1,76 @@
+"""Test the early exit of the verification."""
+
+# pylint: disable=missing-docstring
+
+import json
+import unittest
+from typing import List
+
+import aas_core3.fast_verification as aas_fast_verification
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+import tests.common
+
+
+def _load_invalid_environments() -> List[aas_types.Environment]:
+    paths = sorted(
+        (
+            tests.common.TEST_DATA_DIR
+            / "Json"
+            / "ContainedInEnvironment"
+            / "Unexpected"
+            / "Invalid"
+        ).glob("**/*.json")
+    )
+    assert len(paths) > 0
+
+    environments = []  # type: List[aas_types.Environment]
+    for path in paths:
+        with path.open("rt") as fid:
+            jsonable = json.load(fid)
+
+        environments.append(aas_jsonization.environment_from_jsonable(jsonable))
+
+    return environments
+
+
+class TestEarlyExit(unittest.TestCase):
+    def test_negative_max_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            list(aas_fast_verification.verify(aas_types.Environment(), max_errors=-1))
+
+    def test_max_errors_is_prefix(self) -> None:
+        environment = aas_types.Environment(
+            submodels=[aas_types.Submodel(id="", id_short="") for _ in range(3)]
+        )
+
+        expected = tests.common.render_errors(
+            list(aas_verification.verify(environment))
+        )
+        assert len(expected) > 2
+
+        for max_errors in range(len(expected) + 2):
+            self.assertListEqual(
+                expected[:max_errors],
+                tests.common.render_errors(
+                    list(
+                        aas_fast_verification.verify(environment, max_errors=max_errors)
+                    )
+                ),
+            )
+
+    def test_is_valid_against_verify(self) -> None:
+        environments = _load_invalid_environments()
+        environments.append(aas_types.Environment())
+
+        for environment in environments:
+            self.assertEqual(
+                len(list(aas_verification.verify(environment))) == 0,
+                aas_fast_verification.is_valid(environment),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""Test the fingerprints of the model instances."""
+
+# pylint: disable=missing-docstring
+
+import copy
+import json
+import unittest
+
+import aas_core3.hashing as aas_hashing
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+import tests.common
+
+
+def _load_maximal_submodel_environment() -> aas_types.Environment:
+    path = (
+        tests.common.TEST_DATA_DIR
+        / "Json"
+        / "ContainedInEnvironment"
+        / "Expected"
+        / "Submodel"
+        / "maximal.json"
+    )
+    with path.open("rt", encoding="utf-8") as fid:
+        jsonable = json.load(fid)
+
+    return aas_jsonization.environment_from_jsonable(jsonable)
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_stable(self) -> None:
+        # The digests are meant to be stored. If this test breaks, the digests
+        # stored by the users become stale.
+        self.assertEqual(
+            "094366659782d9f8008885cca35ab0a0a7a88a710d0c7a508e474dfd826d5e65",
+            aas_hashing.fingerprint(
+                aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value="urn:something")
+            ).hex(),
+        )
+
+    def test_on_test_data(self) -> None:
+        for path in tests.common.environment_paths():
+            with path.open("rt", encoding="utf-8") as fid:
+                jsonable = json.load(fid)
+
+            environment = aas_jsonization.environment_from_jsonable(jsonable)
+            another = aas_jsonization.environment_from_jsonable(jsonable)
+
+            self.assertEqual(
+                aas_hashing.fingerprint(environment),
+                aas_hashing.fingerprint(another),
+                f"path is {path}",
+            )
+
+    def test_ambiguous_structures_differ(self) -> None:
+        def reference() -> aas_types.Reference:
+            return aas_types.Reference(
+                type=aas_types.ReferenceTypes.EXTERNAL_REFERENCE,
+                keys=[
+                    aas_types.Key(
+                        type=aas_types.KeyTypes.GLOBAL_REFERENCE, value="urn:something"
+                    )
+                ],
+            )
+
+        fingerprints = [
+            aas_hashing.fingerprint(instance)
+            for instance in [
+                aas_types.Submodel(id="urn:something"),
+                aas_types.Submodel(id="urn:something", submodel_elements=[]),
+                aas_types.Submodel(id="urn:something", id_short="something"),
+                aas_types.Submodel(id="urn:something", category="something"),
+                aas_types.Submodel(id="urn:something", semantic_id=reference()),
+                aas_types.Submodel(
+                    id="urn:something", supplemental_semantic_ids=[reference()]
+                ),
+                aas_types.Submodel(id="urn:something-else"),
+                aas_types.ConceptDescription(id="urn:something"),
+            ]
+        ]
+
+        self.assertEqual(len(fingerprints), len(set(fingerprints)))
+
+    def test_subtrees_are_cached(self) -> None:
+        environment = _load_maximal_submodel_environment()
+
+        fingerprinter = aas_hashing.Fingerprinter()
+        fingerprinter.fingerprint(environment)
+
+        instances = {id(something) for something in environment.descend()}
+        self.assertEqual(len(instances) + 1, len(fingerprinter))
+
+        for something in environment.descend():
+            self.assertEqual(
+                aas_hashing.fingerprint(something), fingerprinter.fingerprint(something)
+            )
+
+        self.assertEqual(len(instances) + 1, len(fingerprinter))
+
+    def test_every_change_is_detected(self) -> None:
+        environment = _load_maximal_submodel_environment()
+        expected = aas_hashing.fingerprint(environment)
+
+        key_count = sum(
+            1
+            for something in environment.descend()
+            if isinstance(something, aas_types.Key)
+        )
+        self.assertGreater(key_count, 0)
+
+        for i in range(key_count):
+            another = copy.deepcopy(environment)
+            key = [
+                something
+                for something in another.descend()
+                if isinstance(something, aas_types.Key)
+            ][i]
+            key.value += "-changed"
+
+            self.assertNotEqual(expected, aas_hashing.fingerprint(another))
+
+    def test_forget(self) -> None:
+        submodel = aas_types.Submodel(
+            id="urn:something",
+            submodel_elements=[
+                aas_types.Property(
+                    id_short="something", value_type=aas_types.DataTypeDefXSD.INT
+                )
+            ],
+        )
+
+        fingerprinter = aas_hashing.Fingerprinter()
+        before = fingerprinter.fingerprint(submodel)
+
+        assert submodel.submodel_elements is not None
+        element = submodel.submodel_elements[0]
+        assert isinstance(element, aas_types.Property)
+        element.value = "1984"
+
+        # The change is not visible until the changed instance and its ancestors
+        # have been forgotten.
+        self.assertEqual(before, fingerprinter.fingerprint(submodel))
+
+        fingerprinter.forget(element)
+        fingerprinter.forget(submodel)
+
+        after = fingerprinter.fingerprint(submodel)
+        self.assertNotEqual(before, after)
+        self.assertEqual(aas_hashing.fingerprint(submodel), after)
+
+        fingerprinter.clear()
+        self.assertEqual(0, len(fingerprinter))
+
+
+if __name__ == "__main__":
+    unittest.main()
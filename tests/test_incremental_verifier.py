@@ -0,0 +1,198 @@
+"""Test the incremental re-verification after in-place edits."""
+
+# pylint: disable=missing-docstring
+
+import json
+import unittest
+from typing import List
+
+import aas_core3.incremental_verification as aas_incremental_verification
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+import tests.common
+
+
+class TestIncrementalVerifier(unittest.TestCase):
+    def setUp(self) -> None:
+        self.a_property = aas_types.Property(
+            id_short="aProperty",
+            value_type=aas_types.DataTypeDefXSD.INT,
+            value="1984",
+        )
+
+        self.another_property = aas_types.Property(
+            id_short="anotherProperty",
+            value_type=aas_types.DataTypeDefXSD.INT,
+            value="2001",
+        )
+
+        self.collection = aas_types.SubmodelElementCollection(
+            id_short="aCollection", value=[self.a_property]
+        )
+
+        self.environment = aas_types.Environment(
+            submodels=[
+                aas_types.Submodel(
+                    id="urn:something",
+                    submodel_elements=[self.collection, self.another_property],
+                )
+            ]
+        )
+
+    def assert_same_as_verify(
+        self, verifier: aas_incremental_verification.IncrementalVerifier
+    ) -> List[str]:
+        expected = tests.common.render_errors(
+            list(aas_verification.verify(self.environment))
+        )
+        got = tests.common.render_errors(list(verifier.verify(self.environment)))
+        self.assertListEqual(expected, got)
+        return got
+
+    def test_edit_property(self) -> None:
+        verifier = aas_incremental_verification.IncrementalVerifier()
+        self.assertListEqual([], self.assert_same_as_verify(verifier))
+
+        cached_of_another = verifier._results[id(self.another_property)]
+
+        self.a_property.value = "not a number"
+        verifier.mark_dirty(self.a_property)
+
+        self.assertIsNone(verifier._results.get(id(self.a_property), None))
+        self.assertIsNone(verifier._results.get(id(self.collection), None))
+        self.assertIsNone(verifier._results.get(id(self.environment), None))
+
+        errors = self.assert_same_as_verify(verifier)
+        self.assertEqual(1, len(errors))
+        self.assertTrue(
+            errors[0].startswith(".submodels[0].submodel_elements[0].value[0]:"),
+            errors[0],
+        )
+
+        # The untouched sibling has not been re-verified.
+        self.assertIs(cached_of_another, verifier._results[id(self.another_property)])
+
+        # Repeated verification without edits yields the same errors.
+        self.assertEqual(1, len(self.assert_same_as_verify(verifier)))
+
+        self.a_property.value = "1984"
+        verifier.mark_dirty(self.a_property)
+        self.assertListEqual([], self.assert_same_as_verify(verifier))
+
+    def test_append_to_collection(self) -> None:
+        verifier = aas_incremental_verification.IncrementalVerifier()
+        self.assertListEqual([], self.assert_same_as_verify(verifier))
+
+        assert self.collection.value is not None
+        self.collection.value.insert(
+            0,
+            aas_types.Property(
+                id_short="aProperty", value_type=aas_types.DataTypeDefXSD.STRING
+            ),
+        )
+        verifier.mark_dirty(self.collection)
+
+        errors = self.assert_same_as_verify(verifier)
+        self.assertEqual(1, len(errors))
+        self.assertIn("ID-shorts of the value must be unique", errors[0])
+
+        # The paths of the cached errors follow the new positions in the list.
+        self.a_property.value = "not a number"
+        verifier.mark_dirty(self.a_property)
+        errors = self.assert_same_as_verify(verifier)
+        self.assertEqual(2, len(errors))
+        self.assertTrue(
+            errors[1].startswith(".submodels[0].submodel_elements[0].value[1]:"),
+            errors[1],
+        )
+
+    def test_forget_removed_subtree(self) -> None:
+        verifier = aas_incremental_verification.IncrementalVerifier()
+        self.assertListEqual([], self.assert_same_as_verify(verifier))
+
+        submodel = (self.environment.submodels or [])[0]
+        assert submodel.submodel_elements is not None
+        submodel.submodel_elements.remove(self.collection)
+        verifier.forget(self.collection, submodel)
+        verifier.mark_dirty(submodel)
+
+        for something in [self.collection, self.a_property]:
+            self.assertNotIn(id(something), verifier._results)
+            self.assertNotIn(id(something), verifier._parents)
+
+        self.assertListEqual([], self.assert_same_as_verify(verifier))
+        self.assertEqual(
+            {id(something) for something in self.environment.descend()}
+            | {id(self.environment)},
+            set(verifier._results.keys()),
+        )
+
+    def test_forget_keeps_shared_descendants(self) -> None:
+        shared = aas_types.Reference(
+            type=aas_types.ReferenceTypes.EXTERNAL_REFERENCE,
+            keys=[
+                aas_types.Key(
+                    type=aas_types.KeyTypes.GLOBAL_REFERENCE, value="urn:something"
+                )
+            ],
+        )
+        self.a_property.semantic_id = shared
+        self.another_property.semantic_id = shared
+
+        verifier = aas_incremental_verification.IncrementalVerifier()
+        self.assertListEqual([], self.assert_same_as_verify(verifier))
+
+        submodel = (self.environment.submodels or [])[0]
+        assert submodel.submodel_elements is not None
+        submodel.submodel_elements.remove(self.collection)
+        verifier.forget(self.collection, submodel)
+        verifier.mark_dirty(submodel)
+
+        self.assertNotIn(id(self.a_property), verifier._results)
+        self.assertIn(id(shared), verifier._results)
+        self.assertEqual(
+            [id(self.another_property)], list(verifier._parents[id(shared)].keys())
+        )
+
+        # The shared reference still invalidates its remaining parent.
+        shared.keys[0].value = ""
+        verifier.mark_dirty(shared.keys[0])
+        self.assertNotIn(id(self.another_property), verifier._results)
+        self.assertEqual(1, len(self.assert_same_as_verify(verifier)))
+
+    def test_on_test_data(self) -> None:
+        paths = sorted(
+            (
+                tests.common.TEST_DATA_DIR
+                / "Json"
+                / "ContainedInEnvironment"
+                / "Unexpected"
+                / "Invalid"
+            ).glob("**/*.json")
+        )
+
+        verifier = aas_incremental_verification.IncrementalVerifier()
+
+        for path in paths:
+            with path.open("rt") as fid:
+                jsonable = json.load(fid)
+
+            environment = aas_jsonization.environment_from_jsonable(jsonable)
+
+            expected = tests.common.render_errors(
+                list(aas_verification.verify(environment))
+            )
+
+            # Verify twice to check the cached results as well.
+            for _ in range(2):
+                self.assertListEqual(
+                    expected,
+                    tests.common.render_errors(list(verifier.verify(environment))),
+                    f"path is {path}",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
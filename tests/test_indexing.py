@@ -0,0 +1,119 @@
+"""Test the index of identifiables in an environment."""
+
+# pylint: disable=missing-docstring
+
+import json
+import unittest
+
+import aas_core3.indexing as aas_indexing
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+import tests.common
+
+
+class TestEnvironmentIndex(unittest.TestCase):
+    def test_empty(self) -> None:
+        index = aas_indexing.EnvironmentIndex()
+
+        self.assertEqual(0, len(index))
+        self.assertIsNone(index.find("something"))
+        self.assertListEqual([], list(index.duplicates()))
+
+    def test_find_by_type(self) -> None:
+        shell = aas_types.AssetAdministrationShell(
+            id="urn:shell",
+            asset_information=aas_types.AssetInformation(
+                asset_kind=aas_types.AssetKind.INSTANCE,
+                global_asset_id="urn:asset",
+            ),
+        )
+        submodel = aas_types.Submodel(id="urn:submodel")
+        concept_description = aas_types.ConceptDescription(id="urn:concept")
+
+        index = aas_indexing.EnvironmentIndex(
+            aas_types.Environment(
+                asset_administration_shells=[shell],
+                submodels=[submodel],
+                concept_descriptions=[concept_description],
+            )
+        )
+
+        self.assertEqual(3, len(index))
+        self.assertIn("urn:submodel", index)
+
+        self.assertIs(shell, index.find("urn:shell"))
+        self.assertIs(shell, index.find_asset_administration_shell("urn:shell"))
+        self.assertIs(submodel, index.find_submodel("urn:submodel"))
+        self.assertIs(
+            concept_description, index.find_concept_description("urn:concept")
+        )
+
+        self.assertIsNone(index.find_submodel("urn:shell"))
+        self.assertIsNone(index.find_concept_description("urn:submodel"))
+
+    def test_duplicates(self) -> None:
+        first = aas_types.Submodel(id="urn:something")
+        second = aas_types.ConceptDescription(id="urn:something")
+        unique = aas_types.Submodel(id="urn:unique")
+
+        index = aas_indexing.EnvironmentIndex(
+            aas_types.Environment(
+                submodels=[first, unique], concept_descriptions=[second]
+            )
+        )
+
+        duplicates = list(index.duplicates())
+        self.assertEqual(1, len(duplicates))
+        self.assertEqual("urn:something", duplicates[0].id)
+        self.assertListEqual([first, second], list(duplicates[0].identifiables))
+
+        self.assertIs(first, index.find("urn:something"))
+        self.assertIs(second, index.find_concept_description("urn:something"))
+
+    def test_add_and_remove(self) -> None:
+        index = aas_indexing.EnvironmentIndex()
+
+        first = aas_types.Submodel(id="urn:something")
+        second = aas_types.Submodel(id="urn:something")
+
+        self.assertTrue(index.add(first))
+        self.assertFalse(index.add(second))
+        self.assertEqual(1, len(list(index.duplicates())))
+
+        index.remove(first)
+        self.assertIs(second, index.find_submodel("urn:something"))
+        self.assertListEqual([], list(index.duplicates()))
+
+        index.remove(second)
+        self.assertIsNone(index.find("urn:something"))
+        self.assertEqual(0, len(index))
+
+        with self.assertRaises(KeyError):
+            index.remove(second)
+
+    def test_on_test_data(self) -> None:
+        paths = sorted(
+            (
+                tests.common.TEST_DATA_DIR
+                / "Json"
+                / "ContainedInEnvironment"
+                / "Expected"
+            ).glob("**/*.json")
+        )
+
+        for path in paths:
+            with path.open("rt") as fid:
+                jsonable = json.load(fid)
+
+            environment = aas_jsonization.environment_from_jsonable(jsonable)
+
+            index = aas_indexing.EnvironmentIndex(environment)
+
+            for identifiable in environment.descend_once():
+                assert isinstance(identifiable, aas_types.Identifiable)
+                self.assertIsNotNone(index.find(identifiable.id), f"path is {path}")
+
+
+if __name__ == "__main__":
+    unittest.main()
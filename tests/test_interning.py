@@ -0,0 +1,330 @@
+"""Test the sharing of structurally equal references."""
+
+# pylint: disable=missing-docstring
+
+import io
+import json
+import unittest
+
+import aas_core3.interning as aas_interning
+import aas_core3.json_streaming as aas_json_streaming
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+import aas_core3.xml_streaming as aas_xml_streaming
+import aas_core3.xmlization as aas_xmlization
+
+import tests.common
+
+
+def _model_reference(value: str) -> aas_types.Reference:
+    return aas_types.Reference(
+        type=aas_types.ReferenceTypes.MODEL_REFERENCE,
+        keys=[aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value=value)],
+    )
+
+
+def _external_reference(value: str) -> aas_types.Reference:
+    return aas_types.Reference(
+        type=aas_types.ReferenceTypes.EXTERNAL_REFERENCE,
+        keys=[aas_types.Key(type=aas_types.KeyTypes.GLOBAL_REFERENCE, value=value)],
+    )
+
+
+def _templated_environment() -> aas_types.Environment:
+    return aas_types.Environment(
+        submodels=[
+            aas_types.Submodel(
+                id=f"urn:submodel{i}",
+                semantic_id=_external_reference("urn:some-template"),
+                submodel_elements=[
+                    aas_types.Property(
+                        id_short=f"property{j}",
+                        value_type=aas_types.DataTypeDefXSD.INT,
+                        semantic_id=_external_reference(f"urn:some-property{j}"),
+                        supplemental_semantic_ids=[
+                            _external_reference("urn:something-supplemental")
+                        ],
+                    )
+                    for j in range(3)
+                ],
+            )
+            for i in range(5)
+        ]
+    )
+
+
+class TestInterner(unittest.TestCase):
+    def test_key(self) -> None:
+        interner = aas_interning.Interner()
+
+        first = aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value="urn:something")
+        second = aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value="urn:something")
+        other = aas_types.Key(type=aas_types.KeyTypes.PROPERTY, value="urn:something")
+
+        self.assertIs(first, interner.key(first))
+        self.assertIs(first, interner.key(second))
+        self.assertIs(other, interner.key(other))
+
+        self.assertEqual(1, interner.hits)
+        self.assertEqual(2, interner.misses)
+        self.assertEqual(2, len(interner))
+
+    def test_reference(self) -> None:
+        interner = aas_interning.Interner()
+
+        first = interner.reference(_model_reference("urn:something"))
+        self.assertIs(first, interner.reference(_model_reference("urn:something")))
+
+        self.assertIsNot(
+            first, interner.reference(_external_reference("urn:something"))
+        )
+        self.assertIsNot(
+            first, interner.reference(_model_reference("urn:something-else"))
+        )
+
+    def test_keys_are_shared_among_different_references(self) -> None:
+        interner = aas_interning.Interner()
+
+        first = interner.reference(_model_reference("urn:something"))
+        second = interner.reference(
+            aas_types.Reference(
+                type=aas_types.ReferenceTypes.MODEL_REFERENCE,
+                keys=[
+                    aas_types.Key(
+                        type=aas_types.KeyTypes.SUBMODEL, value="urn:something"
+                    ),
+                    aas_types.Key(
+                        type=aas_types.KeyTypes.PROPERTY, value="some_id_short"
+                    ),
+                ],
+            )
+        )
+
+        self.assertIsNot(first, second)
+        self.assertIs(first.keys[0], second.keys[0])
+
+    def test_referred_semantic_id(self) -> None:
+        interner = aas_interning.Interner()
+
+        def make(referred: str) -> aas_types.Reference:
+            reference = _model_reference("urn:something")
+            reference.referred_semantic_id = _external_reference(referred)
+            return reference
+
+        first = interner.reference(make("urn:referred"))
+        self.assertIs(first, interner.reference(make("urn:referred")))
+        self.assertIsNot(first, interner.reference(make("urn:referred-else")))
+        self.assertIsNot(first, interner.reference(_model_reference("urn:something")))
+
+        assert first.referred_semantic_id is not None
+        self.assertIs(
+            first.referred_semantic_id,
+            interner.reference(_external_reference("urn:referred")),
+        )
+
+    def test_intern(self) -> None:
+        environment = _templated_environment()
+        expected = aas_jsonization.to_jsonable(environment)
+
+        interner = aas_interning.Interner()
+        self.assertIs(environment, interner.intern(environment))
+
+        self.assertEqual(expected, aas_jsonization.to_jsonable(environment))
+
+        assert environment.submodels is not None
+        submodels = environment.submodels
+        for submodel in submodels[1:]:
+            self.assertIs(submodels[0].semantic_id, submodel.semantic_id)
+
+            assert submodel.submodel_elements is not None
+            assert submodels[0].submodel_elements is not None
+            for element, first_element in zip(
+                submodel.submodel_elements, submodels[0].submodel_elements
+            ):
+                self.assertIs(first_element.semantic_id, element.semantic_id)
+
+                assert element.supplemental_semantic_ids is not None
+                assert first_element.supplemental_semantic_ids is not None
+                self.assertIs(
+                    first_element.supplemental_semantic_ids[0],
+                    element.supplemental_semantic_ids[0],
+                )
+
+        # 1 template, 3 properties and 1 supplemental semantic ID, each with one key
+        self.assertEqual(10, len(interner))
+
+    def test_intern_reference(self) -> None:
+        interner = aas_interning.Interner()
+
+        first = _model_reference("urn:something")
+        self.assertIs(first, interner.intern(first))
+        self.assertIs(first, interner.intern(_model_reference("urn:something")))
+
+    def test_intern_on_test_data(self) -> None:
+        interner = aas_interning.Interner()
+
+        for path in tests.common.environment_paths():
+            with path.open("rt", encoding="utf-8") as fid:
+                jsonable = json.load(fid)
+
+            environment = aas_jsonization.environment_from_jsonable(jsonable)
+            interner.intern(environment)
+
+            self.assertEqual(
+                jsonable, aas_jsonization.to_jsonable(environment), f"path is {path}"
+            )
+
+            # Every reference in the environment must be a shared one.
+            for something in environment.descend():
+                if isinstance(something, aas_types.Reference):
+                    self.assertIs(something, interner.reference(something))
+
+    def test_clear(self) -> None:
+        interner = aas_interning.Interner()
+        first = interner.reference(_model_reference("urn:something"))
+        interner.reference(_model_reference("urn:something"))
+
+        interner.clear()
+        self.assertEqual(0, len(interner))
+        self.assertEqual(0, interner.hits)
+        self.assertEqual(0, interner.misses)
+
+        self.assertIsNot(first, interner.reference(_model_reference("urn:something")))
+
+
+class TestStringInterner(unittest.TestCase):
+    def test_string(self) -> None:
+        interner = aas_interning.StringInterner()
+
+        first = "".join(["some", "Thing"])
+        second = "".join(["some", "Thing"])
+        self.assertIsNot(first, second)
+
+        self.assertIs(first, interner.string(first))
+        self.assertIs(first, interner.string(second))
+
+        self.assertEqual(1, interner.hits)
+        self.assertEqual(1, interner.misses)
+        self.assertEqual(1, len(interner))
+
+    def test_bounded(self) -> None:
+        interner = aas_interning.StringInterner(max_size=2)
+
+        for i in range(5):
+            interner.string(f"something{i}")
+            self.assertLessEqual(len(interner), 2)
+
+        self.assertEqual(5, interner.misses)
+
+    def test_invalid_max_size(self) -> None:
+        with self.assertRaises(ValueError):
+            aas_interning.StringInterner(max_size=0)
+
+    def test_intern(self) -> None:
+        environment = _templated_environment()
+        assert environment.submodels is not None
+        for submodel in environment.submodels:
+            submodel.category = "".join(["PARAM", "ETER"])
+            submodel.id_short = "".join(["some", "IdShort"])
+
+        expected = aas_jsonization.to_jsonable(environment)
+
+        interner = aas_interning.StringInterner(properties=["id_short"])
+        interner.intern(environment)
+
+        self.assertEqual(expected, aas_jsonization.to_jsonable(environment))
+
+        submodels = environment.submodels
+        for submodel in submodels[1:]:
+            self.assertIs(submodels[0].id_short, submodel.id_short)
+
+            # The category has not been selected.
+            self.assertIsNot(submodels[0].category, submodel.category)
+
+    def test_intern_on_test_data(self) -> None:
+        interner = aas_interning.StringInterner()
+
+        for path in tests.common.environment_paths():
+            with path.open("rt", encoding="utf-8") as fid:
+                jsonable = json.load(fid)
+
+            environment = aas_jsonization.environment_from_jsonable(jsonable)
+            interner.intern(environment)
+
+            self.assertEqual(
+                jsonable, aas_jsonization.to_jsonable(environment), f"path is {path}"
+            )
+
+        self.assertGreater(interner.hits, 0)
+
+
+class TestDeserializationWithInterner(unittest.TestCase):
+    def test_jsonization(self) -> None:
+        environment = _templated_environment()
+        text = json.dumps(aas_jsonization.to_jsonable(environment))
+
+        interner = aas_interning.Interner()
+        submodels = [
+            identifiable
+            for identifiable in aas_json_streaming.iter_identifiables_from_stream(
+                io.StringIO(text), interner=interner
+            )
+            if isinstance(identifiable, aas_types.Submodel)
+        ]
+
+        self.assertEqual(5, len(submodels))
+        for submodel in submodels[1:]:
+            self.assertIs(submodels[0].semantic_id, submodel.semantic_id)
+
+        self.assertEqual(10, len(interner))
+
+    def test_xmlization(self) -> None:
+        environment = _templated_environment()
+        text = aas_xmlization.to_str(environment)
+
+        interner = aas_interning.Interner()
+        submodels = [
+            identifiable
+            for identifiable in aas_xml_streaming.iter_identifiables_from_stream(
+                io.StringIO(text), interner=interner
+            )
+            if isinstance(identifiable, aas_types.Submodel)
+        ]
+
+        self.assertEqual(5, len(submodels))
+        for submodel in submodels[1:]:
+            self.assertIs(submodels[0].semantic_id, submodel.semantic_id)
+
+        self.assertEqual(10, len(interner))
+
+    def test_string_interner(self) -> None:
+        environment = _templated_environment()
+
+        for identifiables in (
+            aas_json_streaming.iter_identifiables_from_stream(
+                io.StringIO(json.dumps(aas_jsonization.to_jsonable(environment))),
+                string_interner=aas_interning.StringInterner(),
+            ),
+            aas_xml_streaming.iter_identifiables_from_stream(
+                io.StringIO(aas_xmlization.to_str(environment)),
+                string_interner=aas_interning.StringInterner(),
+            ),
+        ):
+            id_shorts = [
+                [
+                    element.id_short
+                    for element in identifiable.descend_once()
+                    if isinstance(element, aas_types.Property)
+                ]
+                for identifiable in identifiables
+            ]
+
+            self.assertEqual(5, len(id_shorts))
+            for some_id_shorts in id_shorts[1:]:
+                self.assertEqual(3, len(some_id_shorts))
+                for id_short, first_id_short in zip(some_id_shorts, id_shorts[0]):
+                    self.assertIs(first_id_short, id_short)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Test the streaming de-serialization of environments from JSON."""
+
+# pylint: disable=missing-docstring
+
+import io
+import json
+import pathlib
+import unittest
+from typing import List, Optional
+
+import aas_core3.json_streaming as aas_json_streaming
+import aas_core3.jsonization as aas_jsonization
+
+import tests.common
+
+_ENVIRONMENTS_DIR = tests.common.TEST_DATA_DIR / "Json" / "ContainedInEnvironment"
+
+
+class _TrickleStream(io.StringIO):
+    """Return at most a handful of characters per read to exercise the buffering."""
+
+    def read(self, size: Optional[int] = -1) -> str:
+        return super().read(min(size if size is not None and size >= 0 else 7, 7))
+
+
+def _paths(*parts: str) -> List[pathlib.Path]:
+    paths = sorted(_ENVIRONMENTS_DIR.joinpath(*parts).glob("**/*.json"))
+    assert len(paths) > 0
+    return paths
+
+
+class TestJsonizationStreaming(unittest.TestCase):
+    def test_same_as_from_jsonable(self) -> None:
+        for path in _paths("Expected"):
+            text = path.read_text(encoding="utf-8")
+
+            expected = aas_jsonization.to_jsonable(
+                aas_jsonization.environment_from_jsonable(json.loads(text))
+            )
+
+            self.assertEqual(
+                expected,
+                aas_jsonization.to_jsonable(
+                    aas_json_streaming.environment_from_stream(io.StringIO(text))
+                ),
+                f"path is {path}",
+            )
+
+            self.assertEqual(
+                expected,
+                aas_jsonization.to_jsonable(
+                    aas_json_streaming.environment_from_stream(
+                        io.BytesIO(text.encode("utf-8")), chunk_size=5
+                    )
+                ),
+                f"path is {path}",
+            )
+
+    def test_byte_order_marks_with_tiny_chunks(self) -> None:
+        text = '{"submodels": [{"id": "urn:something", "modelType": "Submodel"}]}'
+
+        for encoding in ["utf-8-sig", "utf-16", "utf-16-le", "utf-32"]:
+            for chunk_size in [1, 2, 3, 5]:
+                environment = aas_json_streaming.environment_from_stream(
+                    io.BytesIO(text.encode(encoding)), chunk_size=chunk_size
+                )
+
+                assert environment.submodels is not None
+                self.assertEqual(
+                    "urn:something",
+                    environment.submodels[0].id,
+                    f"encoding is {encoding}, chunk size is {chunk_size}",
+                )
+
+    def test_same_exceptions_as_from_jsonable(self) -> None:
+        for path in _paths("Unexpected", "Unserializable"):
+            text = path.read_text(encoding="utf-8")
+
+            with self.assertRaises(aas_jsonization.DeserializationException) as ctx:
+                aas_jsonization.environment_from_jsonable(json.loads(text))
+            expected = ctx.exception
+
+            with self.assertRaises(aas_jsonization.DeserializationException) as ctx:
+                aas_json_streaming.environment_from_stream(_TrickleStream(text))
+            got = ctx.exception
+
+            self.assertEqual(
+                f"{expected.path}: {expected.cause}",
+                f"{got.path}: {got.cause}",
+                f"path is {path}",
+            )
+
+    def test_identifiables_in_order(self) -> None:
+        text = json.dumps(
+            {
+                "conceptDescriptions": [
+                    {"id": "urn:concept", "modelType": "ConceptDescription"}
+                ],
+                "submodels": [
+                    {"id": "urn:first", "modelType": "Submodel"},
+                    {"id": "urn:second", "modelType": "Submodel"},
+                ],
+            }
+        )
+
+        self.assertListEqual(
+            ["urn:concept", "urn:first", "urn:second"],
+            [
+                identifiable.id
+                for identifiable in aas_json_streaming.iter_identifiables_from_stream(
+                    _TrickleStream(text)
+                )
+            ],
+        )
+
+    def test_empty_arrays_are_kept(self) -> None:
+        environment = aas_json_streaming.environment_from_stream(
+            io.StringIO('{"submodels": []}')
+        )
+
+        self.assertEqual([], environment.submodels)
+        self.assertIsNone(environment.concept_descriptions)
+
+    def test_invalid_json(self) -> None:
+        for text in ['{"submodels": [', '{"submodels": [}', "{} {}", "[]", ""]:
+            with self.assertRaises(
+                aas_jsonization.DeserializationException, msg=f"text is {text!r}"
+            ):
+                aas_json_streaming.environment_from_stream(io.StringIO(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
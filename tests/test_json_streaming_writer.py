@@ -0,0 +1,122 @@
+"""Test the incremental serialization of environments to JSON."""
+
+# pylint: disable=missing-docstring
+
+import io
+import json
+import unittest
+
+import aas_core3.json_streaming as aas_json_streaming
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+import tests.common
+
+
+class TestEnvironmentWriter(unittest.TestCase):
+    def test_same_as_json_dumps(self) -> None:
+        paths = sorted(
+            (
+                tests.common.TEST_DATA_DIR
+                / "Json"
+                / "ContainedInEnvironment"
+                / "Expected"
+            ).glob("**/*.json")
+        )
+        assert len(paths) > 0
+
+        for path in paths:
+            with path.open("rt") as fid:
+                jsonable = json.load(fid)
+
+            environment = aas_jsonization.environment_from_jsonable(jsonable)
+            expected = json.dumps(aas_jsonization.to_jsonable(environment))
+
+            writer = io.StringIO()
+            aas_json_streaming.write_environment(
+                writer,
+                asset_administration_shells=(
+                    iter(environment.asset_administration_shells)
+                    if environment.asset_administration_shells is not None
+                    else None
+                ),
+                submodels=(
+                    iter(environment.submodels)
+                    if environment.submodels is not None
+                    else None
+                ),
+                concept_descriptions=(
+                    iter(environment.concept_descriptions)
+                    if environment.concept_descriptions is not None
+                    else None
+                ),
+            )
+            self.assertEqual(expected, writer.getvalue(), f"path is {path}")
+
+            binary_writer = io.BytesIO()
+            with aas_json_streaming.EnvironmentWriter(
+                binary_writer
+            ) as environment_writer:
+                for identifiable in environment.descend_once():
+                    assert isinstance(identifiable, aas_types.Identifiable)
+                    environment_writer.write(identifiable)
+
+            self.assertEqual(
+                expected, binary_writer.getvalue().decode("utf-8"), f"path is {path}"
+            )
+
+    def test_empty_and_missing_properties(self) -> None:
+        for environment in [
+            aas_types.Environment(),
+            aas_types.Environment(submodels=[]),
+            aas_types.Environment(
+                asset_administration_shells=[], concept_descriptions=[]
+            ),
+        ]:
+            writer = io.StringIO()
+            aas_json_streaming.write_environment(
+                writer,
+                asset_administration_shells=environment.asset_administration_shells,
+                submodels=environment.submodels,
+                concept_descriptions=environment.concept_descriptions,
+            )
+
+            self.assertEqual(
+                json.dumps(aas_jsonization.to_jsonable(environment)),
+                writer.getvalue(),
+            )
+
+    def test_round_trip(self) -> None:
+        writer = io.StringIO()
+        aas_json_streaming.write_environment(
+            writer,
+            submodels=(aas_types.Submodel(id=f"urn:submodel{i}") for i in range(3)),
+        )
+
+        environment = aas_jsonization.environment_from_jsonable(
+            json.loads(writer.getvalue())
+        )
+
+        assert environment.submodels is not None
+        self.assertListEqual(
+            ["urn:submodel0", "urn:submodel1", "urn:submodel2"],
+            [submodel.id for submodel in environment.submodels],
+        )
+
+    def test_out_of_order_fails(self) -> None:
+        environment_writer = aas_json_streaming.EnvironmentWriter(io.StringIO())
+        environment_writer.write(aas_types.ConceptDescription(id="urn:concept"))
+
+        with self.assertRaises(ValueError):
+            environment_writer.write(aas_types.Submodel(id="urn:submodel"))
+
+    def test_wrong_item_type_fails(self) -> None:
+        with self.assertRaises(ValueError):
+            aas_json_streaming.write_environment(
+                io.StringIO(),
+                submodels=[aas_types.ConceptDescription(id="urn:concept")],  # type: ignore
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,457 @@
+"""Test the in-place application of patches."""
+
+# pylint: disable=missing-docstring
+
+import subprocess
+import sys
+import unittest
+from typing import List, Sequence
+
+import aas_core3.patching as aas_patching
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+import tests.common
+
+
+class TestPatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.nested_property = tests.common.int_property("nestedProperty", "1")
+
+        self.collection = aas_types.SubmodelElementCollection(
+            id_short="someCollection", value=[self.nested_property]
+        )
+
+        self.some_list = aas_types.SubmodelElementList(
+            id_short="someList",
+            type_value_list_element=aas_types.AASSubmodelElements.PROPERTY,
+            value_type_list_element=aas_types.DataTypeDefXSD.INT,
+            value=[
+                aas_types.Property(
+                    value_type=aas_types.DataTypeDefXSD.INT, value=f"{i}"
+                )
+                for i in range(2)
+            ],
+        )
+
+        self.some_input = tests.common.int_property("someInput", "2")
+
+        self.operation = aas_types.Operation(
+            id_short="someOperation",
+            input_variables=[aas_types.OperationVariable(value=self.some_input)],
+        )
+
+        self.submodel = aas_types.Submodel(
+            id="urn:submodel",
+            submodel_elements=[
+                tests.common.int_property("someProperty", "3"),
+                self.collection,
+                self.some_list,
+                self.operation,
+            ],
+        )
+
+        self.environment = aas_types.Environment(submodels=[self.submodel])
+        self.patcher = aas_patching.Patcher(self.environment)
+
+    def assert_fails(
+        self, operations: Sequence[aas_patching.PatchOperation], operation_index: int
+    ) -> aas_patching.PatchException:
+        with self.assertRaises(aas_patching.PatchException) as context:
+            self.patcher.apply(operations)
+
+        self.assertEqual(operation_index, context.exception.operation_index)
+        return context.exception
+
+    def assert_verified_incrementally(self) -> List[str]:
+        expected = tests.common.render_errors(
+            list(aas_verification.verify(self.environment))
+        )
+        got = tests.common.render_errors(list(self.patcher.verify()))
+        self.assertListEqual(expected, got)
+        return got
+
+    def test_replace_nested_property(self) -> None:
+        self.patcher.apply(
+            [
+                aas_patching.Replace(
+                    "urn:submodel",
+                    ("someCollection", "nestedProperty"),
+                    "value",
+                    "1984",
+                )
+            ]
+        )
+        self.assertEqual("1984", self.nested_property.value)
+
+    def test_replace_id_short_and_address_by_it(self) -> None:
+        self.patcher.apply(
+            [
+                aas_patching.Replace(
+                    "urn:submodel", ("someCollection",), "id_short", "renamed"
+                ),
+                aas_patching.Replace(
+                    "urn:submodel", ("renamed", "nestedProperty"), "value", "1984"
+                ),
+            ]
+        )
+        self.assertEqual("1984", self.nested_property.value)
+
+        self.assert_fails([aas_patching.Remove("urn:submodel", ("someCollection",))], 0)
+
+    def test_replace_id(self) -> None:
+        self.patcher.apply(
+            [aas_patching.Replace("urn:submodel", (), "id", "urn:renamed")]
+        )
+
+        self.assertEqual("urn:renamed", self.submodel.id)
+        self.assertIs(self.submodel, self.patcher.index.find("urn:renamed"))
+        self.assertNotIn("urn:submodel", self.patcher.index)
+
+    def test_add_elements(self) -> None:
+        another_property = tests.common.int_property("anotherProperty", "4")
+        list_item = aas_types.Property(
+            value_type=aas_types.DataTypeDefXSD.INT, value="5"
+        )
+
+        self.patcher.apply(
+            [
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someCollection", "anotherProperty"),
+                    another_property,
+                ),
+                aas_patching.Add("urn:submodel", ("someList", 1), list_item),
+            ]
+        )
+
+        self.assertIs(another_property, (self.collection.value or [])[-1])
+        self.assertIs(list_item, (self.some_list.value or [])[1])
+
+        self.patcher.apply(
+            [
+                aas_patching.Replace(
+                    "urn:submodel",
+                    ("someCollection", "anotherProperty"),
+                    "value",
+                    "1984",
+                )
+            ]
+        )
+        self.assertEqual("1984", another_property.value)
+
+    def test_add_element_fails(self) -> None:
+        self.assert_fails(
+            [
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someCollection", "mismatch"),
+                    tests.common.int_property("a", "1"),
+                )
+            ],
+            0,
+        )
+        self.assert_fails(
+            [
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("nestedProperty",),
+                    tests.common.int_property("nestedProperty", "1"),
+                ),
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someCollection", "nestedProperty"),
+                    tests.common.int_property("nestedProperty", "1"),
+                ),
+            ],
+            1,
+        )
+        self.assert_fails(
+            [
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someList", 3),
+                    aas_types.Property(value_type=aas_types.DataTypeDefXSD.INT),
+                )
+            ],
+            0,
+        )
+        self.assert_fails(
+            [
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someOperation", "anotherInput"),
+                    tests.common.int_property("anotherInput", "1"),
+                )
+            ],
+            0,
+        )
+
+        # The operations preceding the failed one remain applied.
+        self.assertEqual(5, len(self.submodel.submodel_elements or []))
+
+    def test_add_and_remove_operation_variables(self) -> None:
+        another_input = tests.common.int_property("anotherInput", "4")
+        an_output = tests.common.int_property("anOutput", "5")
+
+        self.patcher.apply(
+            [
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someOperation", "anotherInput"),
+                    another_input,
+                    "input_variables",
+                ),
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someOperation", "anOutput"),
+                    an_output,
+                    "output_variables",
+                ),
+                aas_patching.Replace(
+                    "urn:submodel", ("someOperation", "anOutput"), "value", "1984"
+                ),
+            ]
+        )
+
+        self.assertEqual(
+            [self.some_input, another_input],
+            [variable.value for variable in self.operation.input_variables or []],
+        )
+        self.assertEqual(
+            [an_output],
+            [variable.value for variable in self.operation.output_variables or []],
+        )
+        self.assertEqual("1984", an_output.value)
+        self.assertListEqual([], self.assert_verified_incrementally())
+
+        self.patcher.apply(
+            [
+                aas_patching.Remove("urn:submodel", ("someOperation", "anOutput")),
+                aas_patching.Remove("urn:submodel", ("someOperation", "someInput")),
+            ]
+        )
+
+        self.assertEqual(
+            [another_input],
+            [variable.value for variable in self.operation.input_variables or []],
+        )
+        self.assertIsNone(self.operation.output_variables)
+        self.assertListEqual([], self.assert_verified_incrementally())
+
+    def test_add_with_misplaced_property_name_fails(self) -> None:
+        self.assert_fails(
+            [
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someOperation", "anotherInput"),
+                    tests.common.int_property("anotherInput", "1"),
+                    "no_such_variables",
+                )
+            ],
+            0,
+        )
+        self.assert_fails(
+            [
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someCollection", "anotherProperty"),
+                    tests.common.int_property("anotherProperty", "1"),
+                    "input_variables",
+                )
+            ],
+            0,
+        )
+        self.assert_fails(
+            [
+                aas_patching.Add(
+                    "urn:concept",
+                    (),
+                    aas_types.ConceptDescription(id="urn:concept"),
+                    "input_variables",
+                )
+            ],
+            0,
+        )
+        self.assert_fails(
+            [
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("someOperation", "someInput"),
+                    tests.common.int_property("someInput", "1"),
+                    "output_variables",
+                )
+            ],
+            0,
+        )
+
+        self.assertIsNone(self.environment.concept_descriptions)
+        self.assertEqual(1, len(self.operation.input_variables or []))
+        self.assertIsNone(self.operation.output_variables)
+
+    def test_remove_elements(self) -> None:
+        self.patcher.apply(
+            [
+                aas_patching.Remove(
+                    "urn:submodel", ("someCollection", "nestedProperty")
+                ),
+                aas_patching.Remove("urn:submodel", ("someList", 0)),
+                aas_patching.Remove("urn:submodel", ("someOperation", "someInput")),
+                aas_patching.Remove("urn:submodel", ("someProperty",)),
+            ]
+        )
+
+        self.assertIsNone(self.collection.value)
+        self.assertEqual(
+            ["1"],
+            [
+                item.value
+                for item in self.some_list.value or []
+                if isinstance(item, aas_types.Property)
+            ],
+        )
+        self.assertIsNone(self.operation.input_variables)
+        self.assertEqual(
+            ["someCollection", "someList", "someOperation"],
+            [element.id_short for element in self.submodel.submodel_elements or []],
+        )
+
+    def test_add_and_remove_identifiables(self) -> None:
+        concept_description = aas_types.ConceptDescription(id="urn:concept")
+
+        self.patcher.apply(
+            [
+                aas_patching.Add("urn:concept", (), concept_description),
+                aas_patching.Remove("urn:submodel", ()),
+            ]
+        )
+
+        self.assertListEqual(
+            [concept_description], self.environment.concept_descriptions or []
+        )
+        self.assertIsNone(self.environment.submodels)
+        self.assertIs(concept_description, self.patcher.index.find("urn:concept"))
+        self.assertNotIn("urn:submodel", self.patcher.index)
+
+        self.assert_fails([aas_patching.Add("urn:concept", (), concept_description)], 0)
+
+    def test_remove_without_assertions(self) -> None:
+        # The removal must not depend on the assertions, which ``python -O`` strips.
+        program = """\
+import aas_core3.patching as aas_patching
+import aas_core3.types as aas_types
+
+submodel = aas_types.Submodel(
+    id="urn:sm",
+    submodel_elements=[
+        aas_types.Property(id_short=id_short, value_type=aas_types.DataTypeDefXSD.INT)
+        for id_short in ["a", "b"]
+    ],
+)
+environment = aas_types.Environment(
+    submodels=[submodel, aas_types.Submodel(id="urn:other")]
+)
+patcher = aas_patching.Patcher(environment)
+
+patcher.apply([aas_patching.Remove("urn:sm", ("a",))])
+print([element.id_short for element in submodel.submodel_elements or []])
+
+patcher.apply([aas_patching.Remove("urn:sm", ())])
+print([another.id for another in environment.submodels or []])
+"""
+
+        output = subprocess.check_output(
+            [sys.executable, "-O", "-c", program],
+            cwd=str(tests.common.TEST_DATA_DIR.parent),
+            encoding="utf-8",
+        )
+
+        self.assertEqual("['b']\n['urn:other']\n", output)
+
+    def test_removed_and_replaced_instances_are_forgotten(self) -> None:
+        submodel = aas_types.Submodel(
+            id="urn:sm",
+            submodel_elements=[
+                tests.common.int_property(f"property{i}", f"{i}") for i in range(1000)
+            ],
+        )
+        environment = aas_types.Environment(submodels=[submodel])
+        patcher = aas_patching.Patcher(environment)
+
+        self.assertListEqual([], list(patcher.verify()))
+
+        patcher.apply(
+            [aas_patching.Remove("urn:sm", (f"property{i}",)) for i in range(1, 1000)]
+        )
+
+        old_semantic_id = aas_types.Reference(
+            type=aas_types.ReferenceTypes.EXTERNAL_REFERENCE,
+            keys=[
+                aas_types.Key(type=aas_types.KeyTypes.GLOBAL_REFERENCE, value="urn:old")
+            ],
+        )
+        assert submodel.submodel_elements is not None
+        submodel.submodel_elements[0].semantic_id = old_semantic_id
+        patcher.verifier.mark_dirty(submodel.submodel_elements[0])
+        self.assertListEqual([], list(patcher.verify()))
+
+        patcher.apply(
+            [aas_patching.Replace("urn:sm", ("property0",), "semantic_id", None)]
+        )
+        self.assertListEqual([], list(patcher.verify()))
+
+        # The environment, the submodel and the remaining property.
+        self.assertEqual(3, len(patcher.verifier._results))
+        self.assertEqual(2, len(patcher.verifier._parents))
+        self.assertEqual(1, len(submodel.submodel_elements))
+
+    def test_unresolvable_targets_fail(self) -> None:
+        self.assert_fails([aas_patching.Remove("urn:missing", ())], 0)
+        self.assert_fails([aas_patching.Remove("urn:submodel", ("missing",))], 0)
+        self.assert_fails([aas_patching.Remove("urn:submodel", ("someList", 2))], 0)
+        self.assert_fails(
+            [aas_patching.Remove("urn:submodel", ("someList", "nestedProperty"))], 0
+        )
+        self.assert_fails(
+            [aas_patching.Replace("urn:submodel", (), "no_such_property", None)], 0
+        )
+
+    def test_verify_only_touched(self) -> None:
+        self.assertListEqual([], self.assert_verified_incrementally())
+
+        results = self.patcher.verifier._results
+        cached_of_list = results[id(self.some_list)]
+
+        self.patcher.apply(
+            [
+                aas_patching.Replace(
+                    "urn:submodel",
+                    ("someCollection", "nestedProperty"),
+                    "value",
+                    "not a number",
+                ),
+                aas_patching.Add(
+                    "urn:submodel",
+                    ("anotherProperty",),
+                    tests.common.int_property("anotherProperty", "also not a number"),
+                ),
+            ]
+        )
+
+        self.assertEqual(2, len(self.assert_verified_incrementally()))
+
+        # The untouched sibling has not been re-verified.
+        self.assertIs(cached_of_list, results[id(self.some_list)])
+
+        self.patcher.apply(
+            [
+                aas_patching.Remove("urn:submodel", ("anotherProperty",)),
+                aas_patching.Add("", (), aas_types.ConceptDescription(id="")),
+            ]
+        )
+
+        self.assertEqual(2, len(self.assert_verified_incrementally()))
+
+
+if __name__ == "__main__":
+    unittest.main()
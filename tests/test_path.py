@@ -0,0 +1,90 @@
+"""Test the paths to erroneous values in verification and de-serialization."""
+
+# pylint: disable=missing-docstring
+
+import unittest
+from typing import Optional
+
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+
+def _nest_collections(depth: int) -> aas_types.SubmodelElementCollection:
+    """Nest ``depth`` collections with an invalid ``id_short`` at the bottom."""
+    innermost = aas_types.SubmodelElementCollection(id_short="-invalid-")
+
+    outer = innermost
+    for _ in range(depth):
+        outer = aas_types.SubmodelElementCollection(id_short="something", value=[outer])
+
+    return outer
+
+
+class TestVerificationPath(unittest.TestCase):
+    def test_empty(self) -> None:
+        path = aas_verification.Path()
+        self.assertListEqual([], list(path.segments))
+        self.assertEqual("", str(path))
+
+    def test_segments_in_order_of_prepending(self) -> None:
+        instance = _nest_collections(depth=3)
+
+        errors = list(aas_verification.verify(instance))
+        self.assertEqual(1, len(errors))
+
+        path = errors[0].path
+        self.assertEqual(".value[0].value[0].value[0].id_short", str(path))
+
+        segments = path.segments
+        self.assertEqual(7, len(segments))
+
+        first = segments[0]
+        assert isinstance(first, aas_verification.PropertySegment)
+        self.assertIs(instance, first.instance)
+        self.assertEqual("value", first.name)
+
+        last = segments[-1]
+        assert isinstance(last, aas_verification.PropertySegment)
+        self.assertEqual("id_short", last.name)
+
+    def test_deep_nesting(self) -> None:
+        depth = 500
+        instance = _nest_collections(depth=depth)
+
+        errors = list(aas_verification.verify(instance))
+        self.assertEqual(1, len(errors))
+
+        self.assertEqual(".value[0]" * depth + ".id_short", str(errors[0].path))
+        self.assertEqual(2 * depth + 1, len(errors[0].path.segments))
+
+
+class TestJsonizationPath(unittest.TestCase):
+    def test_segments_in_order_of_prepending(self) -> None:
+        jsonable = {
+            "idShort": "something",
+            "modelType": "SubmodelElementCollection",
+            "value": [{"idShort": "another", "modelType": "Unknown"}],
+        }
+
+        observed_exception = (
+            None
+        )  # type: Optional[aas_jsonization.DeserializationException]
+        try:
+            aas_jsonization.submodel_element_collection_from_jsonable(jsonable)
+        except aas_jsonization.DeserializationException as exception:
+            observed_exception = exception
+
+        assert observed_exception is not None
+        self.assertEqual("value[0]", str(observed_exception.path))
+
+        segments = observed_exception.path.segments
+        self.assertEqual(2, len(segments))
+        assert isinstance(segments[0], aas_jsonization.PropertySegment)
+        self.assertEqual("value", segments[0].name)
+        assert isinstance(segments[1], aas_jsonization.IndexSegment)
+        self.assertEqual(0, segments[1].index)
+
+
+if __name__ == "__main__":
+    unittest.main()
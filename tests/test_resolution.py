@@ -0,0 +1,217 @@
+"""Test the resolution of model references."""
+
+# pylint: disable=missing-docstring
+
+import unittest
+from typing import Optional, Tuple
+
+import aas_core3.resolution as aas_resolution
+import aas_core3.types as aas_types
+
+
+def _model_reference(*keys: Tuple[aas_types.KeyTypes, str]) -> aas_types.Reference:
+    return aas_types.Reference(
+        type=aas_types.ReferenceTypes.MODEL_REFERENCE,
+        keys=[aas_types.Key(type=key_type, value=value) for key_type, value in keys],
+    )
+
+
+class TestResolver(unittest.TestCase):
+    def setUp(self) -> None:
+        self.a_property = aas_types.Property(
+            id_short="something", value_type=aas_types.DataTypeDefXSD.INT
+        )
+
+        self.an_item = aas_types.SubmodelElementCollection(value=[self.a_property])
+
+        self.a_list = aas_types.SubmodelElementList(
+            id_short="aList",
+            type_value_list_element=aas_types.AASSubmodelElements.SUBMODEL_ELEMENT_COLLECTION,
+            value=[aas_types.SubmodelElementCollection(), self.an_item],
+        )
+
+        self.an_input = aas_types.Property(
+            id_short="anInput", value_type=aas_types.DataTypeDefXSD.STRING
+        )
+
+        self.an_operation = aas_types.Operation(
+            id_short="anOperation",
+            input_variables=[aas_types.OperationVariable(value=self.an_input)],
+        )
+
+        self.submodel = aas_types.Submodel(
+            id="urn:submodel",
+            submodel_elements=[self.a_list, self.an_operation],
+        )
+
+        self.resolver = aas_resolution.Resolver(
+            aas_types.Environment(submodels=[self.submodel])
+        )
+
+    def assert_fails(
+        self, reference: aas_types.Reference, key_index: Optional[int]
+    ) -> aas_resolution.ResolutionException:
+        with self.assertRaises(aas_resolution.ResolutionException) as context:
+            self.resolver.resolve(reference)
+
+        self.assertEqual(key_index, context.exception.key_index)
+        return context.exception
+
+    def test_identifiable(self) -> None:
+        self.assertIs(
+            self.submodel,
+            self.resolver.resolve(
+                _model_reference((aas_types.KeyTypes.SUBMODEL, "urn:submodel"))
+            ),
+        )
+
+    def test_nested_in_list(self) -> None:
+        reference = _model_reference(
+            (aas_types.KeyTypes.SUBMODEL, "urn:submodel"),
+            (aas_types.KeyTypes.SUBMODEL_ELEMENT_LIST, "aList"),
+            (aas_types.KeyTypes.SUBMODEL_ELEMENT_COLLECTION, "1"),
+            (aas_types.KeyTypes.PROPERTY, "something"),
+        )
+
+        self.assertIs(self.a_property, self.resolver.resolve(reference))
+
+        # Resolve again to go through the cache
+        self.assertIs(self.a_property, self.resolver.resolve(reference))
+
+    def test_operation_variable(self) -> None:
+        reference = _model_reference(
+            (aas_types.KeyTypes.SUBMODEL, "urn:submodel"),
+            (aas_types.KeyTypes.OPERATION, "anOperation"),
+            (aas_types.KeyTypes.DATA_ELEMENT, "anInput"),
+        )
+
+        self.assertIs(self.an_input, self.resolver.resolve(reference))
+
+    def test_module_level_function(self) -> None:
+        self.assertIs(
+            self.a_list,
+            aas_resolution.resolve(
+                _model_reference(
+                    (aas_types.KeyTypes.IDENTIFIABLE, "urn:submodel"),
+                    (aas_types.KeyTypes.SUBMODEL_ELEMENT, "aList"),
+                ),
+                self.resolver.environment,
+            ),
+        )
+
+    def test_external_reference_fails(self) -> None:
+        reference = aas_types.Reference(
+            type=aas_types.ReferenceTypes.EXTERNAL_REFERENCE,
+            keys=[
+                aas_types.Key(
+                    type=aas_types.KeyTypes.GLOBAL_REFERENCE, value="urn:something"
+                )
+            ],
+        )
+
+        self.assert_fails(reference, None)
+
+    def test_dangling_identifiable_fails(self) -> None:
+        self.assert_fails(
+            _model_reference((aas_types.KeyTypes.SUBMODEL, "urn:unknown")), 0
+        )
+
+    def test_wrong_identifiable_type_fails(self) -> None:
+        self.assert_fails(
+            _model_reference((aas_types.KeyTypes.CONCEPT_DESCRIPTION, "urn:submodel")),
+            0,
+        )
+
+    def test_unknown_id_short_fails(self) -> None:
+        exception = self.assert_fails(
+            _model_reference(
+                (aas_types.KeyTypes.SUBMODEL, "urn:submodel"),
+                (aas_types.KeyTypes.SUBMODEL_ELEMENT_LIST, "aList"),
+                (aas_types.KeyTypes.SUBMODEL_ELEMENT_COLLECTION, "1"),
+                (aas_types.KeyTypes.PROPERTY, "unknown"),
+            ),
+            3,
+        )
+
+        self.assertEqual(
+            "No element with the ID-short 'unknown' found "
+            "in the SubmodelElementCollection",
+            exception.cause,
+        )
+
+    def test_index_out_of_bounds_fails(self) -> None:
+        self.assert_fails(
+            _model_reference(
+                (aas_types.KeyTypes.SUBMODEL, "urn:submodel"),
+                (aas_types.KeyTypes.SUBMODEL_ELEMENT_LIST, "aList"),
+                (aas_types.KeyTypes.SUBMODEL_ELEMENT_COLLECTION, "2"),
+            ),
+            2,
+        )
+
+    def test_non_ascii_digits_as_index_fail(self) -> None:
+        for value in ["²", "①", "٣", "1²"]:
+            exception = self.assert_fails(
+                _model_reference(
+                    (aas_types.KeyTypes.SUBMODEL, "urn:submodel"),
+                    (aas_types.KeyTypes.SUBMODEL_ELEMENT_LIST, "aList"),
+                    (aas_types.KeyTypes.SUBMODEL_ELEMENT_COLLECTION, value),
+                ),
+                2,
+            )
+            self.assertIn("Expected the key to be an index", exception.cause)
+
+    def test_wrong_element_type_fails(self) -> None:
+        self.assert_fails(
+            _model_reference(
+                (aas_types.KeyTypes.SUBMODEL, "urn:submodel"),
+                (aas_types.KeyTypes.PROPERTY, "aList"),
+            ),
+            1,
+        )
+
+    def test_descending_into_non_container_fails(self) -> None:
+        self.assert_fails(
+            _model_reference(
+                (aas_types.KeyTypes.SUBMODEL, "urn:submodel"),
+                (aas_types.KeyTypes.OPERATION, "anOperation"),
+                (aas_types.KeyTypes.PROPERTY, "anInput"),
+                (aas_types.KeyTypes.PROPERTY, "something"),
+            ),
+            3,
+        )
+
+    def test_clear_cache(self) -> None:
+        reference = _model_reference(
+            (aas_types.KeyTypes.SUBMODEL, "urn:submodel"),
+            (aas_types.KeyTypes.CAPABILITY, "aCapability"),
+        )
+
+        self.assert_fails(reference, 1)
+
+        a_capability = aas_types.Capability(id_short="aCapability")
+        assert self.submodel.submodel_elements is not None
+        self.submodel.submodel_elements.append(a_capability)
+
+        self.resolver.clear_cache()
+        self.assertIs(a_capability, self.resolver.resolve(reference))
+
+    def test_find_child_and_forget(self) -> None:
+        self.assertIs(
+            self.an_input, self.resolver.find_child(self.an_operation, "anInput")
+        )
+        self.assertIsNone(self.resolver.find_child(self.submodel, "aCapability"))
+        self.assertIsNone(self.resolver.find_child(self.a_property, "something"))
+
+        a_capability = aas_types.Capability(id_short="aCapability")
+        assert self.submodel.submodel_elements is not None
+        self.submodel.submodel_elements.append(a_capability)
+
+        self.resolver.forget(self.submodel)
+        self.assertIs(
+            a_capability, self.resolver.find_child(self.submodel, "aCapability")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
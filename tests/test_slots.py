@@ -0,0 +1,71 @@
+"""Test that the instances of the model classes are slotted."""
+
+# pylint: disable=missing-docstring
+
+import copy
+import inspect
+import json
+import pickle
+import unittest
+import weakref
+
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+import tests.common
+
+
+class TestSlots(unittest.TestCase):
+    def test_every_class_defines_slots(self) -> None:
+        for cls in vars(aas_types).values():
+            if inspect.isclass(cls) and issubclass(cls, aas_types.Class):
+                self.assertIn("__slots__", cls.__dict__, cls.__name__)
+
+    def test_constructor_arguments_are_slots(self) -> None:
+        for cls in tests.common.concrete_classes():
+            slots = {
+                name
+                for base in cls.__mro__
+                for name in base.__dict__.get("__slots__", ())
+            }
+
+            parameters = list(inspect.signature(cls.__init__).parameters)[1:]
+            self.assertLessEqual(set(parameters), slots, cls.__name__)
+
+    def test_on_test_data(self) -> None:
+        path = (
+            tests.common.TEST_DATA_DIR
+            / "Json"
+            / "ContainedInEnvironment"
+            / "Expected"
+            / "Submodel"
+            / "maximal.json"
+        )
+
+        with path.open("rt", encoding="utf-8") as fid:
+            jsonable = json.load(fid)
+
+        environment = aas_jsonization.environment_from_jsonable(jsonable)
+
+        for instance in [environment] + list(environment.descend()):
+            self.assertFalse(hasattr(instance, "__dict__"), type(instance).__name__)
+
+        with self.assertRaises(AttributeError):
+            setattr(environment, "unexpected", 1984)
+
+        expected = aas_jsonization.to_jsonable(environment)
+        self.assertEqual(
+            expected,
+            aas_jsonization.to_jsonable(pickle.loads(pickle.dumps(environment))),
+        )
+        self.assertEqual(
+            expected, aas_jsonization.to_jsonable(copy.deepcopy(environment))
+        )
+
+    def test_weak_references(self) -> None:
+        key = aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value="urn:something")
+        self.assertIs(key, weakref.ref(key)())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+"""Test the identity and the structural equality and hashing of the model classes."""
+
+# pylint: disable=missing-docstring
+
+import copy
+import json
+import unittest
+import weakref
+
+import aas_core3.hashing as aas_hashing
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+
+import tests.common
+
+
+class TestIdentity(unittest.TestCase):
+    def test_no_concrete_class_overrides_eq_or_hash(self) -> None:
+        for cls in tests.common.concrete_classes():
+            self.assertNotIn("__eq__", cls.__dict__, cls.__name__)
+            self.assertNotIn("__hash__", cls.__dict__, cls.__name__)
+
+    def test_hashable_by_identity(self) -> None:
+        key = aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value="urn:something")
+        another = aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value="urn:something")
+
+        self.assertEqual(key, key)
+        self.assertNotEqual(key, another)
+        self.assertEqual(2, len({key, another}))
+
+        weak = (
+            weakref.WeakKeyDictionary()
+        )  # type: weakref.WeakKeyDictionary[aas_types.Key, int]
+        weak[key] = 1
+        self.assertEqual(1, weak[key])
+        self.assertNotIn(another, weak)
+
+
+class TestStructurallyEqual(unittest.TestCase):
+    def test_key(self) -> None:
+        key = aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value="urn:something")
+
+        self.assertTrue(
+            aas_hashing.structurally_equal(
+                key,
+                aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value="urn:something"),
+            )
+        )
+        self.assertFalse(
+            aas_hashing.structurally_equal(
+                key,
+                aas_types.Key(type=aas_types.KeyTypes.PROPERTY, value="urn:something"),
+            )
+        )
+        self.assertFalse(
+            aas_hashing.structurally_equal(
+                key, aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value="urn:else")
+            )
+        )
+
+    def test_different_classes(self) -> None:
+        self.assertFalse(
+            aas_hashing.structurally_equal(
+                aas_types.LangStringNameType(language="en", text="something"),
+                aas_types.LangStringTextType(language="en", text="something"),
+            )
+        )
+
+    def test_base_class_and_subclass_differ(self) -> None:
+        def reference() -> aas_types.Reference:
+            return aas_types.Reference(
+                type=aas_types.ReferenceTypes.EXTERNAL_REFERENCE,
+                keys=[
+                    aas_types.Key(
+                        type=aas_types.KeyTypes.GLOBAL_REFERENCE, value="urn:something"
+                    )
+                ],
+            )
+
+        relationship = aas_types.RelationshipElement(
+            first=reference(), second=reference(), id_short="something"
+        )
+        annotated = aas_types.AnnotatedRelationshipElement(
+            first=reference(),
+            second=reference(),
+            id_short="something",
+            annotations=[
+                aas_types.Property(
+                    id_short="annotation", value_type=aas_types.DataTypeDefXSD.INT
+                )
+            ],
+        )
+
+        self.assertFalse(aas_hashing.structurally_equal(relationship, annotated))
+        self.assertFalse(aas_hashing.structurally_equal(annotated, relationship))
+
+    def test_none_and_empty_list_differ(self) -> None:
+        self.assertFalse(
+            aas_hashing.structurally_equal(
+                aas_types.Submodel(id="urn:something", submodel_elements=None),
+                aas_types.Submodel(id="urn:something", submodel_elements=[]),
+            )
+        )
+
+    def test_on_test_data(self) -> None:
+        for path in tests.common.environment_paths():
+            with path.open("rt", encoding="utf-8") as fid:
+                jsonable = json.load(fid)
+
+            environment = aas_jsonization.environment_from_jsonable(jsonable)
+            another = aas_jsonization.environment_from_jsonable(jsonable)
+
+            self.assertIsNot(environment, another)
+            self.assertTrue(
+                aas_hashing.structurally_equal(environment, another), f"path is {path}"
+            )
+            self.assertEqual(
+                aas_hashing.structural_hash(environment),
+                aas_hashing.structural_hash(another),
+                f"path is {path}",
+            )
+
+    def test_difference_deep_down(self) -> None:
+        path = (
+            tests.common.TEST_DATA_DIR
+            / "Json"
+            / "ContainedInEnvironment"
+            / "Expected"
+            / "Submodel"
+            / "maximal.json"
+        )
+        with path.open("rt", encoding="utf-8") as fid:
+            jsonable = json.load(fid)
+
+        environment = aas_jsonization.environment_from_jsonable(jsonable)
+
+        key_count = sum(
+            1
+            for something in environment.descend()
+            if isinstance(something, aas_types.Key)
+        )
+        self.assertGreater(key_count, 0)
+
+        for i in range(key_count):
+            another = copy.deepcopy(environment)
+            self.assertTrue(aas_hashing.structurally_equal(environment, another))
+
+            key = [
+                something
+                for something in another.descend()
+                if isinstance(something, aas_types.Key)
+            ][i]
+            key.value += "-changed"
+
+            self.assertFalse(aas_hashing.structurally_equal(environment, another))
+
+
+class TestStructuralHash(unittest.TestCase):
+    def test_equal_instances(self) -> None:
+        def make() -> aas_types.Submodel:
+            return aas_types.Submodel(
+                id="urn:something",
+                submodel_elements=[
+                    aas_types.Blob(
+                        id_short="someBlob",
+                        content_type="application/octet-stream",
+                        value=b"something",
+                    )
+                ],
+            )
+
+        self.assertEqual(
+            aas_hashing.structural_hash(make()), aas_hashing.structural_hash(make())
+        )
+
+    def test_different_instances(self) -> None:
+        hashes = {
+            aas_hashing.structural_hash(
+                aas_types.Submodel(id=f"urn:submodel{i}", id_short=f"something{j}")
+            )
+            for i in range(10)
+            for j in range(10)
+        }
+
+        # The hashes may collide in principle, but not for such simple instances.
+        self.assertEqual(100, len(hashes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""Test the caching of strings known to be valid during the verification."""
+
+# pylint: disable=missing-docstring
+
+import json
+import unittest
+
+import aas_core3.fast_verification as aas_fast_verification
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+import tests.common
+
+
+class TestValidStringCache(unittest.TestCase):
+    def test_invalid_max_size(self) -> None:
+        with self.assertRaises(ValueError):
+            aas_fast_verification.ValidStringCache(max_size=0)
+
+    def test_invalid_strings_are_not_cached(self) -> None:
+        cache = aas_fast_verification.ValidStringCache()
+
+        for _ in range(2):
+            self.assertListEqual(
+                tests.common.render_errors(
+                    list(aas_verification.verify_bcp_47_language_tag("not a language"))
+                ),
+                tests.common.render_errors(
+                    list(
+                        cache.verify(
+                            aas_verification.verify_bcp_47_language_tag,
+                            "not a language",
+                        )
+                    )
+                ),
+            )
+
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(0, len(cache))
+
+    def test_valid_strings_are_cached_per_verifier(self) -> None:
+        cache = aas_fast_verification.ValidStringCache()
+
+        for _ in range(3):
+            self.assertListEqual(
+                [],
+                list(cache.verify(aas_verification.verify_bcp_47_language_tag, "en")),
+            )
+
+        # The valid language tag is not a valid content type.
+        self.assertEqual(
+            1,
+            len(list(cache.verify(aas_verification.verify_content_type, "en"))),
+        )
+
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(1, len(cache))
+
+        cache.clear()
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, len(cache))
+
+    def test_bounded(self) -> None:
+        cache = aas_fast_verification.ValidStringCache(max_size=2)
+
+        for text in ["en", "de", "fr", "it"]:
+            list(cache.verify(aas_verification.verify_bcp_47_language_tag, text))
+
+        self.assertLessEqual(len(cache), 2)
+
+    def test_same_errors_as_without_cache(self) -> None:
+        environment = aas_types.Environment(
+            submodels=[
+                aas_types.Submodel(
+                    id="urn:something",
+                    id_short=id_short,
+                    description=[
+                        aas_types.LangStringTextType(language=language, text="x")
+                    ],
+                )
+                for id_short, language in [
+                    ("valid", "en"),
+                    ("-invalid-", "en"),
+                    ("valid", "not a language"),
+                    ("-invalid-", "not a language"),
+                ]
+            ]
+        )
+
+        cache = aas_fast_verification.ValidStringCache()
+        self.assertListEqual(
+            tests.common.render_errors(list(aas_verification.verify(environment))),
+            tests.common.render_errors(
+                list(
+                    aas_fast_verification.verify(environment, valid_string_cache=cache)
+                )
+            ),
+        )
+        self.assertGreater(cache.hits, 0)
+
+    def test_on_test_data(self) -> None:
+        paths = sorted(
+            (tests.common.TEST_DATA_DIR / "Json" / "ContainedInEnvironment").glob(
+                "*/*/**/*.json"
+            )
+        )
+
+        cache = aas_fast_verification.ValidStringCache()
+
+        for path in paths:
+            with path.open("rt") as fid:
+                jsonable = json.load(fid)
+
+            try:
+                environment = aas_jsonization.environment_from_jsonable(jsonable)
+            except aas_jsonization.DeserializationException:
+                continue
+
+            self.assertListEqual(
+                tests.common.render_errors(list(aas_verification.verify(environment))),
+                tests.common.render_errors(
+                    list(
+                        aas_fast_verification.verify(
+                            environment, valid_string_cache=cache
+                        )
+                    )
+                ),
+                f"path is {path}",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Test the memoization of the value consistency with XSD types."""
+
+# pylint: disable=missing-docstring
+
+import unittest
+
+import aas_core3.fast_verification as aas_fast_verification
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+import tests.common
+
+
+class TestValueConsistencyCache(unittest.TestCase):
+    def test_invalid_max_size(self) -> None:
+        with self.assertRaises(ValueError):
+            aas_fast_verification.ValueConsistencyCache(max_size=0)
+
+    def test_same_results_as_without_cache(self) -> None:
+        cache = aas_fast_verification.ValueConsistencyCache(max_size=2)
+
+        for value, value_type in [
+            ("true", aas_types.DataTypeDefXSD.BOOLEAN),
+            ("maybe", aas_types.DataTypeDefXSD.BOOLEAN),
+            ("2024-02-29", aas_types.DataTypeDefXSD.DATE),
+            ("2023-02-29", aas_types.DataTypeDefXSD.DATE),
+            ("true", aas_types.DataTypeDefXSD.BOOLEAN),
+            ("1e3", aas_types.DataTypeDefXSD.DOUBLE),
+            ("1e3", aas_types.DataTypeDefXSD.INT),
+        ]:
+            self.assertEqual(
+                aas_verification.value_consistent_with_xsd_type(value, value_type),
+                cache.value_consistent_with_xsd_type(value, value_type),
+                f"{value=}, {value_type=}",
+            )
+
+        self.assertLessEqual(len(cache), 2)
+
+    def test_counters(self) -> None:
+        cache = aas_fast_verification.ValueConsistencyCache()
+
+        submodel = aas_types.Submodel(
+            id="urn:something",
+            submodel_elements=[
+                aas_types.Property(
+                    id_short=f"property{i}",
+                    value_type=aas_types.DataTypeDefXSD.INT,
+                    value="1984" if i % 2 == 0 else "not a number",
+                )
+                for i in range(10)
+            ],
+        )
+
+        self.assertListEqual(
+            tests.common.render_errors(list(aas_verification.verify(submodel))),
+            tests.common.render_errors(
+                list(
+                    aas_fast_verification.verify(
+                        submodel, value_consistency_cache=cache
+                    )
+                )
+            ),
+        )
+
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(8, cache.hits)
+        self.assertEqual(2, len(cache))
+
+        cache.clear()
+        self.assertEqual(0, cache.misses)
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, len(cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
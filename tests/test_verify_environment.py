@@ -0,0 +1,162 @@
+"""Test the verification of constraints spanning multiple instances."""
+
+# pylint: disable=missing-docstring
+
+import json
+import unittest
+
+import aas_core3.environment_verification as aas_environment_verification
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+import tests.common
+
+
+def _model_reference(key_type: aas_types.KeyTypes, value: str) -> aas_types.Reference:
+    return aas_types.Reference(
+        type=aas_types.ReferenceTypes.MODEL_REFERENCE,
+        keys=[aas_types.Key(type=key_type, value=value)],
+    )
+
+
+class TestVerifyEnvironment(unittest.TestCase):
+    def test_valid(self) -> None:
+        environment = aas_types.Environment(
+            submodels=[
+                aas_types.Submodel(
+                    id="urn:submodel",
+                    semantic_id=_model_reference(
+                        aas_types.KeyTypes.CONCEPT_DESCRIPTION, "urn:concept"
+                    ),
+                )
+            ],
+            concept_descriptions=[aas_types.ConceptDescription(id="urn:concept")],
+        )
+
+        self.assertListEqual(
+            [],
+            tests.common.render_errors(
+                list(aas_environment_verification.verify_environment(environment))
+            ),
+        )
+
+    def test_duplicate_ids(self) -> None:
+        environment = aas_types.Environment(
+            submodels=[
+                aas_types.Submodel(id="urn:something"),
+                aas_types.Submodel(id="urn:unique"),
+            ],
+            concept_descriptions=[aas_types.ConceptDescription(id="urn:something")],
+        )
+
+        self.assertListEqual(
+            [
+                ".concept_descriptions[0].id: The identifier 'urn:something' "
+                "is not unique; identifiables need to be globally unique."
+            ],
+            tests.common.render_errors(
+                list(aas_environment_verification.verify_environment(environment))
+            ),
+        )
+
+        self.assertListEqual(
+            [],
+            tests.common.render_errors(
+                list(
+                    aas_environment_verification.verify_environment(
+                        environment, check_unique_ids=False
+                    )
+                )
+            ),
+        )
+
+    def test_dangling_references(self) -> None:
+        environment = aas_types.Environment(
+            submodels=[
+                aas_types.Submodel(
+                    id="urn:submodel",
+                    submodel_elements=[
+                        aas_types.ReferenceElement(
+                            id_short="someReference",
+                            value=aas_types.Reference(
+                                type=aas_types.ReferenceTypes.MODEL_REFERENCE,
+                                keys=[
+                                    aas_types.Key(
+                                        type=aas_types.KeyTypes.SUBMODEL,
+                                        value="urn:submodel",
+                                    ),
+                                    aas_types.Key(
+                                        type=aas_types.KeyTypes.PROPERTY,
+                                        value="unknown",
+                                    ),
+                                ],
+                            ),
+                        ),
+                    ],
+                    semantic_id=_model_reference(
+                        aas_types.KeyTypes.CONCEPT_DESCRIPTION, "urn:unknown"
+                    ),
+                )
+            ],
+        )
+
+        self.assertListEqual(
+            [
+                ".submodels[0].semantic_id.keys[0]: The model reference could not "
+                "be resolved: No identifiable with the ID 'urn:unknown' "
+                "in the environment",
+                ".submodels[0].submodel_elements[0].value.keys[1]: The model "
+                "reference could not be resolved: No element with the ID-short "
+                "'unknown' found in the Submodel",
+            ],
+            tests.common.render_errors(
+                list(aas_environment_verification.verify_environment(environment))
+            ),
+        )
+
+        self.assertListEqual(
+            [],
+            tests.common.render_errors(
+                list(
+                    aas_environment_verification.verify_environment(
+                        environment, check_references=False
+                    )
+                )
+            ),
+        )
+
+    def test_includes_errors_from_verify(self) -> None:
+        paths = sorted(
+            (
+                tests.common.TEST_DATA_DIR
+                / "Json"
+                / "ContainedInEnvironment"
+                / "Unexpected"
+                / "Invalid"
+            ).glob("**/*.json")
+        )
+        assert len(paths) > 0
+
+        for path in paths:
+            with path.open("rt") as fid:
+                jsonable = json.load(fid)
+
+            environment = aas_jsonization.environment_from_jsonable(jsonable)
+
+            expected = tests.common.render_errors(
+                list(aas_verification.verify(environment))
+            )
+            got = tests.common.render_errors(
+                list(
+                    aas_environment_verification.verify_environment(
+                        environment, check_references=False, check_unique_ids=False
+                    )
+                )
+            )
+
+            self.assertListEqual(expected, got, f"path is {path}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Test the verification with a pool of worker processes."""
+
+# pylint: disable=missing-docstring
+
+import json
+import unittest
+
+import aas_core3.environment_verification as aas_environment_verification
+import aas_core3.jsonization as aas_jsonization
+import aas_core3.types as aas_types
+import aas_core3.verification as aas_verification
+
+import tests.common
+
+
+def _load_invalid_environment() -> aas_types.Environment:
+    """Merge a sample of invalid environments from the test data into one."""
+    paths = sorted(
+        (
+            tests.common.TEST_DATA_DIR
+            / "Json"
+            / "ContainedInEnvironment"
+            / "Unexpected"
+            / "Invalid"
+        ).glob("**/*.json")
+    )
+
+    environment = aas_types.Environment(
+        asset_administration_shells=[], submodels=[], concept_descriptions=[]
+    )
+    assert environment.asset_administration_shells is not None
+    assert environment.submodels is not None
+    assert environment.concept_descriptions is not None
+
+    for path in paths[::20]:
+        with path.open("rt") as fid:
+            jsonable = json.load(fid)
+
+        another = aas_jsonization.environment_from_jsonable(jsonable)
+        environment.asset_administration_shells.extend(
+            another.over_asset_administration_shells_or_empty()
+        )
+        environment.submodels.extend(another.over_submodels_or_empty())
+        environment.concept_descriptions.extend(
+            another.over_concept_descriptions_or_empty()
+        )
+
+    return environment
+
+
+class TestVerifyParallel(unittest.TestCase):
+    def test_same_errors_as_verify(self) -> None:
+        environment = _load_invalid_environment()
+
+        expected = list(aas_verification.verify(environment))
+        assert len(expected) > 0
+
+        got = list(
+            aas_environment_verification.verify_parallel(
+                environment, workers=2, shard_size=3
+            )
+        )
+
+        self.assertListEqual(
+            tests.common.render_errors(expected), tests.common.render_errors(got)
+        )
+
+        for expected_error, got_error in zip(expected, got):
+            expected_segments = expected_error.path.segments
+            got_segments = got_error.path.segments
+            self.assertEqual(len(expected_segments), len(got_segments))
+
+            for expected_segment, got_segment in zip(expected_segments, got_segments):
+                if isinstance(expected_segment, aas_verification.PropertySegment):
+                    assert isinstance(got_segment, aas_verification.PropertySegment)
+                    self.assertIs(expected_segment.instance, got_segment.instance)
+                else:
+                    assert isinstance(got_segment, aas_verification.IndexSegment)
+                    self.assertIs(expected_segment.sequence, got_segment.sequence)
+
+    def test_errors_of_environment_itself(self) -> None:
+        environment = aas_types.Environment(
+            submodels=[], concept_descriptions=[aas_types.ConceptDescription(id="")]
+        )
+
+        self.assertListEqual(
+            tests.common.render_errors(list(aas_verification.verify(environment))),
+            tests.common.render_errors(
+                list(
+                    aas_environment_verification.verify_parallel(environment, workers=2)
+                )
+            ),
+        )
+
+    def test_invalid_arguments(self) -> None:
+        environment = aas_types.Environment()
+
+        with self.assertRaises(ValueError):
+            list(aas_environment_verification.verify_parallel(environment, workers=0))
+
+        with self.assertRaises(ValueError):
+            list(
+                aas_environment_verification.verify_parallel(environment, shard_size=0)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""Test the streaming de/serialization of environments to and from XML."""
+
+# pylint: disable=missing-docstring
+
+import io
+import pathlib
+import unittest
+from typing import List
+
+import aas_core3.types as aas_types
+import aas_core3.xml_streaming as aas_xml_streaming
+import aas_core3.xmlization as aas_xmlization
+
+import tests.common
+
+_ENVIRONMENTS_DIR = tests.common.TEST_DATA_DIR / "Xml" / "ContainedInEnvironment"
+
+
+def _paths(*parts: str) -> List[pathlib.Path]:
+    paths = sorted(_ENVIRONMENTS_DIR.joinpath(*parts).glob("**/*.xml"))
+    assert len(paths) > 0
+    return paths
+
+
+def _to_environment(identifiables: List[aas_types.Identifiable]) -> str:
+    environment = aas_types.Environment(
+        asset_administration_shells=[
+            identifiable
+            for identifiable in identifiables
+            if isinstance(identifiable, aas_types.AssetAdministrationShell)
+        ],
+        submodels=[
+            identifiable
+            for identifiable in identifiables
+            if isinstance(identifiable, aas_types.Submodel)
+        ],
+        concept_descriptions=[
+            identifiable
+            for identifiable in identifiables
+            if isinstance(identifiable, aas_types.ConceptDescription)
+        ],
+    )
+
+    for name in ("asset_administration_shells", "submodels", "concept_descriptions"):
+        if len(getattr(environment, name)) == 0:
+            setattr(environment, name, None)
+
+    return aas_xmlization.to_str(environment)
+
+
+class TestIterIdentifiablesFromStream(unittest.TestCase):
+    def test_same_as_environment_from_str(self) -> None:
+        for path in _paths("Expected"):
+            text = path.read_text(encoding="utf-8")
+
+            environment = aas_xmlization.environment_from_str(text)
+
+            self.assertEqual(
+                aas_xmlization.to_str(environment),
+                _to_environment(
+                    list(
+                        aas_xml_streaming.iter_identifiables_from_stream(
+                            io.StringIO(text)
+                        )
+                    )
+                ),
+                f"path is {path}",
+            )
+
+    def test_same_exceptions_as_environment_from_str(self) -> None:
+        for path in _paths("Unexpected", "Unserializable"):
+            text = path.read_text(encoding="utf-8")
+
+            with self.assertRaises(aas_xmlization.DeserializationException) as ctx:
+                aas_xmlization.environment_from_str(text)
+            expected = ctx.exception
+
+            with self.assertRaises(aas_xmlization.DeserializationException) as ctx:
+                list(
+                    aas_xml_streaming.iter_identifiables_from_stream(io.StringIO(text))
+                )
+            got = ctx.exception
+
+            self.assertEqual(
+                f"{expected.path}: {expected.cause}",
+                f"{got.path}: {got.cause}",
+                f"path is {path}",
+            )
+
+    def test_identifiables_in_order(self) -> None:
+        text = (
+            f"<environment xmlns={aas_xmlization.NAMESPACE!r}>"
+            "<submodels>"
+            "<submodel><id>urn:first</id></submodel>"
+            "<submodel><id>urn:second</id></submodel>"
+            "</submodels>"
+            "<conceptDescriptions>"
+            "<conceptDescription><id>urn:concept</id></conceptDescription>"
+            "</conceptDescriptions>"
+            "</environment>"
+        )
+
+        self.assertListEqual(
+            ["urn:first", "urn:second", "urn:concept"],
+            [
+                identifiable.id
+                for identifiable in aas_xml_streaming.iter_identifiables_from_stream(
+                    io.StringIO(text)
+                )
+            ],
+        )
+
+
+class TestEnvironmentWriter(unittest.TestCase):
+    def test_same_as_write(self) -> None:
+        for path in _paths("Expected"):
+            environment = aas_xmlization.environment_from_str(
+                path.read_text(encoding="utf-8")
+            )
+
+            writer = io.StringIO()
+            with aas_xml_streaming.EnvironmentWriter(writer) as environment_writer:
+                for identifiable in environment.descend_once():
+                    assert isinstance(identifiable, aas_types.Identifiable)
+                    environment_writer.write(identifiable)
+
+            self.assertEqual(
+                aas_xmlization.to_str(environment),
+                writer.getvalue(),
+                f"path is {path}",
+            )
+
+    def test_empty(self) -> None:
+        writer = io.StringIO()
+        with aas_xml_streaming.EnvironmentWriter(writer):
+            pass
+
+        self.assertEqual(
+            aas_xmlization.to_str(aas_types.Environment()), writer.getvalue()
+        )
+
+    def test_out_of_order_fails(self) -> None:
+        environment_writer = aas_xml_streaming.EnvironmentWriter(io.StringIO())
+        environment_writer.write(aas_types.ConceptDescription(id="urn:concept"))
+
+        with self.assertRaises(ValueError):
+            environment_writer.write(aas_types.Submodel(id="urn:submodel"))
+
+    def test_write_after_close_fails(self) -> None:
+        environment_writer = aas_xml_streaming.EnvironmentWriter(io.StringIO())
+        environment_writer.close()
+
+        with self.assertRaises(ValueError):
+            environment_writer.write(aas_types.Submodel(id="urn:submodel"))
+
+    def test_not_completed_on_exception(self) -> None:
+        writer = io.StringIO()
+
+        with self.assertRaises(RuntimeError):
+            with aas_xml_streaming.EnvironmentWriter(writer) as environment_writer:
+                environment_writer.write(aas_types.Submodel(id="urn:submodel"))
+                raise RuntimeError("Something went wrong")
+
+        self.assertFalse(writer.getvalue().endswith("</environment>"))
+
+
+if __name__ == "__main__":
+    unittest.main()
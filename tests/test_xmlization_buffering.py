@@ -0,0 +1,97 @@
+"""Test the buffering and the escaping of the XML serialization."""
+
+# pylint: disable=missing-docstring
+
+import io
+import unittest
+from typing import List
+
+import aas_core3.types as aas_types
+import aas_core3.xmlization as aas_xmlization
+
+import tests.common
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.write_count = 0
+
+    def write(self, s: str) -> int:
+        self.write_count += 1
+        return super().write(s)
+
+
+def _load_environment() -> aas_types.Environment:
+    paths = sorted(
+        (
+            tests.common.TEST_DATA_DIR / "Xml" / "ContainedInEnvironment" / "Expected"
+        ).glob("**/*.xml")
+    )
+    assert len(paths) > 0
+
+    submodels = []  # type: List[aas_types.Submodel]
+    for path in paths:
+        environment = aas_xmlization.environment_from_file(path)
+        submodels.extend(environment.over_submodels_or_empty())
+
+    return aas_types.Environment(submodels=submodels)
+
+
+class TestBuffering(unittest.TestCase):
+    def test_invalid_flush_threshold(self) -> None:
+        with self.assertRaises(ValueError):
+            aas_xmlization.write(aas_types.Environment(), io.StringIO(), 0)
+
+    def test_output_independent_of_flush_threshold(self) -> None:
+        environment = _load_environment()
+
+        expected_stream = _CountingStream()
+        aas_xmlization.write(environment, expected_stream, flush_threshold=1)
+        expected = expected_stream.getvalue()
+
+        for flush_threshold in [2, 7, 4096]:
+            stream = _CountingStream()
+            aas_xmlization.write(environment, stream, flush_threshold=flush_threshold)
+
+            self.assertEqual(expected, stream.getvalue())
+            self.assertLess(stream.write_count, expected_stream.write_count)
+
+        self.assertEqual(expected, aas_xmlization.to_str(environment))
+        self.assertEqual(expected.encode("utf-8"), aas_xmlization.to_bytes(environment))
+
+    def test_empty_element(self) -> None:
+        stream = _CountingStream()
+        aas_xmlization.write(aas_types.Environment(), stream)
+
+        self.assertEqual(
+            f'<environment xmlns="{aas_xmlization.NAMESPACE}"/>', stream.getvalue()
+        )
+        self.assertEqual(1, stream.write_count)
+
+    def test_to_bytes_encodes_as_utf_8(self) -> None:
+        extension = aas_types.Extension(name="Größe", value="温度 & 湿度")
+
+        serialized = aas_xmlization.to_bytes(extension)
+
+        self.assertEqual(aas_xmlization.to_str(extension).encode("utf-8"), serialized)
+        self.assertEqual(
+            extension.value,
+            aas_xmlization.extension_from_str(serialized.decode("utf-8")).value,
+        )
+
+    def test_escaping(self) -> None:
+        for text in ["plain", "a < b", "a > b", "a & b", "<&>&&<<>>"]:
+            extension = aas_types.Extension(name=text, value=text)
+
+            serialized = aas_xmlization.to_str(extension)
+            if text != "plain":
+                self.assertNotIn(text, serialized)
+
+            deserialized = aas_xmlization.extension_from_str(serialized)
+            self.assertEqual(text, deserialized.name)
+            self.assertEqual(text, deserialized.value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+"""Test the de-serialization from XML with the lxml backend."""
+
+# pylint: disable=missing-docstring
+
+import io
+import pathlib
+import sys
+import tempfile
+import unittest
+import unittest.mock
+import xml.etree.ElementTree
+from typing import List, Tuple
+
+import aas_core3.types as aas_types
+import aas_core3.xml_streaming as aas_xml_streaming
+import aas_core3.xmlization as aas_xmlization
+
+import tests.common
+
+try:
+    import lxml.etree  # type: ignore
+
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+
+def _all_paths() -> List[pathlib.Path]:
+    paths = sorted((tests.common.TEST_DATA_DIR / "Xml").glob("**/*.xml"))
+    assert len(paths) > 0
+    return paths
+
+
+def _read(path: pathlib.Path, backend: str) -> Tuple[str, str]:
+    """Read the instance and render either it or the exception."""
+    try:
+        with path.open("rt", encoding="utf-8") as fid:
+            instance = aas_xmlization.from_stream(fid, backend=backend)
+    except aas_xmlization.DeserializationException as exception:
+        return "exception", f"{exception.path}: {exception.cause}"
+
+    return "instance", aas_xmlization.to_str(instance)
+
+
+class TestBackendArguments(unittest.TestCase):
+    def test_unexpected_backend(self) -> None:
+        with self.assertRaises(ValueError):
+            aas_xmlization.from_str("<environment/>", backend="unexpected")
+
+    def test_lxml_with_custom_iterparse(self) -> None:
+        class CustomIterparse:
+            iterparse = staticmethod(xml.etree.ElementTree.iterparse)
+
+        with self.assertRaises(ValueError):
+            aas_xmlization.from_str(
+                "<environment/>", has_iterparse=CustomIterparse(), backend="lxml"
+            )
+
+    def test_lxml_missing(self) -> None:
+        with unittest.mock.patch.dict(sys.modules, {"lxml": None, "lxml.etree": None}):
+            with self.assertRaises(ImportError):
+                aas_xmlization.from_str("<environment/>", backend="lxml")
+
+
+class TestMalformedXml(unittest.TestCase):
+    def test_both_backends_raise_deserialization_exception(self) -> None:
+        backends = ["stdlib", "lxml"] if _HAS_LXML else ["stdlib"]
+
+        for backend in backends:
+            for text in [
+                "<environment",
+                '<environment xmlns="https://admin-shell.io/aas/3/0"><submodels>',
+            ]:
+                with self.subTest(backend=backend, text=text):
+                    with self.assertRaises(
+                        aas_xmlization.DeserializationException
+                    ) as context:
+                        aas_xmlization.environment_from_str(text, backend=backend)
+
+                    self.assertIn("The XML is malformed", context.exception.cause)
+
+    def test_iter_identifiables_from_stream_with_stdlib(self) -> None:
+        with self.assertRaises(aas_xmlization.DeserializationException) as context:
+            list(
+                aas_xml_streaming.iter_identifiables_from_stream(
+                    io.StringIO(
+                        '<environment xmlns="https://admin-shell.io/aas/3/0">'
+                        "<submodels><submodel>"
+                    )
+                )
+            )
+
+        self.assertIn("The XML is malformed", context.exception.cause)
+
+
+@unittest.skipIf(not _HAS_LXML, "lxml is not installed")
+class TestLxmlBackend(unittest.TestCase):
+    def test_same_as_stdlib_on_test_data(self) -> None:
+        for path in _all_paths():
+            self.assertEqual(
+                _read(path, "stdlib"), _read(path, "lxml"), f"path is {path}"
+            )
+
+    def test_environment_from_file_and_str(self) -> None:
+        for path in sorted(
+            (
+                tests.common.TEST_DATA_DIR
+                / "Xml"
+                / "ContainedInEnvironment"
+                / "Expected"
+            ).glob("**/*.xml")
+        ):
+            expected = aas_xmlization.to_str(aas_xmlization.environment_from_file(path))
+
+            self.assertEqual(
+                expected,
+                aas_xmlization.to_str(
+                    aas_xmlization.environment_from_file(path, backend="lxml")
+                ),
+                f"path is {path}",
+            )
+
+            self.assertEqual(
+                expected,
+                aas_xmlization.to_str(
+                    aas_xmlization.environment_from_str(
+                        path.read_text(encoding="utf-8"), backend="lxml"
+                    )
+                ),
+                f"path is {path}",
+            )
+
+    def test_iter_identifiables_from_stream(self) -> None:
+        environment = aas_types.Environment(
+            submodels=[aas_types.Submodel(id=f"urn:submodel{i}") for i in range(10)]
+        )
+
+        identifiables = list(
+            aas_xml_streaming.iter_identifiables_from_stream(
+                io.StringIO(aas_xmlization.to_str(environment)), backend="lxml"
+            )
+        )
+
+        self.assertListEqual(
+            [f"urn:submodel{i}" for i in range(10)],
+            [identifiable.id for identifiable in identifiables],
+        )
+
+    def test_text_spanning_multiple_chunks(self) -> None:
+        environment = aas_types.Environment(
+            submodels=[
+                aas_types.Submodel(
+                    id="urn:submodel",
+                    submodel_elements=[
+                        aas_types.Blob(
+                            id_short="someBlob",
+                            content_type="application/octet-stream",
+                            value=bytes(range(256)) * 1024,
+                        )
+                    ],
+                )
+            ]
+        )
+
+        text = aas_xmlization.to_str(environment)
+        self.assertGreater(len(text), 2 * aas_xmlization._LXML_CHUNK_SIZE)
+
+        self.assertEqual(
+            text,
+            aas_xmlization.to_str(
+                aas_xmlization.environment_from_str(text, backend="lxml")
+            ),
+        )
+
+    def test_comments_and_processing_instructions_are_ignored(self) -> None:
+        text = (
+            '<environment xmlns="https://admin-shell.io/aas/3/0"><submodels>'
+            "<submodel><id>urn:<!-- some comment -->some<?some pi?>thing</id>"
+            "</submodel></submodels></environment>"
+        )
+
+        self.assertEqual(
+            aas_xmlization.to_str(aas_xmlization.environment_from_str(text)),
+            aas_xmlization.to_str(
+                aas_xmlization.environment_from_str(text, backend="lxml")
+            ),
+        )
+
+    def test_external_entities_are_not_resolved(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            secret_path = pathlib.Path(tmp_dir) / "secret.txt"
+            secret_path.write_text("secret", encoding="utf-8")
+
+            text = (
+                f'<!DOCTYPE environment [<!ENTITY external SYSTEM "{secret_path.as_uri()}">]>'
+                '<environment xmlns="https://admin-shell.io/aas/3/0"><submodels>'
+                "<submodel><id>urn:&external;</id></submodel>"
+                "</submodels></environment>"
+            )
+
+            try:
+                environment = aas_xmlization.environment_from_str(text, backend="lxml")
+            except aas_xmlization.DeserializationException:
+                return
+
+        assert environment.submodels is not None
+        self.assertNotIn("secret", environment.submodels[0].id)
+
+    def test_previous_siblings_are_freed(self) -> None:
+        environment = aas_types.Environment(
+            submodels=[aas_types.Submodel(id=f"urn:submodel{i}") for i in range(10000)]
+        )
+
+        iterator = aas_xmlization._with_lxml_elements_freed_after_yield(
+            io.StringIO(aas_xmlization.to_str(environment)), lxml.etree
+        )
+
+        max_children = 0
+        for _, element in iterator:
+            parent = element.getparent()  # type: ignore
+            if parent is not None:
+                max_children = max(max_children, len(parent))
+
+        # The parser runs ahead by a chunk, so the parent still holds the siblings
+        # which have been parsed, but not yet processed.
+        self.assertLess(max_children, 10000 // 4)
+
+
+if __name__ == "__main__":
+    unittest.main()